@@ -1,8 +1,16 @@
 from .node import AppNode
 from .store import AppStore
+from .engines import (
+    ArrayAppStore, CachedAppStore, IterativeAppStore, get_engine, register_engine,
+)
 
 
 __all__ = [
     "AppNode",
     "AppStore",
+    "ArrayAppStore",
+    "CachedAppStore",
+    "IterativeAppStore",
+    "get_engine",
+    "register_engine",
 ]
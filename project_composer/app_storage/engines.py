@@ -0,0 +1,515 @@
+"""
+Resolver engines are alternative implementations of ``AppStore`` with different
+trade-offs. They all share the same interface and return the same ``AppNode`` objects
+in the same order than the reference ``AppStore``, only their internal strategy
+differs.
+
+Available engines are registered with a name so they can be selected from the
+manifest, the command line or the ``Composer`` constructor:
+
+reference
+    The original ``AppStore`` with its recursive resolver.
+iterative
+    Uses a name index and iterative walks so it runs in linear time and does not have
+    any limit on the dependency depth.
+array
+    Like the iterative one but resolving is performed on integer indexes and flat
+    arrays instead of ``AppNode`` objects.
+cached
+    Like the iterative one but the resolved results are kept in a bounded memory
+    cache and shared between every store which resolve the same collection with the
+    same options. Each store gets its own copy of cached ``AppNode`` objects.
+"""
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+
+from ..exceptions import ComposerAppStoreError
+
+from .node import AppNode
+from .store import AppStore
+
+
+class IterativeAppStore(AppStore):
+    """
+    Store which resolves with iterative walks and a name index.
+
+    The reference store searches applications with a list scan and resolves
+    dependencies with recursive calls, it is quadratic on processing and limited by
+    the Python recursion limit on deep dependency chains. This one uses a dictionnary
+    index for application names and explicit stacks, its results are identical.
+    """
+    def __init__(self, default_app=None):
+        super().__init__(default_app=default_app)
+        self._index = {}
+
+    def get_app(self, name, default=None):
+        """
+        Get an app object from processed app index.
+
+        Arguments:
+            name (string): The name to get from processed applications.
+
+        Keyword Arguments:
+            default (object): Default value to use when given name is not retrieved
+                from processed applications.
+
+        Returns:
+            AppNode: Application object.
+        """
+        return self._index.get(name, default)
+
+    def process_collection(self, collection):
+        """
+        Correctly store a collection of apps.
+
+        Index is built again from processed applications so it stays right even if
+        ``processed_apps`` has been changed from outside.
+
+        Arguments:
+            collection (list): List of application datas.
+        """
+        self._index = {app.name: app for app in self.processed_apps}
+        start = len(self.processed_apps)
+
+        for item in collection:
+            if item.get("name") in self._index:
+                msg = (
+                    "Application '{}' have multiple references in collection."
+                )
+                raise ComposerAppStoreError(msg.format(item.get("name")))
+
+            node = AppNode(
+                item.get("name"),
+                push_end=item.get("push_end", False),
+            )
+
+            for name in item.get("dependencies", []):
+                node.add_dependency_name(name)
+
+            # Append the default dependency when app does not have any
+            if (
+                self.default_app and
+                len(node.dependency_names) == 0 and
+                self.default_app != node.name and
+                self.default_app not in node.dependency_names
+            ):
+                node.add_dependency_name(self.default_app)
+
+            self.processed_apps.append(node)
+            self._index[node.name] = node
+
+        # Previously processed applications are already linked
+        for app in self.processed_apps[start:]:
+            for name in app.dependency_names:
+                node = self._index.get(name)
+
+                if node:
+                    app.add_dependency(node)
+                else:
+                    msg = (
+                        "Dependency '{dep}' from application '{app}' is not a "
+                        "registered application."
+                    )
+                    raise ComposerAppStoreError(msg.format(dep=name, app=app))
+
+    def resolve_dependencies(self):
+        """
+        Order processed applications so each one is after all its dependencies.
+
+        This is a depth first walk with an explicit stack, it follows the exact same
+        order than the recursive ``AppStore.dependency_resolver()``.
+
+        Returns:
+            list: List of resolved AppNode objects.
+        """
+        resolved = []
+        done = set([])
+        pending = set([])
+
+        for root in self.processed_apps:
+            if root.name in done:
+                continue
+
+            # Each work item is a node with the iterator over its dependencies, so the
+            # walk can be resumed after a dependency has been resolved
+            pending.add(root.name)
+            work = [(root, iter(root.dependencies))]
+
+            while work:
+                node, dependencies = work[-1]
+
+                for dependency in dependencies:
+                    if dependency.name in done:
+                        continue
+
+                    if dependency.name in pending:
+                        msg = "Circular reference detected: {source} -> {to}"
+                        raise ComposerAppStoreError(
+                            msg.format(source=node.name, to=dependency.name)
+                        )
+
+                    pending.add(dependency.name)
+                    work.append((dependency, iter(dependency.dependencies)))
+                    break
+                else:
+                    work.pop()
+                    pending.discard(node.name)
+                    done.add(node.name)
+                    resolved.append(node)
+
+        return resolved
+
+    def apply_inheritance(self, resolved):
+        """
+        Apply dependencies parameters inheritance on resolved applications.
+
+        Since dependencies are always before their dependents in resolved list, a
+        single pass is enough to propagate ``push_end`` through the whole dependency
+        tree.
+
+        Arguments:
+            resolved (list): List of resolved AppNode objects.
+        """
+        for app in resolved:
+            if any([item.push_end for item in app.dependencies]):
+                app.push_end = True
+
+
+class ArrayAppStore(IterativeAppStore):
+    """
+    Store which resolves on integer indexes.
+
+    Processed applications are translated to flat lists of dependency indexes and
+    walk states are stored in byte arrays, ``AppNode`` objects are only involved to
+    build the final list.
+    """
+    def get_edges(self):
+        """
+        Translate processed application dependencies to indexes.
+
+        Returns:
+            list: For each processed application, the list of its dependency indexes
+            from processed applications.
+        """
+        position = {app.name: i for i, app in enumerate(self.processed_apps)}
+
+        return [
+            [position[dependency.name] for dependency in app.dependencies]
+            for app in self.processed_apps
+        ]
+
+    def resolve_dependencies(self):
+        """
+        Order processed applications so each one is after all its dependencies.
+
+        Returns:
+            list: List of resolved AppNode objects.
+        """
+        edges = self.get_edges()
+        # Walk state for each application: 0 is new, 1 is pending and 2 is resolved
+        states = bytearray(len(edges))
+        order = []
+
+        for root in range(len(edges)):
+            if states[root]:
+                continue
+
+            states[root] = 1
+            work = [[root, 0]]
+
+            while work:
+                item = work[-1]
+                node = item[0]
+                dependencies = edges[node]
+
+                # Skip already resolved dependencies
+                while (
+                    item[1] < len(dependencies) and
+                    states[dependencies[item[1]]] == 2
+                ):
+                    item[1] += 1
+
+                if item[1] < len(dependencies):
+                    dependency = dependencies[item[1]]
+                    if states[dependency] == 1:
+                        msg = "Circular reference detected: {source} -> {to}"
+                        raise ComposerAppStoreError(msg.format(
+                            source=self.processed_apps[node].name,
+                            to=self.processed_apps[dependency].name,
+                        ))
+
+                    item[1] += 1
+                    states[dependency] = 1
+                    work.append([dependency, 0])
+                else:
+                    work.pop()
+                    states[node] = 2
+                    order.append(node)
+
+        return [self.processed_apps[i] for i in order]
+
+    def apply_inheritance(self, resolved):
+        """
+        Apply dependencies parameters inheritance on resolved applications.
+
+        Arguments:
+            resolved (list): List of resolved AppNode objects.
+        """
+        position = {app.name: i for i, app in enumerate(self.processed_apps)}
+        edges = self.get_edges()
+        pushed = bytearray([bool(app.push_end) for app in self.processed_apps])
+
+        for app in resolved:
+            index = position[app.name]
+            if not pushed[index] and any([pushed[i] for i in edges[index]]):
+                pushed[index] = 1
+                app.push_end = True
+
+
+class CachedAppStore(IterativeAppStore):
+    """
+    Store which keeps resolved results in a bounded memory cache.
+
+    Results are shared by every instance of this class and indexed on a canonical hash
+    of the collection payloads with the ``default_app`` and ``no_ordering`` options, so
+    resolving the same collection again just returns the previous result. Once the
+    cache is full, the least recently used result is dropped. Errors are not cached.
+
+    A cached result is never returned itself, each resolving gets a copy of its
+    ``AppNode`` objects so they can be modified without altering the cache or the
+    results from other stores. Processed applications are replaced on each resolving.
+
+    Attributes:
+        CACHE_SIZE (integer): Maximum number of cached results. ``None`` means the
+            cache is unbounded and ``0`` disables the cache.
+        _CACHE (collections.OrderedDict): Cached results indexed on their key from
+            the least to the most recently used, each result is a tuple of processed
+            applications and resolved applications.
+        _STATS (dict): Cache hits and misses counters.
+        _LOCK (threading.Lock): Lock used to access cache and its counters.
+    """
+    INCREMENTAL = False
+    THREAD_SAFE = True
+    SNAPSHOT = False
+
+    CACHE_SIZE = 128
+
+    _CACHE = OrderedDict()
+    _STATS = {"hits": 0, "misses": 0}
+    _LOCK = threading.Lock()
+
+    @classmethod
+    def clear_cache(cls):
+        """
+        Remove every cached results and reset counters.
+        """
+        with cls._LOCK:
+            cls._CACHE.clear()
+            cls._STATS.update({"hits": 0, "misses": 0})
+
+    @classmethod
+    def set_cache_size(cls, size):
+        """
+        Change the maximum number of cached results.
+
+        Least recently used results are dropped if there is more cached results than
+        the new size.
+
+        Arguments:
+            size (integer): Maximum number of cached results, ``None`` for an
+                unbounded cache and ``0`` to disable it.
+        """
+        with cls._LOCK:
+            cls.CACHE_SIZE = size
+            cls._evict()
+
+    @classmethod
+    def cache_info(cls):
+        """
+        Return cache statistics, commonly used to tune the cache size.
+
+        Returns:
+            dict: Statistics with items ``hits``, ``misses``, ``size`` (number of
+            cached results) and ``maxsize``.
+        """
+        with cls._LOCK:
+            return {
+                "hits": cls._STATS["hits"],
+                "misses": cls._STATS["misses"],
+                "size": len(cls._CACHE),
+                "maxsize": cls.CACHE_SIZE,
+            }
+
+    @classmethod
+    def _evict(cls):
+        """
+        Drop least recently used results until the cache fits in its size.
+
+        This must be called with the lock acquired.
+        """
+        if cls.CACHE_SIZE is not None:
+            while len(cls._CACHE) > cls.CACHE_SIZE:
+                cls._CACHE.popitem(last=False)
+
+    def get_cache_key(self, collection, no_ordering=False):
+        """
+        Build the cache key for a collection.
+
+        Payloads are serialized to JSON with sorted keys and without any whitespace so
+        the key only depends on their content, then it is hashed to keep the cache
+        index small.
+
+        Arguments:
+            collection (list): List of application payloads.
+
+        Keyword Arguments:
+            no_ordering (boolean): Resolving ``no_ordering`` option.
+
+        Returns:
+            string: Cache key.
+        """
+        canonical = json.dumps(
+            [collection, self.default_app, no_ordering],
+            sort_keys=True,
+            separators=(",", ":"),
+            default=str,
+        )
+
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def copy_nodes(self, processed, resolved):
+        """
+        Copy cached application nodes with their dependencies linked to the copies.
+
+        Arguments:
+            processed (tuple): Cached processed applications.
+            resolved (tuple): Cached resolved applications, they are processed
+                applications.
+
+        Returns:
+            tuple: Lists of copied processed applications and copied resolved
+            applications.
+        """
+        copies = {}
+        for app in processed:
+            node = AppNode(app.name, push_end=app.push_end)
+            node.dependency_names = list(app.dependency_names)
+            copies[app.name] = node
+
+        for app in processed:
+            copies[app.name].dependencies = [
+                copies[item.name] for item in app.dependencies
+            ]
+
+        return (
+            [copies[app.name] for app in processed],
+            [copies[app.name] for app in resolved],
+        )
+
+    def resolve(self, collection, flat=False, no_ordering=False):
+        """
+        Resolve app list from cache or with an iterative store if not cached yet.
+
+        Arguments:
+            collection (list): List of application payloads to work on.
+
+        Keyword Arguments:
+            flat (boolean): If True, returned list will be AppNode payload. Default to
+                False.
+            no_ordering (boolean): If ``True`` there won't be any resolution. Default
+                is ``False``.
+
+        Returns:
+            list: List of AppNode object or payload (dict) respectively depending flat
+            mode is False or True.
+        """
+        key = self.get_cache_key(collection, no_ordering=no_ordering)
+        klass = type(self)
+
+        with klass._LOCK:
+            cached = klass._CACHE.get(key)
+            if cached is None:
+                klass._STATS["misses"] += 1
+            else:
+                klass._STATS["hits"] += 1
+                klass._CACHE.move_to_end(key)
+
+        if cached is None:
+            # Resolve with a new store so this instance is never left in a partial
+            # state and can be used from multiple threads
+            store = IterativeAppStore(default_app=self.default_app)
+            resolved = store.resolve(collection, no_ordering=no_ordering)
+            cached = (tuple(store.processed_apps), tuple(resolved))
+
+            with klass._LOCK:
+                if klass.CACHE_SIZE != 0:
+                    # Another thread may have resolved the same collection meanwhile
+                    cached = klass._CACHE.setdefault(key, cached)
+                    klass._CACHE.move_to_end(key)
+                    klass._evict()
+
+        processed, resolved = self.copy_nodes(*cached)
+        self.processed_apps = processed
+        self._index = {app.name: app for app in processed}
+
+        if flat:
+            return [item.name for item in resolved]
+
+        return resolved
+
+
+ENGINES = {
+    "reference": AppStore,
+    "iterative": IterativeAppStore,
+    "array": ArrayAppStore,
+    "cached": CachedAppStore,
+}
+"""
+Registered resolver engines indexed on their name.
+"""
+
+DEFAULT_ENGINE = "reference"
+"""
+Name of engine used when none is given.
+"""
+
+
+def register_engine(name, engine):
+    """
+    Register a resolver engine.
+
+    Arguments:
+        name (string): Engine name.
+        engine (class): Engine class, it must accept the ``default_app`` keyword
+            argument and implement the ``AppStore`` interface, commonly it just
+            inherits from ``AppStore``.
+    """
+    if name in ENGINES:
+        msg = "A resolver engine is already registered with name '{}'."
+        raise ComposerAppStoreError(msg.format(name))
+
+    ENGINES[name] = engine
+
+
+def get_engine(name=None):
+    """
+    Get a resolver engine class.
+
+    Keyword Arguments:
+        name (string): Engine name. Default to ``DEFAULT_ENGINE`` if empty.
+
+    Returns:
+        class: Engine class.
+    """
+    name = name or DEFAULT_ENGINE
+
+    if name not in ENGINES:
+        msg = "Unknown resolver engine '{name}', available ones are: {available}"
+        raise ComposerAppStoreError(msg.format(
+            name=name,
+            available=", ".join(ENGINES.keys()),
+        ))
+
+    return ENGINES[name]
@@ -50,15 +50,41 @@ class AppStore:
             collection. By default no default dependency is applied.
 
     Attributes:
+        INCREMENTAL (boolean): Capability flag, True when processed applications are
+            kept between calls of ``AppStore.resolve()`` so a store can be extended
+            with further collections.
+        THREAD_SAFE (boolean): Capability flag, True when a single store instance can
+            resolve collections from concurrent threads.
+        SNAPSHOT (boolean): Capability flag, True when resolved ``AppNode`` objects
+            are shared snapshots which may be returned again by other resolving, so
+            they must not be modified.
         default_app (string): The value of ``default_app`` argument.
         processed_apps (list): Internal list of processed applications (translated to
             AppNode) filled by ``AppStore.process_collection()``.
 
     """
+    INCREMENTAL = True
+    THREAD_SAFE = False
+    SNAPSHOT = False
+
     def __init__(self, default_app=None):
         self.default_app = default_app
         self.processed_apps = []
 
+    @classmethod
+    def get_capabilities(cls):
+        """
+        Return the store capability flags.
+
+        Returns:
+            dict: Capability flag values indexed on their lowercase name.
+        """
+        return {
+            "incremental": cls.INCREMENTAL,
+            "thread_safe": cls.THREAD_SAFE,
+            "snapshot": cls.SNAPSHOT,
+        }
+
     def get_app(self, name, default=None):
         """
         Get an app object from processed app list.
@@ -137,6 +163,160 @@ class AppStore:
                     )
                     raise ComposerAppStoreError(msg.format(dep=name, app=app))
 
+    def get_dependents(self, names):
+        """
+        Get all applications which depend directly or indirectly from given
+        applications.
+
+        This walks the reversed dependency graph from processed applications, so
+        ``AppStore.process_collection()`` must have been called before.
+
+        Arguments:
+            names (list): List of application names to start from.
+
+        Returns:
+            set: Names of given applications and every application which depends on
+            them through transitive dependencies. Unknown names are ignored.
+        """
+        # Build the reversed dependency graph, each app name is mapped to the names of
+        # applications that directly depend on it
+        dependents = {app.name: [] for app in self.processed_apps}
+        for app in self.processed_apps:
+            for name in app.dependency_names:
+                if name in dependents:
+                    dependents[name].append(app.name)
+
+        affected = set([])
+        stack = [name for name in names if name in dependents]
+
+        # Iterative walk so very deep dependency chains can not hit recursion limit
+        while stack:
+            name = stack.pop()
+            if name in affected:
+                continue
+
+            affected.add(name)
+            stack.extend(dependents[name])
+
+        return affected
+
+    def find_cycles(self):
+        """
+        Find every group of applications involved in circular references.
+
+        This is an iterative implementation of the Tarjan's strongly connected
+        components algorithm, it runs in linear time over the dependency graph and
+        finds all cycle groups in a single pass. ``AppStore.process_collection()``
+        must have been called before.
+
+        Returns:
+            list: A list of cycle groups in order of their first member from the
+            collection. Each group is a tuple of the member application names (in
+            collection order) and a list of edges (tuples of application name and its
+            dependency name) involved between these members.
+        """
+        position = {app.name: i for i, app in enumerate(self.processed_apps)}
+        index = {}
+        lowlink = {}
+        stack = []
+        on_stack = set([])
+        components = []
+        counter = 0
+
+        for root in self.processed_apps:
+            if root.name in index:
+                continue
+
+            # Each work item is a node with the iterator over its dependencies, so the
+            # walk can be resumed after a dependency has been visited
+            work = [(root, iter(root.dependencies))]
+            index[root.name] = lowlink[root.name] = counter
+            counter += 1
+            stack.append(root)
+            on_stack.add(root.name)
+
+            while work:
+                node, dependencies = work[-1]
+
+                for dependency in dependencies:
+                    if dependency.name not in index:
+                        index[dependency.name] = lowlink[dependency.name] = counter
+                        counter += 1
+                        stack.append(dependency)
+                        on_stack.add(dependency.name)
+                        work.append((dependency, iter(dependency.dependencies)))
+                        break
+                    elif dependency.name in on_stack:
+                        lowlink[node.name] = min(
+                            lowlink[node.name],
+                            index[dependency.name]
+                        )
+                else:
+                    # Every dependency has been visited, node is done
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        lowlink[parent.name] = min(
+                            lowlink[parent.name],
+                            lowlink[node.name]
+                        )
+
+                    # Node is the root of a component, pop all of its members
+                    if lowlink[node.name] == index[node.name]:
+                        members = []
+                        while True:
+                            member = stack.pop()
+                            on_stack.discard(member.name)
+                            members.append(member)
+                            if member is node:
+                                break
+
+                        components.append(members)
+
+        cycles = []
+        for members in components:
+            names = set([item.name for item in members])
+            members = sorted(members, key=lambda item: position[item.name])
+
+            edges = [
+                (member.name, dependency.name)
+                for member in members
+                for dependency in member.dependencies
+                if dependency.name in names
+            ]
+
+            # A single member is only a cycle when it depends on itself
+            if len(members) > 1 or edges:
+                cycles.append(([item.name for item in members], edges))
+
+        return sorted(cycles, key=lambda item: position[item[0][0]])
+
+    def validate_cycles(self):
+        """
+        Validate processed applications do not have any circular reference.
+
+        All circular references are reported at once.
+
+        Raises:
+            ComposerAppStoreError: If there is at least one cycle group.
+        """
+        cycles = self.find_cycles()
+
+        if cycles:
+            msg = "Circular references detected in {count} group(s): {groups}"
+            raise ComposerAppStoreError(msg.format(
+                count=len(cycles),
+                groups="; ".join([
+                    "[{members}] ({edges})".format(
+                        members=", ".join(members),
+                        edges=", ".join([
+                            "{} -> {}".format(*edge) for edge in edges
+                        ]),
+                    )
+                    for members, edges in cycles
+                ]),
+            ))
+
     def _apply_recursing_inheritance(self, app):
         """
         Apply dependencies 'push_end' inheritage.
@@ -188,6 +368,56 @@ class AppStore:
         resolved.append(node)
         unresolved.remove(node)
 
+    def resolve_dependencies(self):
+        """
+        Order processed applications so each one is after all its dependencies.
+
+        Returns:
+            list: List of resolved AppNode objects.
+        """
+        resolved = []
+
+        for node in self.processed_apps:
+            if node.name not in [r.name for r in resolved]:
+                self.dependency_resolver(node, resolved, [])
+
+        return resolved
+
+    def apply_inheritance(self, resolved):
+        """
+        Apply dependencies parameters inheritance on resolved applications.
+
+        Arguments:
+            resolved (list): List of resolved AppNode objects.
+        """
+        for app in resolved:
+            self._apply_recursing_inheritance(app)
+
+    def push_end_ordering(self, resolved):
+        """
+        Move applications with ``push_end`` mode after the other ones.
+
+        Consume resolved list to distinct apps with push_end=False from those with
+        push=True, built two distinct lists that are then joined (False first, True
+        last).
+
+        Arguments:
+            resolved (list): List of resolved AppNode objects with inheritance already
+                applied.
+
+        Returns:
+            list: Reordered list of AppNode objects.
+        """
+        return [
+            item
+            for item in resolved
+            if item.push_end is False
+        ] + [
+            item
+            for item in resolved
+            if item.push_end is True
+        ]
+
     def resolve(self, collection, flat=False, no_ordering=False):
         """
         Resolve app list in order of app dependencies such as an app is always after
@@ -207,8 +437,6 @@ class AppStore:
             list: List of AppNode object or payload (dict) respectively depending flat
             mode is False or True.
         """
-        resolved = []
-
         # Process given application collection to translate them to AppNode with their
         # right parameters
         self.process_collection(collection)
@@ -219,29 +447,103 @@ class AppStore:
             ordered_resolve = self.processed_apps
         # Proceed to the last resolving actions
         else:
+            # Report every circular references at once before resolving
+            self.validate_cycles()
+
             # Go recursively resolve apps order with implied order by dependency
-            for node in self.processed_apps:
-                if node.name not in [r.name for r in resolved]:
-                    self.dependency_resolver(node, resolved, [])
+            resolved = self.resolve_dependencies()
 
             # Apply possible dependencies parameters inheritance
-            for app in resolved:
-                self._apply_recursing_inheritance(app)
-
-            # Consume resolved list to distinct apps with push_end=False from those
-            # with push=True, built two distinct lists that are then joined (False
-            # first, True last).
-            ordered_resolve = [
-                item
-                for item in resolved
-                if item.push_end is False
-            ] + [
-                item
-                for item in resolved
-                if item.push_end is True
-            ]
+            self.apply_inheritance(resolved)
+
+            ordered_resolve = self.push_end_ordering(resolved)
 
         if flat:
             return [item.name for item in ordered_resolve]
         else:
             return ordered_resolve
+
+    def get_levels(self, apps, flat=False):
+        """
+        Group resolved applications into dependency levels.
+
+        Every application of a level only depends on applications from previous
+        levels, so applications of the same level are independent from each other and
+        can be processed concurrently. Applications in ``push_end`` mode are always
+        in levels after the ones without it.
+
+        Arguments:
+            apps (list): List of resolved ``AppNode`` objects, commonly returned by
+                ``AppStore.resolve()``. The list must be in a resolved order where
+                dependencies are always before their dependents.
+
+        Keyword Arguments:
+            flat (boolean): If True, levels will contain application names instead of
+                AppNode objects. Default to False.
+
+        Returns:
+            list: List of levels, each level is a list of AppNode objects (or names in
+            flat mode) in their resolved order.
+        """
+        levels = []
+
+        # Levels for applications in push_end mode starts after the last level of
+        # applications without it
+        for partition in (False, True):
+            offset = len(levels)
+            depths = {}
+
+            for app in apps:
+                if app.push_end is not partition:
+                    continue
+
+                depth = 0
+                for dependency in app.dependencies:
+                    # Dependency from the previous partition is always in a previous
+                    # level
+                    if partition and not dependency.push_end:
+                        continue
+
+                    # Dependency from the next partition or not met yet would be in a
+                    # later level
+                    if dependency.push_end is not partition or (
+                        dependency.name not in depths
+                    ):
+                        msg = (
+                            "Application '{app}' is before its dependency '{dep}', "
+                            "levels can only be computed from resolved applications."
+                        )
+                        raise ComposerAppStoreError(msg.format(
+                            app=app.name,
+                            dep=dependency.name,
+                        ))
+
+                    depth = max(depth, depths[dependency.name] + 1)
+
+                depths[app.name] = depth
+
+                if offset + depth == len(levels):
+                    levels.append([])
+
+                levels[offset + depth].append(app.name if flat else app)
+
+        return levels
+
+    def resolve_levels(self, collection, flat=False):
+        """
+        Resolve app list and group it into dependency levels.
+
+        This is a shortcut to ``AppStore.resolve()`` then ``AppStore.get_levels()``.
+
+        Arguments:
+            collection (list): List of application payloads to work on.
+
+        Keyword Arguments:
+            flat (boolean): If True, levels will contain application names instead of
+                AppNode objects. Default to False.
+
+        Returns:
+            list: List of levels, each level is a list of AppNode objects (or names in
+            flat mode).
+        """
+        return self.get_levels(self.resolve(collection), flat=flat)
@@ -0,0 +1,449 @@
+"""
+Application repository packed into a zip archive.
+
+The archive is opened once and its central directory is indexed in memory, then module
+lookups, module loading and content file reads are all served from this single file
+handle without any filesystem call on the archive content.
+
+Paths of archive content are the archive path joined with the member path, like
+``/srv/repository.zip/apps/blog/__init__.py``, which is the same convention than the
+one from ``zipimport`` for module ``__file__``.
+
+Module bytecode can not be written inside archive, so it is cached in a
+``__pycache__/<archive name>/`` directory next to the archive file and validated
+against the archive member modification time and size. Bytecode files packed in
+archive are used first when they are valid.
+"""
+import importlib.abc
+import importlib.machinery
+import importlib.util
+import os
+import sys
+import threading
+import time
+import zipfile
+
+from .exceptions import ComposerError
+from .importer import clear_spec_cache
+
+
+class ArchiveRepository:
+    """
+    Read only access to a zip archive from an in-memory index.
+
+    Arguments:
+        path (string or pathlib.Path): Path to the zip archive file.
+
+    Attributes:
+        path (string): Real absolute path to the archive file.
+        bytecode_dir (string): Directory where module bytecode from archive is
+            cached.
+        files (dict): Archive ``zipfile.ZipInfo`` file members indexed on their member
+            name.
+        children (dict): Names of direct children indexed on their directory member
+            name, the archive root directory is an empty string.
+    """
+    def __init__(self, path):
+        self.path = os.path.realpath(path)
+        self.bytecode_dir = os.path.join(
+            os.path.dirname(self.path),
+            "__pycache__",
+            os.path.basename(self.path),
+        )
+
+        if not os.path.isfile(self.path) or not zipfile.is_zipfile(self.path):
+            msg = "Repository archive is not a valid zip file: {}"
+            raise ComposerError(msg.format(path))
+
+        self._zipfile = zipfile.ZipFile(self.path)
+        self._lock = threading.Lock()
+
+        self.files = {}
+        self.children = {"": set([])}
+
+        for info in self._zipfile.infolist():
+            member = info.filename.rstrip("/")
+            if not info.is_dir():
+                self.files[member] = info
+
+            # Register every parent directory, some archives do not have explicit
+            # directory members
+            parts = member.split("/")
+            for i in range(len(parts)):
+                parent = "/".join(parts[:i])
+                self.children.setdefault(parent, set([])).add(parts[i])
+
+            if info.is_dir():
+                self.children.setdefault(member, set([]))
+
+    def __repr__(self):
+        return "<{klass}: {path}>".format(
+            klass=self.__class__.__name__,
+            path=self.path,
+        )
+
+    def close(self):
+        """
+        Close archive file handle.
+        """
+        self._zipfile.close()
+
+    def get_member(self, path):
+        """
+        Get the member name for a path inside archive.
+
+        Arguments:
+            path (string or pathlib.Path): Absolute path.
+
+        Returns:
+            string: Member name, an empty string for the archive itself or ``None`` if
+            path is not inside archive.
+        """
+        path = os.fspath(path)
+
+        if path == self.path:
+            return ""
+
+        if not path.startswith(self.path + os.sep):
+            return None
+
+        return path[len(self.path) + 1:].replace(os.sep, "/")
+
+    def get_path(self, member):
+        """
+        Get the path for an archive member.
+
+        Arguments:
+            member (string): Member name.
+
+        Returns:
+            string: Absolute path.
+        """
+        if not member:
+            return self.path
+
+        return os.path.join(self.path, *member.split("/"))
+
+    def contains(self, path):
+        """
+        Check if a path is inside archive, it may not exist.
+
+        Arguments:
+            path (string or pathlib.Path): Absolute path.
+
+        Returns:
+            boolean: True if path is inside archive.
+        """
+        return self.get_member(path) is not None
+
+    def is_file(self, path):
+        """
+        Arguments:
+            path (string or pathlib.Path): Absolute path.
+
+        Returns:
+            boolean: True if path is a file from archive.
+        """
+        return self.get_member(path) in self.files
+
+    def is_dir(self, path):
+        """
+        Arguments:
+            path (string or pathlib.Path): Absolute path.
+
+        Returns:
+            boolean: True if path is a directory from archive.
+        """
+        return self.get_member(path) in self.children
+
+    def exists(self, path):
+        """
+        Arguments:
+            path (string or pathlib.Path): Absolute path.
+
+        Returns:
+            boolean: True if path is a file or a directory from archive.
+        """
+        return self.is_file(path) or self.is_dir(path)
+
+    def listdir(self, path):
+        """
+        List names from an archive directory.
+
+        Arguments:
+            path (string or pathlib.Path): Absolute path to a directory.
+
+        Returns:
+            list: Sorted names.
+        """
+        member = self.get_member(path)
+        if member not in self.children:
+            raise FileNotFoundError(os.fspath(path))
+
+        return sorted(self.children[member])
+
+    def read(self, path):
+        """
+        Read a file content from archive.
+
+        Arguments:
+            path (string or pathlib.Path): Absolute path to a file.
+
+        Returns:
+            bytes: File content.
+        """
+        member = self.get_member(path)
+        if member not in self.files:
+            raise FileNotFoundError(os.fspath(path))
+
+        with self._lock:
+            return self._zipfile.read(self.files[member])
+
+    def stat(self, path):
+        """
+        Get a file modification time and size from archive.
+
+        Arguments:
+            path (string or pathlib.Path): Absolute path to a file.
+
+        Returns:
+            dict: Items ``mtime`` as a timestamp and ``size`` in bytes.
+        """
+        member = self.get_member(path)
+        if member not in self.files:
+            raise FileNotFoundError(os.fspath(path))
+
+        info = self.files[member]
+
+        return {
+            "mtime": time.mktime(info.date_time + (0, 0, -1)),
+            "size": info.file_size,
+        }
+
+    def get_bytecode_path(self, path):
+        """
+        Get the path where a bytecode file from archive is cached.
+
+        Arguments:
+            path (string or pathlib.Path): Absolute path to a bytecode file inside
+                archive.
+
+        Returns:
+            string: Absolute path inside the bytecode cache directory.
+        """
+        return os.path.join(self.bytecode_dir, *self.get_member(path).split("/"))
+
+
+class ArchiveLoader(importlib.abc.SourceLoader):
+    """
+    Loader for a Python source module from an archive.
+
+    Arguments:
+        fullname (string): Module Python path.
+        path (string): Module file path inside archive.
+        archive (ArchiveRepository): Archive to read from.
+    """
+    def __init__(self, fullname, path, archive):
+        self.name = fullname
+        self.path = path
+        self.archive = archive
+
+    def get_filename(self, fullname=None):
+        return self.path
+
+    def get_data(self, path):
+        """
+        Read a file from archive, modules use it to load their source and it can be
+        used for content files from the module directory.
+
+        Arguments:
+            path (string): Absolute file path.
+
+        Returns:
+            bytes: File content.
+        """
+        if self.archive.contains(path):
+            is_bytecode = os.fspath(path).endswith(
+                tuple(importlib.machinery.BYTECODE_SUFFIXES)
+            )
+            if self.archive.is_file(path) or not is_bytecode:
+                return self.archive.read(path)
+
+            path = self.archive.get_bytecode_path(path)
+
+        with open(path, "rb") as fp:
+            return fp.read()
+
+    def path_stats(self, path):
+        """
+        Get module source modification time and size so its bytecode can be cached.
+
+        Arguments:
+            path (string): Absolute module file path.
+
+        Returns:
+            dict: Items ``mtime`` and ``size``.
+        """
+        return self.archive.stat(path)
+
+    def set_data(self, path, data):
+        """
+        Write module bytecode in the bytecode cache directory, a failure is ignored
+        like for modules from filesystem.
+
+        Arguments:
+            path (string): Absolute bytecode file path.
+            data (bytes): Bytecode content.
+        """
+        if self.archive.contains(path):
+            path = self.archive.get_bytecode_path(path)
+
+        tmp_path = "{}.{}".format(path, id(path))
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(tmp_path, "wb") as fp:
+                fp.write(data)
+            os.replace(tmp_path, path)
+        except OSError:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+
+class ArchiveFinder(importlib.abc.MetaPathFinder):
+    """
+    Finder for Python source modules and packages from an archive.
+
+    Top level modules are searched from archive root and submodules from their
+    parent package locations which are inside archive.
+
+    Arguments:
+        archive (ArchiveRepository): Archive to search in.
+
+    Keyword Arguments:
+        packages (list): Top level package names which are searched from archive,
+            other modules are left to the next finders so archive content can not
+            shadow the standard library or installed packages. On default every
+            module is searched from archive.
+    """
+    def __init__(self, archive, packages=None):
+        self.archive = archive
+        self.packages = set(packages) if packages is not None else None
+
+    def __repr__(self):
+        return "<{klass}: {path}>".format(
+            klass=self.__class__.__name__,
+            path=self.archive.path,
+        )
+
+    def invalidate_caches(self):
+        pass
+
+    def find_spec(self, fullname, path, target=None):
+        """
+        Find a module spec.
+
+        Arguments:
+            fullname (string): Module Python path.
+            path (list): Search locations from parent package.
+
+        Keyword Arguments:
+            target (object): Unused, it is only there for finder protocol.
+
+        Returns:
+            importlib.machinery.ModuleSpec: The module spec or ``None`` if module is
+            not in archive.
+        """
+        if (
+            self.packages is not None and
+            fullname.partition(".")[0] not in self.packages
+        ):
+            return None
+
+        name = fullname.rpartition(".")[2]
+
+        if path is None:
+            directories = [""]
+        else:
+            directories = [
+                member
+                for member in [self.archive.get_member(item) for item in path]
+                if member is not None
+            ]
+
+        for directory in directories:
+            base = "/".join([item for item in [directory, name] if item])
+
+            for member, is_package in [(base + "/__init__.py", True),
+                                       (base + ".py", False)]:
+                if member in self.archive.files:
+                    filepath = self.archive.get_path(member)
+                    return importlib.util.spec_from_file_location(
+                        fullname,
+                        filepath,
+                        loader=ArchiveLoader(fullname, filepath, self.archive),
+                        submodule_search_locations=(
+                            [os.path.dirname(filepath)] if is_package else None
+                        ),
+                    )
+
+        return None
+
+
+def install_archive(path, packages=None):
+    """
+    Install an archive finder at the start of ``sys.meta_path``.
+
+    A previously installed finder for the same archive is removed.
+
+    Arguments:
+        path (string or pathlib.Path): Path to the zip archive file.
+
+    Keyword Arguments:
+        packages (list): Top level package names to search from archive, see
+            ``ArchiveFinder``.
+
+    Returns:
+        ArchiveFinder: The installed finder.
+    """
+    archive = ArchiveRepository(path)
+
+    uninstall_archive(archive.path)
+
+    finder = ArchiveFinder(archive, packages=packages)
+    sys.meta_path.insert(0, finder)
+    # Specs from finders installed before are not valid anymore
+    clear_spec_cache()
+
+    return finder
+
+
+def uninstall_archive(path):
+    """
+    Remove installed finders for an archive from ``sys.meta_path``.
+
+    Archive handles are not closed since modules already imported from an archive may
+    still need it, like lazy modules which are not executed yet.
+
+    Arguments:
+        path (string or pathlib.Path): Path to the zip archive file.
+
+    Returns:
+        list: Removed finders.
+    """
+    path = os.path.realpath(path)
+
+    removed = [
+        finder
+        for finder in sys.meta_path
+        if isinstance(finder, ArchiveFinder) and finder.archive.path == path
+    ]
+
+    for finder in removed:
+        sys.meta_path.remove(finder)
+
+    if removed:
+        clear_spec_cache()
+
+    return removed
@@ -0,0 +1,12 @@
+from .base import BaseBenchmark
+from .importer import ImporterBenchmark
+from .resolver import ResolverBenchmark
+from .urls import UrlsBenchmark
+
+
+__all__ = [
+    "BaseBenchmark",
+    "ImporterBenchmark",
+    "ResolverBenchmark",
+    "UrlsBenchmark",
+]
@@ -0,0 +1,229 @@
+import json
+import multiprocessing
+import platform
+import queue
+import time
+import tracemalloc
+
+from ..exceptions import ComposerBenchmarkError
+
+
+def measure(func, *args, **kwargs):
+    """
+    Measure execution time and peak allocated memory of a callable.
+
+    Time and memory are measured from two distinct calls since ``tracemalloc`` has an
+    heavy overhead that would alter timing.
+
+    Arguments:
+        func (callable): Callable to measure.
+        *args: Positional arguments to give to callable.
+        **kwargs: Keyword arguments to give to callable.
+
+    Returns:
+        dict: Measures with items ``time`` (in seconds) and ``peak_memory`` (in
+        bytes).
+    """
+    start = time.perf_counter()
+    func(*args, **kwargs)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    try:
+        func(*args, **kwargs)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    return {"time": elapsed, "peak_memory": peak}
+
+
+def _case_worker(results, target, args):
+    """
+    Run a benchmark case in a child process and send back its result.
+
+    Arguments:
+        results (multiprocessing.Queue): Queue to send result to.
+        target (callable): Case callable, it must return a dictionnary of stage
+            measures.
+        args (list): Positional arguments for target.
+    """
+    try:
+        results.put({"status": "ok", "stages": target(*args)})
+    except BaseException as e:
+        results.put({
+            "status": "error",
+            "error": "{}: {}".format(type(e).__name__, e),
+        })
+
+
+class BaseBenchmark:
+    """
+    Benchmark abstract, it runs cases in isolated child processes with a time limit and
+    manages results as JSON baselines.
+
+    Each case is a callable executed in a child process, so a case going into a very
+    long execution or breaking the recursion limit does not break the benchmark run.
+
+    Keyword Arguments:
+        timeout (integer): Time limit in seconds for a single case.
+
+    Attributes:
+        STAGES (list): Names of stages measured by each case.
+    """
+    STAGES = []
+
+    def __init__(self, timeout=60):
+        self.timeout = timeout
+
+    def run_case(self, target, *args):
+        """
+        Run a case in a child process.
+
+        Arguments:
+            target (callable): Case callable to run. It must be picklable.
+            *args: Positional arguments for target.
+
+        Returns:
+            dict: Case result with a ``status`` item which is either ``ok``, ``error``
+            or ``timeout``. With ``ok`` status there is a ``stages`` item with
+            measures for each stage and with ``error`` status there is an ``error``
+            item with the error message.
+        """
+        context = multiprocessing.get_context()
+        results = context.Queue()
+        process = context.Process(target=_case_worker, args=(results, target, args))
+        process.start()
+
+        try:
+            result = results.get(timeout=self.timeout)
+        except queue.Empty:
+            process.terminate()
+            result = {"status": "timeout"}
+
+        process.join()
+
+        return result
+
+    def get_environment(self):
+        """
+        Returns:
+            dict: Informations about the environment where benchmark has been run.
+        """
+        return {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+        }
+
+    def dump(self, results, destination):
+        """
+        Write results to a JSON baseline file.
+
+        Arguments:
+            results (dict): Benchmark results.
+            destination (pathlib.Path): File path where to write.
+
+        Returns:
+            pathlib.Path: Destination where the file has been written.
+        """
+        destination.write_text(json.dumps(results, indent=4, sort_keys=True))
+
+        return destination
+
+    def load(self, source):
+        """
+        Load results from a JSON baseline file.
+
+        Arguments:
+            source (pathlib.Path): File path to read.
+
+        Returns:
+            dict: Benchmark results.
+        """
+        try:
+            return json.loads(source.read_text())
+        except json.JSONDecodeError as e:
+            msg = "Invalid benchmark baseline file '{path}': {error}"
+            raise ComposerBenchmarkError(msg.format(path=source, error=e))
+
+    def compare(self, baseline, results, tolerance=0.25, minimum=0.001):
+        """
+        Compare results to a baseline to find regressions.
+
+        A regression is a case which was successful in baseline and is not anymore or a
+        stage which has a time exceeding the baseline time with the tolerance ratio.
+
+        Arguments:
+            baseline (dict): Baseline results.
+            results (dict): Results to compare.
+
+        Keyword Arguments:
+            tolerance (float): Allowed ratio of time increase before marking it as a
+                regression. Default to ``0.25`` for 25%.
+            minimum (float): Minimal time difference in seconds to be a regression, it
+                avoids false positives from very short timings. Default to 1ms.
+
+        Returns:
+            list: Regression messages. Cases that are not in both results are ignored.
+        """
+        regressions = []
+
+        for name, reference in baseline.get("cases", {}).items():
+            current = results.get("cases", {}).get(name)
+            if current is None or reference["status"] != "ok":
+                continue
+
+            if current["status"] != "ok":
+                regressions.append("{name}: status changed from 'ok' to '{to}'".format(
+                    name=name,
+                    to=current["status"],
+                ))
+                continue
+
+            for stage, measures in reference["stages"].items():
+                before = measures["time"]
+                after = current["stages"].get(stage, {}).get("time")
+                if after is None:
+                    continue
+
+                if after > before * (1 + tolerance) and (after - before) > minimum:
+                    msg = "{name}: stage '{stage}' time {before:.6f}s -> {after:.6f}s"
+                    regressions.append(msg.format(
+                        name=name,
+                        stage=stage,
+                        before=before,
+                        after=after,
+                    ))
+
+        return regressions
+
+    def format_case(self, name, result):
+        """
+        Format a case result to a readable line.
+
+        Arguments:
+            name (string): Case name.
+            result (dict): Case result.
+
+        Returns:
+            string: Case line.
+        """
+        if result["status"] != "ok":
+            return "{name:<20} {status} {error}".format(
+                name=name,
+                status=result["status"].upper(),
+                error=result.get("error", ""),
+            ).strip()
+
+        return "{name:<20} {stages}".format(
+            name=name,
+            stages="  ".join([
+                "{stage}={time:.6f}s/{memory:.1f}KiB".format(
+                    stage=stage,
+                    time=result["stages"][stage]["time"],
+                    memory=result["stages"][stage]["peak_memory"] / 1024,
+                )
+                for stage in self.STAGES
+            ]),
+        )
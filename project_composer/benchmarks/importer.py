@@ -0,0 +1,171 @@
+import sys
+import tempfile
+from pathlib import Path
+
+from ..importer import import_module, import_modules, invalidate_caches
+from ..utils.graphs import app_name
+
+from .base import BaseBenchmark, measure
+
+
+IMPORT_MODES = {
+    "cached": {},
+    "uncached": {"cache": False},
+    "native": {"native": True},
+}
+"""
+Importer keyword arguments for each benchmarked mode.
+"""
+
+
+def build_repository(basedir, size, name="benchmark_repository"):
+    """
+    Write an application repository package with a ``settings`` submodule for each
+    application.
+
+    Arguments:
+        basedir (pathlib.Path): Directory where to create the repository package.
+        size (integer): Number of applications.
+
+    Keyword Arguments:
+        name (string): Repository package name.
+
+    Returns:
+        string: Repository package name.
+    """
+    repository = basedir / name
+    repository.mkdir()
+    (repository / "__init__.py").write_text("")
+
+    for i in range(size):
+        application = repository / app_name(i)
+        application.mkdir()
+        (application / "__init__.py").write_text("DEPENDENCIES = []\n")
+        (application / "settings.py").write_text("ENABLED = True\n")
+
+    return name
+
+
+def importer_case(mode, size, repeat):
+    """
+    Measure importer stages on a generated repository.
+
+    Stages are:
+
+    import
+        Import every application and its ``settings`` submodule after they have been
+        removed from ``sys.modules``.
+    probe
+        Try to import a missing ``urls`` submodule for every application.
+    batch
+        Like ``import`` but with a single ``import_modules()`` call.
+
+    Arguments:
+        mode (string): Import mode name from ``IMPORT_MODES``.
+        size (integer): Number of applications to generate.
+        repeat (integer): Number of times to repeat measures.
+
+    Returns:
+        dict: Measures indexed on stage names.
+    """
+    options = IMPORT_MODES[mode]
+    stages = {}
+
+    def keep_best(name, measures):
+        if name not in stages or measures["time"] < stages[name]["time"]:
+            stages[name] = measures
+
+    with tempfile.TemporaryDirectory() as basedir:
+        package = build_repository(Path(basedir), size)
+        sys.path.insert(0, basedir)
+        invalidate_caches()
+
+        applications = [
+            "{}.{}".format(package, app_name(i))
+            for i in range(size)
+        ]
+        modules = applications + [name + ".settings" for name in applications]
+        probes = [name + ".urls" for name in applications]
+
+        def unload():
+            for name in list(sys.modules.keys()):
+                if name.startswith(package + "."):
+                    del sys.modules[name]
+
+        def cold_import():
+            unload()
+            for name in modules:
+                import_module(name, **options)
+
+        def probe():
+            for name in probes:
+                try:
+                    import_module(name, **options)
+                except ModuleNotFoundError:
+                    pass
+
+        def batch():
+            unload()
+            import_modules(modules, **options)
+
+        try:
+            for i in range(repeat):
+                keep_best("import", measure(cold_import))
+                keep_best("probe", measure(probe))
+                keep_best("batch", measure(batch))
+        finally:
+            sys.path.remove(basedir)
+
+    return stages
+
+
+class ImporterBenchmark(BaseBenchmark):
+    """
+    Benchmark importer modes over generated application repositories.
+
+    Keyword Arguments:
+        modes (list): Mode names to use from ``IMPORT_MODES``. Default to all of them.
+        sizes (list): Number of applications to generate. Default to
+            ``DEFAULT_SIZES``.
+        repeat (integer): Number of times to repeat each case measures.
+        timeout (integer): Time limit in seconds for a single case.
+
+    Attributes:
+        DEFAULT_SIZES (list): Default repository sizes.
+    """
+    DEFAULT_SIZES = [10, 100, 1000]
+    STAGES = ["import", "probe", "batch"]
+
+    def __init__(self, modes=None, sizes=None, repeat=3, timeout=60):
+        super().__init__(timeout=timeout)
+        self.modes = modes or list(IMPORT_MODES.keys())
+        self.sizes = sorted(sizes or self.DEFAULT_SIZES)
+        self.repeat = repeat
+
+    def run(self, printer=None):
+        """
+        Run every benchmark cases.
+
+        Keyword Arguments:
+            printer (callable): Optional callable to output a line for each case
+                result when it is done.
+
+        Returns:
+            dict: Results with environment informations and cases results indexed on
+            their name ``mode:size``.
+        """
+        results = {
+            "environment": self.get_environment(),
+            "cases": {},
+        }
+
+        for mode in self.modes:
+            for size in self.sizes:
+                name = "{}:{}".format(mode, size)
+                result = self.run_case(importer_case, mode, size, self.repeat)
+                results["cases"][name] = result
+
+                if printer:
+                    printer(self.format_case(name, result))
+
+        return results
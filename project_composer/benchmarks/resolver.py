@@ -0,0 +1,129 @@
+from ..app_storage import AppStore
+from ..utils.graphs import GENERATORS
+
+from .base import BaseBenchmark, measure
+
+
+def resolver_case(store_class, generator, size, repeat):
+    """
+    Measure the resolving stages for a generated collection.
+
+    Stages are measured on their own with a store in the state left by the previous
+    stages. Each stage time is the best time from all repeats.
+
+    Arguments:
+        store_class (class): AppStore class to use.
+        generator (string): Generator name from ``utils.graphs.GENERATORS``.
+        size (integer): Number of applications to generate.
+        repeat (integer): Number of times to repeat measures.
+
+    Returns:
+        dict: Measures indexed on stage names.
+    """
+    collection = GENERATORS[generator](size)
+    initials = {item["name"]: item.get("push_end", False) for item in collection}
+    stages = {}
+
+    def keep_best(name, measures):
+        if name not in stages or measures["time"] < stages[name]["time"]:
+            stages[name] = measures
+
+    for i in range(repeat):
+        store = store_class()
+
+        # Each stage is measured twice (time then memory) so it needs a fresh state
+        # for each call
+        def process():
+            store.processed_apps = []
+            store.process_collection(collection)
+
+        keep_best("process", measure(process))
+        keep_best("cycles", measure(store.validate_cycles))
+
+        resolved = store.resolve_dependencies()
+        keep_best("resolve", measure(store.resolve_dependencies))
+
+        def inheritance():
+            # Restore original values since inheritance modify them
+            for app in resolved:
+                app.push_end = initials[app.name]
+            store.apply_inheritance(resolved)
+            store.push_end_ordering(resolved)
+
+        keep_best("inheritance", measure(inheritance))
+
+    return stages
+
+
+class ResolverBenchmark(BaseBenchmark):
+    """
+    Benchmark ``AppStore`` resolving over synthetic collections of various shapes and
+    sizes.
+
+    Once a case fails (error or timeout) for a generator, the bigger sizes for the same
+    generator are skipped.
+
+    Keyword Arguments:
+        generators (list): Generator names to use from ``utils.graphs.GENERATORS``.
+            Default to all of them.
+        sizes (list): Collection sizes to generate. Default to ``DEFAULT_SIZES``.
+        repeat (integer): Number of times to repeat each case measures.
+        timeout (integer): Time limit in seconds for a single case.
+        store_class (class): AppStore class to benchmark.
+
+    Attributes:
+        DEFAULT_SIZES (list): Default collection sizes.
+    """
+    DEFAULT_SIZES = [10, 100, 1000, 10000, 100000]
+    STAGES = ["process", "cycles", "resolve", "inheritance"]
+
+    def __init__(self, generators=None, sizes=None, repeat=3, timeout=60,
+                 store_class=AppStore):
+        super().__init__(timeout=timeout)
+        self.generators = generators or list(GENERATORS.keys())
+        self.sizes = sorted(sizes or self.DEFAULT_SIZES)
+        self.repeat = repeat
+        self.store_class = store_class
+
+    def run(self, printer=None):
+        """
+        Run every benchmark cases.
+
+        Keyword Arguments:
+            printer (callable): Optional callable to output a line for each case
+                result when it is done.
+
+        Returns:
+            dict: Results with environment informations and cases results indexed on
+            their name ``generator:size``.
+        """
+        results = {
+            "environment": self.get_environment(),
+            "store": self.store_class.__name__,
+            "cases": {},
+        }
+
+        for generator in self.generators:
+            failed = False
+
+            for size in self.sizes:
+                name = "{}:{}".format(generator, size)
+
+                if failed:
+                    result = {"status": "skipped"}
+                else:
+                    result = self.run_case(
+                        resolver_case,
+                        self.store_class,
+                        generator,
+                        size,
+                        self.repeat,
+                    )
+                    failed = result["status"] != "ok"
+
+                results["cases"][name] = result
+
+                if printer:
+                    printer(self.format_case(name, result))
+
+        return results
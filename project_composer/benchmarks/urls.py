@@ -0,0 +1,200 @@
+from ..utils.graphs import app_name
+
+from .base import BaseBenchmark, measure
+
+
+URL_LAYOUTS = ["flat", "grouped"]
+"""
+Benchmarked url pattern layouts.
+"""
+
+ROUTES = [
+    "",
+    "<int:pk>/",
+    "<int:pk>/edit/",
+    "<int:pk>/delete/",
+    "<slug:slug>/detail/",
+    "add/",
+    "search/",
+    "archive/<int:year>/",
+    "archive/<int:year>/<int:month>/",
+    "feed/",
+]
+"""
+Route templates for each generated application, they are prefixed with the
+application name.
+"""
+
+ROUTE_VALUES = {
+    "<int:pk>": "42",
+    "<slug:slug>": "foo",
+    "<int:year>": "2024",
+    "<int:month>": "5",
+}
+"""
+Values to build a path from route templates.
+"""
+
+
+def url_view(request, **kwargs):
+    """
+    Dummy view for generated url patterns.
+    """
+    return None
+
+
+def build_urlpatterns(size):
+    """
+    Build url patterns for generated applications.
+
+    Arguments:
+        size (integer): Number of url patterns.
+
+    Returns:
+        tuple: Url patterns and a path to resolve for each of them.
+    """
+    from django.urls import path
+
+    urlpatterns = []
+    paths = []
+
+    for i in range(size):
+        route = "{app}/{route}".format(
+            app=app_name(i // len(ROUTES)),
+            route=ROUTES[i % len(ROUTES)],
+        )
+        urlpatterns.append(path(route, url_view, name="url{}".format(i)))
+
+        for converter, value in ROUTE_VALUES.items():
+            route = route.replace(converter, value)
+        paths.append("/" + route)
+
+    return urlpatterns, paths
+
+
+def urls_case(layout, size, repeat, samples=100):
+    """
+    Measure url resolving for a layout of generated url patterns.
+
+    Stages are:
+
+    build
+        Build the layout from collected url patterns, this is nothing for the ``flat``
+        layout.
+    resolve
+        Resolve a sample of paths evenly spread over url patterns.
+    miss
+        Resolve the same sample of paths with an unknown suffix, so every url pattern
+        is tried.
+
+    Arguments:
+        layout (string): Layout name from ``URL_LAYOUTS``.
+        size (integer): Number of url patterns to generate.
+        repeat (integer): Number of times to repeat measures.
+
+    Keyword Arguments:
+        samples (integer): Maximum number of paths to resolve.
+
+    Returns:
+        dict: Measures indexed on stage names.
+    """
+    # Django is imported here since it is not a dependency
+    from django.conf import settings
+    from django.urls import Resolver404
+    from django.urls.resolvers import RegexPattern, URLResolver
+
+    from ..contrib.django.routing import group_urlpatterns
+
+    if not settings.configured:
+        settings.configure()
+
+    urlpatterns, paths = build_urlpatterns(size)
+    step = max(1, len(paths) // samples)
+    sample = paths[::step][:samples]
+    stages = {}
+
+    def keep_best(name, measures):
+        if name not in stages or measures["time"] < stages[name]["time"]:
+            stages[name] = measures
+
+    def build():
+        if layout == "grouped":
+            return group_urlpatterns(urlpatterns)
+
+        return list(urlpatterns)
+
+    resolver = URLResolver(RegexPattern(r"^/"), build())
+
+    def resolve():
+        for item in sample:
+            resolver.resolve(item)
+
+    def miss():
+        for item in sample:
+            try:
+                resolver.resolve(item + "nope/")
+            except Resolver404:
+                pass
+
+    for i in range(repeat):
+        keep_best("build", measure(build))
+        keep_best("resolve", measure(resolve))
+        keep_best("miss", measure(miss))
+
+    return stages
+
+
+class UrlsBenchmark(BaseBenchmark):
+    """
+    Benchmark Django url resolving against the flat and grouped layouts of generated
+    url patterns.
+
+    This requires Django to be installed.
+
+    Keyword Arguments:
+        layouts (list): Layout names to use from ``URL_LAYOUTS``. Default to all of
+            them.
+        sizes (list): Number of url patterns to generate. Default to
+            ``DEFAULT_SIZES``.
+        repeat (integer): Number of times to repeat each case measures.
+        timeout (integer): Time limit in seconds for a single case.
+
+    Attributes:
+        DEFAULT_SIZES (list): Default url pattern numbers.
+    """
+    DEFAULT_SIZES = [100, 1000, 10000]
+    STAGES = ["build", "resolve", "miss"]
+
+    def __init__(self, layouts=None, sizes=None, repeat=3, timeout=60):
+        super().__init__(timeout=timeout)
+        self.layouts = layouts or list(URL_LAYOUTS)
+        self.sizes = sorted(sizes or self.DEFAULT_SIZES)
+        self.repeat = repeat
+
+    def run(self, printer=None):
+        """
+        Run every benchmark cases.
+
+        Keyword Arguments:
+            printer (callable): Optional callable to output a line for each case
+                result when it is done.
+
+        Returns:
+            dict: Results with environment informations and cases results indexed on
+            their name ``layout:size``.
+        """
+        results = {
+            "environment": self.get_environment(),
+            "cases": {},
+        }
+
+        for layout in self.layouts:
+            for size in self.sizes:
+                name = "{}:{}".format(layout, size)
+                result = self.run_case(urls_case, layout, size, self.repeat)
+                results["cases"][name] = result
+
+                if printer:
+                    printer(self.format_case(name, result))
+
+        return results
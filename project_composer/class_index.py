@@ -0,0 +1,391 @@
+"""
+Class discovery index built from static analysis.
+
+The index records, for each application module, the names of the enabled classes
+found from its source without importing it and a checksum of its file. At runtime,
+index entries are checked against module files before modules are imported, once for
+each composer. Then ``ClassProcessor`` does not import an indexed module which does
+not define any enabled class and directly gets the indexed classes from the other
+ones instead of inspecting them. A module whose file checksum does not match anymore
+is imported and inspected as usual.
+
+Static analysis is conservative, it only indexes what class registry discovery (see
+``Composer._get_elligible_module_classes()``) would find. When a module can not be
+statically known, like a class inheriting from an imported class or a name bound
+again after its class definition, its classes are recorded as unknown and the module
+is always inspected at runtime. An entry also records with ``namespace`` if its
+classes are the ones the namespace scan discovery would find, this is not the case
+when module imports names which may be enabled classes from elsewhere.
+"""
+import ast
+import hashlib
+import json
+from pathlib import Path
+
+from .exceptions import ComposerIndexError
+from .importer import peek_attribute
+
+
+MARKER_MODULE = "project_composer.marker"
+MARKER_NAME = "EnabledApplicationMarker"
+MARKER_ATTRIBUTE = "_ENABLED_COMPOSABLE_APPLICATION"
+
+DEFAULT_SUBMODULES = ["__init__", "settings", "urls"]
+"""
+Application submodules indexed on default, ``__init__`` is for the application
+module itself.
+"""
+
+
+def get_checksum(content):
+    """
+    Compute a file content checksum.
+
+    Arguments:
+        content (bytes): File content.
+
+    Returns:
+        string: SHA256 hexadecimal digest.
+    """
+    return hashlib.sha256(content).hexdigest()
+
+
+def _get_dotted_name(node):
+    """
+    Get the dotted name of an attribute chain like ``foo.bar.Ping``.
+
+    Returns:
+        string: Dotted name or ``None`` if node is not a simple name chain.
+    """
+    parts = []
+
+    while isinstance(node, ast.Attribute):
+        parts.insert(0, node.attr)
+        node = node.value
+
+    if not isinstance(node, ast.Name):
+        return None
+
+    parts.insert(0, node.id)
+
+    return ".".join(parts)
+
+
+def _is_literal(node):
+    """
+    Returns:
+        boolean: True if node is a literal value like a string or a list of strings.
+    """
+    try:
+        ast.literal_eval(node)
+    except (ValueError, TypeError, SyntaxError, MemoryError, RecursionError):
+        return False
+
+    return True
+
+
+def _get_bound_names(node):
+    """
+    Get the module names bound by a top level statement.
+
+    Returns:
+        list: Bound names.
+    """
+    names = []
+
+    if isinstance(node, (ast.Assign, ast.AnnAssign, ast.AugAssign, ast.Delete)):
+        targets = node.targets if isinstance(node, (ast.Assign, ast.Delete)) else [
+            node.target
+        ]
+        for target in targets:
+            for item in ast.walk(target):
+                if isinstance(item, ast.Name):
+                    names.append(item.id)
+    elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+        names.append(node.name)
+    elif isinstance(node, (ast.Import, ast.ImportFrom)):
+        for alias in node.names:
+            names.append(alias.asname or alias.name.split(".")[0])
+
+    return names
+
+
+def find_marked_classes(source, filename="<unknown>", namespace=False):
+    """
+    Statically find the enabled classes defined in a module source.
+
+    Enabled classes are the public classes defined at module level which inherit
+    from ``EnabledApplicationMarker``, directly or from another class of the same
+    module.
+
+    Arguments:
+        source (string or bytes): Module source.
+
+    Keyword Arguments:
+        filename (string): File name used in syntax errors.
+        namespace (boolean): If True, enabled classes are only known if module
+            namespace can not contain enabled classes from elsewhere, like the
+            namespace scan discovery would find them.
+
+    Returns:
+        list: Enabled class names in their definition order, or ``None`` if the
+        enabled classes can not be statically known.
+    """
+    try:
+        tree = ast.parse(source, filename)
+    except (SyntaxError, ValueError):
+        return None
+
+    # Names bound to the marker class and to the marker module
+    markers = set([])
+    marker_modules = set([])
+    # Classes defined in module and whether they are marked
+    local = {}
+    bound = set([])
+    classes = []
+    # True when module binds names which may be enabled classes from elsewhere
+    foreign = False
+
+    def resolve(base):
+        dotted = _get_dotted_name(base)
+        if dotted is None:
+            return None
+
+        if dotted in markers:
+            return True
+        if dotted in local:
+            return local[dotted]
+        if dotted == "object" and dotted not in bound:
+            return False
+
+        prefix, _, name = dotted.rpartition(".")
+        if name == MARKER_NAME and prefix in marker_modules:
+            return True
+
+        return None
+
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef):
+            kinds = [resolve(base) for base in node.bases]
+            defines_attribute = any([
+                MARKER_ATTRIBUTE in _get_bound_names(item)
+                for item in node.body
+            ])
+
+            # Decorators may replace class, unknown bases may be marked and marker
+            # attribute may disable class or enable it without inheritance
+            if (
+                node.decorator_list or defines_attribute or
+                None in kinds or node.name in bound
+            ):
+                return None
+
+            local[node.name] = any(kinds)
+            bound.add(node.name)
+
+            if local[node.name] and not node.name.startswith("_"):
+                classes.append(node.name)
+            continue
+
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            for alias in node.names:
+                if alias.name == "*":
+                    foreign = True
+                    continue
+
+                if isinstance(node, ast.Import):
+                    if alias.asname and alias.name == MARKER_MODULE:
+                        marker_modules.add(alias.asname)
+                    elif not alias.asname and MARKER_MODULE.startswith(
+                        alias.name.split(".")[0] + "."
+                    ):
+                        marker_modules.add(MARKER_MODULE)
+                elif (
+                    node.level == 0 and node.module == MARKER_MODULE and
+                    alias.name == MARKER_NAME
+                ):
+                    markers.add(alias.asname or alias.name)
+                else:
+                    foreign = True
+        elif isinstance(node, (ast.Assign, ast.AnnAssign, ast.AugAssign)):
+            if node.value is not None and not _is_literal(node.value):
+                foreign = True
+        elif isinstance(node, (ast.If, ast.Try, ast.With, ast.For, ast.While)):
+            # Conditionnal definitions can not be known
+            return None
+
+        names = _get_bound_names(node)
+        if set(names) & set(local.keys()):
+            return None
+        bound.update(names)
+
+    if classes and not namespace:
+        return classes
+
+    # Without any marked class or with the namespace scan, discovery scans module
+    # namespace which may contain enabled classes from elsewhere
+    if foreign:
+        return None
+
+    return classes
+
+
+class ClassIndex:
+    """
+    Enabled classes index for application modules.
+
+    Keyword Arguments:
+        repository (string): Repository Python path the index has been built for.
+        modules (dict): Indexed modules on their Python path, each one is a
+            dictionnary with items ``app``, ``submodule``, ``filepath`` (relative to
+            the repository directory), ``checksum``, ``classes`` (``None`` when
+            classes are unknown) and ``namespace`` (True when classes are also the
+            ones found from a namespace scan).
+
+    Attributes:
+        VERSION (integer): Index format version.
+    """
+    VERSION = 1
+
+    def __init__(self, repository=None, modules=None):
+        self.repository = repository
+        self.modules = modules or {}
+
+    @classmethod
+    def get_repository_dirpath(cls, composer):
+        """
+        Get repository directory of a composer.
+
+        Arguments:
+            composer (Composer): Composer object.
+
+        Returns:
+            pathlib.Path: Repository directory path.
+        """
+        module = composer.find_app_module(composer.manifest.repository)
+        if not module or not peek_attribute(module, "__file__"):
+            msg = "Unable to find repository directory for: {}"
+            raise ComposerIndexError(msg.format(composer.manifest.repository))
+
+        return Path(peek_attribute(module, "__file__")).parent
+
+    @classmethod
+    def build(cls, composer, submodules=None):
+        """
+        Build index for application modules of a composer collection.
+
+        Module files are read, not imported. A submodule which does not exist is not
+        indexed.
+
+        Arguments:
+            composer (Composer): Composer object.
+
+        Keyword Arguments:
+            submodules (list): Submodule names to index for each application. Default
+                to ``DEFAULT_SUBMODULES``.
+
+        Returns:
+            ClassIndex: The built index.
+        """
+        repository_dirpath = cls.get_repository_dirpath(composer)
+        modules = {}
+
+        for name in composer.manifest.collection:
+            base = composer.get_application_base_module_path(name)
+
+            for submodule in submodules or DEFAULT_SUBMODULES:
+                if submodule == "__init__":
+                    path = base
+                    candidates = [Path(name, "__init__.py")]
+                else:
+                    path = "{}.{}".format(base, submodule)
+                    parts = submodule.split(".")
+                    candidates = [
+                        Path(name, *parts[:-1], parts[-1] + ".py"),
+                        Path(name, *parts, "__init__.py"),
+                    ]
+
+                for filepath in candidates:
+                    content = composer.read_file(
+                        repository_dirpath / filepath,
+                        binary=True,
+                    )
+                    if content is not None:
+                        modules[path] = {
+                            "app": name,
+                            "submodule": submodule,
+                            "filepath": filepath.as_posix(),
+                            "checksum": get_checksum(content),
+                            "classes": find_marked_classes(content, str(filepath)),
+                            "namespace": find_marked_classes(
+                                content,
+                                str(filepath),
+                                namespace=True,
+                            ) is not None,
+                        }
+                        break
+
+        return cls(repository=composer.manifest.repository, modules=modules)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Load an index from a JSON file.
+
+        Arguments:
+            path (string or pathlib.Path): Index file path.
+
+        Returns:
+            ClassIndex: The loaded index.
+        """
+        path = Path(path)
+
+        try:
+            content = json.loads(path.read_text())
+        except (OSError, ValueError) as e:
+            msg = "Unable to load class index from '{path}': {error}"
+            raise ComposerIndexError(msg.format(path=path, error=e))
+
+        if not isinstance(content, dict) or content.get("version") != cls.VERSION:
+            msg = "Class index from '{path}' is not in the version {version} format."
+            raise ComposerIndexError(msg.format(path=path, version=cls.VERSION))
+
+        return cls(
+            repository=content.get("repository"),
+            modules=content.get("modules"),
+        )
+
+    def to_dict(self):
+        """
+        Returns:
+            dict: Index content.
+        """
+        return {
+            "version": self.VERSION,
+            "repository": self.repository,
+            "modules": self.modules,
+        }
+
+    def get_content_checksum(self):
+        """
+        Returns:
+            string: Checksum of index content, equal indexes have the same checksum.
+        """
+        return get_checksum(
+            json.dumps(self.to_dict(), sort_keys=True).encode("utf-8")
+        )
+
+    def dump(self, destination):
+        """
+        Write index to a JSON file.
+
+        Arguments:
+            destination (string or pathlib.Path): File path to write.
+
+        Returns:
+            pathlib.Path: Written file path.
+        """
+        destination = Path(destination)
+        destination.write_text(json.dumps(self.to_dict(), indent=4))
+
+        return destination
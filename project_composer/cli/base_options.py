@@ -2,7 +2,9 @@ from pathlib import Path
 
 import click
 
+from ..app_storage.engines import ENGINES
 from ..defaults import DEFAULT_MANIFEST_PATH
+from ..profiler import PROFILE_FORMATS
 
 
 # Shared options
@@ -50,4 +52,110 @@ COMMON_OPTIONS = {
             ),
         }
     },
+    "workers": {
+        "args": ("--workers",),
+        "kwargs": {
+            "type": click.IntRange(min=1),
+            "default": None,
+            "metavar": "INTEGER",
+            "help": (
+                "Number of workers to use to process applications concurrently. "
+                "Applications are processed in dependency levels so results are the "
+                "same than with a serial processing. Default to a serial processing."
+            ),
+        }
+    },
+    "worker_backend": {
+        "args": ("--worker-backend", "worker_backend"),
+        "kwargs": {
+            "type": click.Choice(["thread", "process"]),
+            "default": "thread",
+            "help": (
+                "Kind of worker pool to use with '--workers', either 'thread' or "
+                "'process'. Default to 'thread'."
+            ),
+        }
+    },
+    "resolver": {
+        "args": ("--resolver",),
+        "kwargs": {
+            "type": click.Choice(list(ENGINES.keys())),
+            "default": None,
+            "help": (
+                "Resolver engine to use to resolve application order. Using this "
+                "argument will override the 'resolver' item from manifest."
+            ),
+        }
+    },
+    "lazy_import": {
+        "args": ("--lazy-import", "lazy_import"),
+        "kwargs": {
+            "is_flag": True,
+            "default": False,
+            "help": (
+                "Import application modules lazily, so their code is only executed if "
+                "it is needed. An application module which does not define "
+                "'DEPENDENCIES' or 'PUSH_END' is not executed to resolve it."
+            ),
+        }
+    },
+    "profile_imports": {
+        "args": ("--profile-imports", "profile_imports"),
+        "kwargs": {
+            "type": click.Path(
+                exists=False,
+                file_okay=True,
+                dir_okay=False,
+                path_type=Path
+            ),
+            "default": None,
+            "metavar": "FILEPATH",
+            "help": (
+                "File path where to write the import profile of application modules "
+                "with their wall time, CPU time, allocated memory and nested imports."
+            ),
+        }
+    },
+    "profile_format": {
+        "args": ("--profile-format", "profile_format"),
+        "kwargs": {
+            "type": click.Choice(PROFILE_FORMATS),
+            "default": "json",
+            "help": (
+                "Format of the import profile file, either 'json' for results or "
+                "'trace' for Chrome trace events to view as a flamegraph. Default to "
+                "'json'."
+            ),
+        }
+    },
+    "scan_workers": {
+        "args": ("--scan-workers", "scan_workers"),
+        "kwargs": {
+            "type": click.IntRange(min=1),
+            "default": None,
+            "metavar": "INTEGER",
+            "help": (
+                "Number of worker processes to scan application modules out of the "
+                "current process, so application code is never imported in it. "
+                "Default to scan in the current process."
+            ),
+        }
+    },
+    "archive": {
+        "args": ("--archive",),
+        "kwargs": {
+            "type": click.Path(
+                exists=True,
+                file_okay=True,
+                dir_okay=False,
+                path_type=Path
+            ),
+            "default": None,
+            "metavar": "FILEPATH",
+            "help": (
+                "Path to a zip archive to load repository modules from. Using this "
+                "argument will override the 'archive' item from manifest."
+            ),
+        }
+    },
 }
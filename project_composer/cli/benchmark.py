@@ -0,0 +1,153 @@
+import logging
+from pathlib import Path
+
+import click
+
+from .. import __pkgname__
+
+from ..app_storage.engines import ENGINES, get_engine
+from ..benchmarks import ImporterBenchmark, ResolverBenchmark, UrlsBenchmark
+from ..utils.graphs import GENERATORS
+
+
+@click.command()
+@click.option(
+    "--suite",
+    type=click.Choice(["resolver", "importer", "urls"]),
+    default="resolver",
+    help=(
+        "Benchmark suite to run, either 'resolver' for application resolving, "
+        "'importer' for module importing modes or 'urls' for Django url resolving "
+        "with flat and grouped url patterns. Default to 'resolver'."
+    ),
+)
+@click.option(
+    "--generator",
+    "generators",
+    type=click.Choice(list(GENERATORS.keys())),
+    multiple=True,
+    help=(
+        "Collection generator to use with resolver suite. You can define it multiple "
+        "times. Default to use every generators."
+    ),
+)
+@click.option(
+    "--size",
+    "sizes",
+    type=click.IntRange(min=1),
+    multiple=True,
+    metavar="INTEGER",
+    help=(
+        "Number of applications to generate for each case. You can define it "
+        "multiple times. Default to sizes from 10 to 100000 for resolver suite, "
+        "from 10 to 1000 for importer suite and from 100 to 10000 url patterns for "
+        "urls suite."
+    ),
+)
+@click.option(
+    "--engine",
+    type=click.Choice(list(ENGINES.keys())),
+    default="reference",
+    help="Resolver engine to benchmark with resolver suite. Default to 'reference'.",
+)
+@click.option(
+    "--repeat",
+    type=click.IntRange(min=1),
+    default=3,
+    metavar="INTEGER",
+    help="Number of times each case is measured, the best time is retained.",
+)
+@click.option(
+    "--timeout",
+    type=click.IntRange(min=1),
+    default=60,
+    metavar="SECONDS",
+    help=(
+        "Time limit for a single case. Once a case fails, bigger sizes from the same "
+        "generator are skipped."
+    ),
+)
+@click.option(
+    "--dump",
+    type=click.Path(exists=False, file_okay=True, dir_okay=False, path_type=Path),
+    default=None,
+    metavar="FILEPATH",
+    help="File path where to write results as a JSON baseline.",
+)
+@click.option(
+    "--compare",
+    type=click.Path(exists=True, file_okay=True, dir_okay=False, path_type=Path),
+    default=None,
+    metavar="FILEPATH",
+    help=(
+        "File path to a JSON baseline to compare results with. The command exits with "
+        "an error code if there is any regression."
+    ),
+)
+@click.option(
+    "--tolerance",
+    type=click.FloatRange(min=0),
+    default=0.25,
+    metavar="FLOAT",
+    help=(
+        "Allowed ratio of time increase against baseline before marking a stage as a "
+        "regression. Default to '0.25' for 25%."
+    ),
+)
+@click.pass_context
+def benchmark_command(ctx, **parameters):
+    """
+    Benchmark application resolving with synthetic collections, module importing
+    with generated repositories or Django url resolving with generated url patterns.
+
+    For resolver suite, stages 'process', 'cycles', 'resolve' and 'inheritance' are
+    measured separately for their time and peak allocated memory. For importer suite
+    the stages are 'import', 'probe' and 'batch' for each importer mode. For urls
+    suite the stages are 'build', 'resolve' and 'miss' for the flat and grouped
+    layouts, it requires Django.
+    """
+    logger = logging.getLogger(__pkgname__)
+
+    if parameters["suite"] == "importer":
+        benchmark = ImporterBenchmark(
+            sizes=list(parameters["sizes"]),
+            repeat=parameters["repeat"],
+            timeout=parameters["timeout"],
+        )
+    elif parameters["suite"] == "urls":
+        benchmark = UrlsBenchmark(
+            sizes=list(parameters["sizes"]),
+            repeat=parameters["repeat"],
+            timeout=parameters["timeout"],
+        )
+    else:
+        benchmark = ResolverBenchmark(
+            generators=list(parameters["generators"]),
+            sizes=list(parameters["sizes"]),
+            repeat=parameters["repeat"],
+            timeout=parameters["timeout"],
+            store_class=get_engine(parameters["engine"]),
+        )
+
+    results = benchmark.run(printer=click.echo)
+
+    if parameters["dump"]:
+        logger.info("Results written at: {}".format(
+            benchmark.dump(results, parameters["dump"])
+        ))
+
+    if parameters["compare"]:
+        logger.debug("Comparing with baseline: {}".format(parameters["compare"]))
+        regressions = benchmark.compare(
+            benchmark.load(parameters["compare"]),
+            results,
+            tolerance=parameters["tolerance"],
+        )
+
+        for item in regressions:
+            logger.error("Regression on {}".format(item))
+
+        if regressions:
+            ctx.exit(1)
+
+        logger.info("There is no regression against baseline")
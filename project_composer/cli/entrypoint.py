@@ -12,6 +12,10 @@ from ..logger import init_logger
 from .version import version_command
 from .requirements import requirements_command
 from .purge import purge_command
+from .impact import impact_command
+from .benchmark import benchmark_command
+from .index import index_command
+from .lock import lock_command
 
 
 # Help alias on "-h" argument
@@ -61,3 +65,7 @@ def cli_frontend(ctx, verbose):
 cli_frontend.add_command(version_command, name="version")
 cli_frontend.add_command(requirements_command, name="requirements")
 cli_frontend.add_command(purge_command, name="purge")
+cli_frontend.add_command(impact_command, name="impact")
+cli_frontend.add_command(benchmark_command, name="benchmark")
+cli_frontend.add_command(index_command, name="index")
+cli_frontend.add_command(lock_command, name="lock")
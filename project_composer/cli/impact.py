@@ -0,0 +1,114 @@
+import logging
+
+import click
+
+from .. import __pkgname__
+
+from ..compose import Composer
+from ..manifest import Manifest
+from ..processors import ImpactProcessor
+
+from .base_options import COMMON_OPTIONS
+
+
+@click.command()
+@click.option(
+    *COMMON_OPTIONS["manifest"]["args"],
+    **COMMON_OPTIONS["manifest"]["kwargs"]
+)
+@click.option(
+    *COMMON_OPTIONS["repository"]["args"],
+    **COMMON_OPTIONS["repository"]["kwargs"]
+)
+@click.option(
+    *COMMON_OPTIONS["syspaths"]["args"],
+    **COMMON_OPTIONS["syspaths"]["kwargs"]
+)
+@click.option(
+    *COMMON_OPTIONS["archive"]["args"],
+    **COMMON_OPTIONS["archive"]["kwargs"]
+)
+@click.option(
+    *COMMON_OPTIONS["resolver"]["args"],
+    **COMMON_OPTIONS["resolver"]["kwargs"]
+)
+@click.option(
+    *COMMON_OPTIONS["lazy_import"]["args"],
+    **COMMON_OPTIONS["lazy_import"]["kwargs"]
+)
+@click.option(
+    "--changes",
+    type=click.File("r"),
+    default="-",
+    metavar="FILEPATH",
+    help=(
+        "File path to a list of changed file paths, one per line. Default is to read "
+        "the list from standard input."
+    ),
+)
+@click.pass_context
+def impact_command(*args, **parameters):
+    """
+    Output applications impacted by a list of changed files.
+
+    Each changed file is mapped to the enabled application directory which contains
+    it, then every application depending directly or indirectly on these
+    applications is included. Impacted application names are printed out one per
+    line in their resolved order.
+
+    This is commonly used in continuous integration to only run the test suites from
+    impacted applications, for example with: git diff --name-only main |
+    project_composer impact
+    """
+    logger = logging.getLogger(__pkgname__)
+
+    # Load manifest settings
+    logger.debug("Using manifest: {}".format(parameters["manifest"]))
+    manifest = Manifest.load(parameters["manifest"])
+
+    # Patch arguments in multiple mode since an empty default list trouble the
+    # manifest settings overriding
+    if len(parameters.get("syspaths", [])) == 0:
+        parameters["syspaths"] = None
+
+    # Override base manifest settings from given arguments
+    # syspaths management have a special thing to avoid default value (empty list) to
+    # override the manifest value
+    for name in manifest.get_fieldnames():
+        if (name != "requirements" and parameters.get(name) is not None):
+            setattr(manifest, name, parameters.get(name))
+
+    # Logging used settings
+    if manifest.repository:
+        logger.debug("Applications repository: {}".format(manifest.repository))
+
+    for item in manifest.syspaths:
+        logger.debug("Loading in sys.path: {}".format(item))
+
+    if manifest.archive:
+        logger.debug("Using repository archive: {}".format(manifest.archive))
+
+    logger.debug("Using resolver engine: {}".format(manifest.resolver))
+
+    # Collect changed paths and ignore empty lines
+    changes = [
+        line.strip()
+        for line in parameters["changes"].read().splitlines()
+        if line.strip()
+    ]
+    logger.debug("Changed files: {}".format(len(changes)))
+
+    composer = Composer(
+        manifest,
+        processors=[ImpactProcessor],
+        lazy_import=parameters["lazy_import"],
+    )
+    composer.resolve_collection(lazy=False)
+
+    impacted = composer.call_processor("ImpactProcessor", "export", paths=changes)
+
+    if not impacted:
+        logger.warning("There was not any impacted application")
+
+    for node in impacted:
+        click.echo(node.name)
@@ -0,0 +1,108 @@
+import logging
+from pathlib import Path
+
+import click
+
+from .. import __pkgname__
+
+from ..class_index import DEFAULT_SUBMODULES, ClassIndex
+from ..compose import Composer
+from ..manifest import Manifest
+
+from .base_options import COMMON_OPTIONS
+
+
+@click.command()
+@click.option(
+    *COMMON_OPTIONS["manifest"]["args"],
+    **COMMON_OPTIONS["manifest"]["kwargs"]
+)
+@click.option(
+    *COMMON_OPTIONS["repository"]["args"],
+    **COMMON_OPTIONS["repository"]["kwargs"]
+)
+@click.option(
+    *COMMON_OPTIONS["syspaths"]["args"],
+    **COMMON_OPTIONS["syspaths"]["kwargs"]
+)
+@click.option(
+    *COMMON_OPTIONS["archive"]["args"],
+    **COMMON_OPTIONS["archive"]["kwargs"]
+)
+@click.option(
+    "--submodule",
+    "submodules",
+    default=[],
+    multiple=True,
+    metavar="STRING",
+    help=(
+        "Name of an application submodule to index, like 'settings'. Use '__init__' "
+        "for the application module itself. You can define it multiple times for "
+        "each submodule. Default to: {}.".format(", ".join(DEFAULT_SUBMODULES))
+    ),
+)
+@click.option(
+    "--destination",
+    type=click.Path(exists=False, file_okay=True, dir_okay=False, path_type=Path),
+    required=True,
+    metavar="FILEPATH",
+    help=(
+        "File path where to write the class index."
+    ),
+)
+@click.pass_context
+def index_command(*args, **parameters):
+    """
+    Build the class index of enabled applications.
+
+    Application module files are statically analyzed, without being imported, to
+    find the enabled classes they define. The index records them with a checksum of
+    each module file. Once the index is enabled from the manifest 'class_index' item,
+    enabled classes are directly taken from the index and a module file which has
+    changed since the index has been built is inspected as usual.
+    """
+    logger = logging.getLogger(__pkgname__)
+
+    # Load manifest settings
+    logger.debug("Using manifest: {}".format(parameters["manifest"]))
+    manifest = Manifest.load(parameters["manifest"])
+
+    # Patch arguments in multiple mode since an empty default list trouble the
+    # manifest settings overriding
+    if len(parameters.get("syspaths", [])) == 0:
+        parameters["syspaths"] = None
+
+    # Override base manifest settings from given arguments
+    # syspaths management have a special thing to avoid default value (empty list) to
+    # override the manifest value
+    for name in manifest.get_fieldnames():
+        if (name != "requirements" and parameters.get(name) is not None):
+            setattr(manifest, name, parameters.get(name))
+
+    # A previous index is not loaded since it may not exist yet
+    manifest.class_index = None
+
+    # Logging used settings
+    if manifest.repository:
+        logger.debug("Applications repository: {}".format(manifest.repository))
+
+    for item in manifest.syspaths:
+        logger.debug("Loading in sys.path: {}".format(item))
+
+    if manifest.archive:
+        logger.debug("Using repository archive: {}".format(manifest.archive))
+
+    composer = Composer(manifest)
+
+    index = ClassIndex.build(
+        composer,
+        submodules=list(parameters["submodules"]) or None,
+    )
+
+    for path, entry in index.modules.items():
+        if entry["classes"] is None:
+            logger.debug("Module must be inspected at runtime: {}".format(path))
+
+    logger.info("Class index written at: {}".format(
+        index.dump(parameters["destination"])
+    ))
@@ -0,0 +1,170 @@
+import importlib
+import logging
+from pathlib import Path
+
+import click
+
+from .. import __pkgname__
+
+from ..compose import Composer
+from ..exceptions import ComposerLockError
+from ..lockfile import CompositionLock
+from ..manifest import Manifest
+
+from .base_options import COMMON_OPTIONS
+
+
+def get_processor_class(path):
+    """
+    Import a processor class from its Python path.
+
+    Arguments:
+        path (string): Python path like ``foo.processors.FooProcessor``.
+
+    Returns:
+        class: Processor class or ``None`` if it can not be imported.
+    """
+    module_path, _, name = path.rpartition(".")
+
+    try:
+        module = importlib.import_module(module_path)
+    except (ImportError, ValueError):
+        return None
+
+    return getattr(module, name, None)
+
+
+@click.command()
+@click.option(
+    *COMMON_OPTIONS["manifest"]["args"],
+    **COMMON_OPTIONS["manifest"]["kwargs"]
+)
+@click.option(
+    *COMMON_OPTIONS["repository"]["args"],
+    **COMMON_OPTIONS["repository"]["kwargs"]
+)
+@click.option(
+    *COMMON_OPTIONS["syspaths"]["args"],
+    **COMMON_OPTIONS["syspaths"]["kwargs"]
+)
+@click.option(
+    *COMMON_OPTIONS["resolver"]["args"],
+    **COMMON_OPTIONS["resolver"]["kwargs"]
+)
+@click.option(
+    *COMMON_OPTIONS["archive"]["args"],
+    **COMMON_OPTIONS["archive"]["kwargs"]
+)
+@click.option(
+    "--processor",
+    "processors",
+    default=[],
+    multiple=True,
+    metavar="PYTHONPATH",
+    help=(
+        "Python path to a processor class whose discovered classes are locked, like "
+        "'project_composer.contrib.django.processors.DjangoSettingsProcessor'. You "
+        "can define it multiple times for each processor. On default only the "
+        "resolved applications are locked."
+    ),
+)
+@click.option(
+    "--lockfile",
+    type=click.Path(exists=False, file_okay=True, dir_okay=False, path_type=Path),
+    required=True,
+    metavar="FILEPATH",
+    help=(
+        "File path where to write the lockfile or the lockfile to verify."
+    ),
+)
+@click.option(
+    "--verify",
+    is_flag=True,
+    help=(
+        "Verify the lockfile is up to date instead of writing it. Each drift is "
+        "reported and the command fails if there is any."
+    ),
+)
+@click.pass_context
+def lock_command(*args, **parameters):
+    """
+    Build the composition lockfile of enabled applications.
+
+    Collection is resolved and every given processor discovers its classes, then the
+    resolved applications order, the modules found by processors with their enabled
+    classes and a checksum of each module file are written in the lockfile. Once the
+    lockfile is enabled from the manifest 'lockfile' item, composer does not scan
+    application modules anymore and directly gets the locked classes.
+
+    With '--verify', the lockfile is built again to be compared to the existing one,
+    this is commonly used from a continuous integration to detect an outdated
+    lockfile.
+    """
+    logger = logging.getLogger(__pkgname__)
+
+    # Load manifest settings
+    logger.debug("Using manifest: {}".format(parameters["manifest"]))
+    manifest = Manifest.load(parameters["manifest"])
+
+    # Patch arguments in multiple mode since an empty default list trouble the
+    # manifest settings overriding
+    if len(parameters.get("syspaths", [])) == 0:
+        parameters["syspaths"] = None
+
+    # Override base manifest settings from given arguments
+    # syspaths management have a special thing to avoid default value (empty list) to
+    # override the manifest value
+    for name in manifest.get_fieldnames():
+        if (name != "requirements" and parameters.get(name) is not None):
+            setattr(manifest, name, parameters.get(name))
+
+    # Lockfile is always built from the repository itself
+    manifest.lockfile = None
+
+    # Logging used settings
+    if manifest.repository:
+        logger.debug("Applications repository: {}".format(manifest.repository))
+
+    for item in manifest.syspaths:
+        logger.debug("Loading in sys.path: {}".format(item))
+
+    if manifest.archive:
+        logger.debug("Using repository archive: {}".format(manifest.archive))
+
+    processors = []
+    for path in parameters["processors"]:
+        processor = get_processor_class(path)
+        if processor is None:
+            logger.critical("Unable to import processor: {}".format(path))
+            raise click.Abort()
+
+        processors.append(processor)
+
+    composer = Composer(manifest, processors=processors)
+
+    try:
+        lock = CompositionLock.build(composer)
+    except ComposerLockError as e:
+        logger.critical(str(e))
+        raise click.Abort()
+
+    if not parameters["verify"]:
+        logger.info("Lockfile written at: {}".format(
+            lock.dump(parameters["lockfile"])
+        ))
+        return
+
+    try:
+        drifts = CompositionLock.load(parameters["lockfile"]).diff(lock)
+    except ComposerLockError as e:
+        logger.critical(str(e))
+        raise click.Abort()
+
+    for message in drifts:
+        logger.error(message)
+
+    if drifts:
+        logger.critical("Lockfile is outdated: {}".format(parameters["lockfile"]))
+        raise click.Abort()
+
+    logger.info("Lockfile is up to date: {}".format(parameters["lockfile"]))
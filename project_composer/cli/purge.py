@@ -24,6 +24,18 @@ from .base_options import COMMON_OPTIONS
     *COMMON_OPTIONS["syspaths"]["args"],
     **COMMON_OPTIONS["syspaths"]["kwargs"]
 )
+@click.option(
+    *COMMON_OPTIONS["resolver"]["args"],
+    **COMMON_OPTIONS["resolver"]["kwargs"]
+)
+@click.option(
+    *COMMON_OPTIONS["lazy_import"]["args"],
+    **COMMON_OPTIONS["lazy_import"]["kwargs"]
+)
+@click.option(
+    *COMMON_OPTIONS["scan_workers"]["args"],
+    **COMMON_OPTIONS["scan_workers"]["kwargs"]
+)
 @click.option(
     "--commit",
     is_flag=True,
@@ -73,7 +85,14 @@ def purge_command(*args, **parameters):
     for item in manifest.syspaths:
         logger.debug("Loading in sys.path: {}".format(item))
 
-    composer = Composer(manifest, processors=[PurgeProcessor])
+    logger.debug("Using resolver engine: {}".format(manifest.resolver))
+
+    composer = Composer(
+        manifest,
+        processors=[PurgeProcessor],
+        lazy_import=parameters["lazy_import"],
+        scan_workers=parameters["scan_workers"],
+    )
     composer.resolve_collection(lazy=False)
 
     commit = parameters.get("commit")
@@ -6,6 +6,7 @@ import click
 from .. import __pkgname__
 
 from ..compose import Composer
+from ..exceptions import ComposerError
 from ..manifest import Manifest
 from ..processors import TextContentProcessor
 
@@ -25,6 +26,38 @@ from .base_options import COMMON_OPTIONS
     *COMMON_OPTIONS["syspaths"]["args"],
     **COMMON_OPTIONS["syspaths"]["kwargs"]
 )
+@click.option(
+    *COMMON_OPTIONS["archive"]["args"],
+    **COMMON_OPTIONS["archive"]["kwargs"]
+)
+@click.option(
+    *COMMON_OPTIONS["resolver"]["args"],
+    **COMMON_OPTIONS["resolver"]["kwargs"]
+)
+@click.option(
+    *COMMON_OPTIONS["lazy_import"]["args"],
+    **COMMON_OPTIONS["lazy_import"]["kwargs"]
+)
+@click.option(
+    *COMMON_OPTIONS["scan_workers"]["args"],
+    **COMMON_OPTIONS["scan_workers"]["kwargs"]
+)
+@click.option(
+    *COMMON_OPTIONS["profile_imports"]["args"],
+    **COMMON_OPTIONS["profile_imports"]["kwargs"]
+)
+@click.option(
+    *COMMON_OPTIONS["profile_format"]["args"],
+    **COMMON_OPTIONS["profile_format"]["kwargs"]
+)
+@click.option(
+    *COMMON_OPTIONS["workers"]["args"],
+    **COMMON_OPTIONS["workers"]["kwargs"]
+)
+@click.option(
+    *COMMON_OPTIONS["worker_backend"]["args"],
+    **COMMON_OPTIONS["worker_backend"]["kwargs"]
+)
 @click.option(
     "--template",
     type=click.Path(exists=True, file_okay=True, dir_okay=False, path_type=Path),
@@ -121,12 +154,35 @@ def requirements_command(*args, **parameters):
     for item in manifest.syspaths:
         logger.debug("Loading in sys.path: {}".format(item))
 
+    if manifest.archive:
+        logger.debug("Using repository archive: {}".format(manifest.archive))
+
+    logger.debug("Using resolver engine: {}".format(manifest.resolver))
+
     logger.debug("Using template: {}".format(manifest.requirements.template))
     logger.debug("Using source filename: {}".format(
         manifest.requirements.source_filename)
     )
 
-    composer = Composer(manifest, processors=[TextContentProcessor])
+    if parameters["workers"]:
+        logger.debug("Using {workers} {backend} workers".format(
+            workers=parameters["workers"],
+            backend=parameters["worker_backend"],
+        ))
+
+    try:
+        composer = Composer(
+            manifest,
+            processors=[TextContentProcessor],
+            workers=parameters["workers"],
+            worker_backend=parameters["worker_backend"],
+            lazy_import=parameters["lazy_import"],
+            scan_workers=parameters["scan_workers"],
+            profile_imports=parameters["profile_imports"] is not None,
+        )
+    except ComposerError as e:
+        logger.critical(str(e))
+        raise click.Abort()
     composer.resolve_collection(lazy=False)
 
     dump = parameters.get("dump")
@@ -138,3 +194,11 @@ def requirements_command(*args, **parameters):
         ))
     else:
         click.echo(composer.call_processor("TextContentProcessor", "export"))
+
+    if composer.profiler is not None:
+        logger.debug("Import profile written at: {}".format(
+            composer.profiler.write(
+                parameters["profile_imports"],
+                format=parameters["profile_format"],
+            )
+        ))
@@ -1,15 +1,40 @@
+import copy
 import sys
 import inspect
+import weakref
 from pathlib import Path
 
-from .app_storage import AppStore
-from .exceptions import ComposerError
-from .importer import import_module
+from .app_storage import get_engine
+from .archive import install_archive
+from .class_index import ClassIndex, get_checksum
+from .exceptions import ComposerError, ComposerIndexError
+from .executor import AppExecutor
+from .finder import install_finder
+from .importer import import_module, peek_attribute
+from .lockfile import CompositionLock
 from .logger import LoggerBase
 from .manifest import Manifest
+from .marker import get_registered_classes
+from .profiler import ImportProfiler
+from .scanner import get_app_payload, scan_collection
 from .utils.tree_printer import TreePrinter
 
 
+_CLASS_CACHE = weakref.WeakKeyDictionary()
+"""
+Elligible classes cached on their module object, for each composer class and
+discovery configuration (class registry mode, class index and lockfile checksums).
+"""
+
+
+def clear_class_cache():
+    """
+    Clear the elligible classes cache, this is needed if classes have been added or
+    removed from an already inspected module.
+    """
+    _CLASS_CACHE.clear()
+
+
 class Composer(LoggerBase):
     """
     Composer base implements everything about application module discovering and
@@ -29,23 +54,136 @@ class Composer(LoggerBase):
             for ``.json`` or TOML for ``.toml``.
         processors (list): List of available composition processors classes.
 
+    Keyword Arguments:
+        workers (integer): Number of workers used by processors to perform their
+            application work concurrently. Default to ``None`` for a serial execution.
+        worker_backend (string): Kind of worker pool, either ``thread`` or
+            ``process``. The process backend sends the composer to worker processes
+            with each application work so it can not be used with an import profiler
+            or a repository archive. It is only used for work which returns plain
+            data, like from ``TextContentProcessor``, class export always uses
+            threads since classes would be imported again in this process. Default
+            to ``thread``.
+        resolver (string): Name of the resolver engine to use for the application
+            store. If not given, the manifest ``resolver`` value is used.
+        native_import (boolean): If True, application modules are imported with
+            ``importlib.import_module()`` instead of the importer from
+            ``project_composer.importer`` and its spec cache. Default to False.
+        lazy_import (boolean): If True, application modules are imported lazily, their
+            code is only executed once an attribute other than the module metadata is
+            accessed. So an application module which does not define
+            ``DEPENDENCIES`` or ``PUSH_END`` is not executed to be resolved. Default to
+            False.
+        repository_finder (boolean): If True, a ``finder.RepositoryFinder`` is
+            installed for the manifest repository so application modules are found
+            from an index of the repository directory. Default to False.
+        prepend_syspaths (boolean): If True, manifest ``syspaths`` are inserted at
+            the start of ``sys.path`` so they have priority over other paths, else
+            they are appended. Default to False.
+        profile_imports (boolean): If True, application module imports are recorded
+            with a ``profiler.ImportProfiler`` available from attribute ``profiler``.
+            Default to False.
+        scan_workers (integer): If given, application modules are scanned to resolve
+            collection from a short-lived pool of this number of worker processes
+            which only send back application payloads, so application modules are not
+            imported in the current process. Default to ``None`` to scan in the
+            current process.
+        class_registry (boolean): If True, enabled classes from a module are
+            directly taken from the classes registered by ``EnabledApplicationMarker``
+            and defined in this module, the module namespace is only scanned when it
+            does not define any. Be aware that a module which defines marker
+            subclasses then does not expose its classes which only define the
+            ``_ENABLED_COMPOSABLE_APPLICATION`` attribute nor the enabled classes it
+            imports. If False, module namespace is always scanned. Default to False.
+        class_index (string or pathlib.Path or ClassIndex): A class index or the path
+            to a class index file to load. Enabled classes from indexed modules are
+            directly taken from the index, see ``Composer.get_indexed_classes()``. If
+            not given, the manifest ``class_index`` value is used.
+        lockfile (string or pathlib.Path or CompositionLock): A composition lockfile
+            or the path to a lockfile to load. Collection is then resolved from the
+            locked applications without scanning their modules and enabled classes
+            from locked modules are directly taken from the lockfile, see
+            ``Composer.get_locked_classes()``. If not given, the manifest
+            ``lockfile`` value is used.
+
     Attributes:
         _APPLICATION_MODULE_PYTHONPATH (string): A template string to build the full
             Python path of founded class. It expected two variables ``parent`` and
             ``name``, respectively the module path and the class name.
+        profile (string): Profile name for a composer built from
+            ``Composer.compose_profiles()``, else ``None``.
     """
     _APPLICATION_MODULE_PYTHONPATH = "{parent}.{name}"
 
-    def __init__(self, manifest, processors=[]):
+    def __init__(self, manifest, processors=[], workers=None, worker_backend="thread",
+                 resolver=None, native_import=False, lazy_import=False,
+                 repository_finder=False, prepend_syspaths=False,
+                 profile_imports=False, scan_workers=None, class_registry=False,
+                 class_index=None, lockfile=None):
         super().__init__()
 
+        self.native_import = native_import
+        self.lazy_import = lazy_import
+        self.prepend_syspaths = prepend_syspaths
+        self.scan_workers = scan_workers
+        self.class_registry = class_registry
+        self.app_filepaths = {}
+        self.profile = None
+
         self.manifest = self.get_manifest(manifest)
+
+        # Profiler and archive hold locks and file handles which can not be pickled
+        # to worker processes
+        if worker_backend == "process" and (workers or 1) > 1:
+            unpicklable = [
+                name
+                for name, enabled in [
+                    ("profile_imports", profile_imports),
+                    ("archive", self.manifest.archive),
+                ]
+                if enabled
+            ]
+            if unpicklable:
+                msg = (
+                    "Process worker backend can not be used with: {}. Use the "
+                    "thread worker backend instead."
+                )
+                raise ComposerError(msg.format(", ".join(unpicklable)))
+
+        self.profiler = None
+        if profile_imports:
+            self.profiler = ImportProfiler(repository=self.manifest.repository)
         self.set_syspaths(self.manifest.syspaths or [])
 
-        self.store = AppStore(default_app=self.manifest.default_store_app)
+        self.archive = None
+        if self.manifest.archive:
+            self.archive = install_archive(
+                self.manifest.archive,
+                packages=self.get_archive_packages(),
+            ).archive
+
+        self.finder = None
+        if repository_finder:
+            self.finder = self.install_repository_finder()
+
+        self.class_index = self.get_class_index(
+            class_index or self.manifest.class_index
+        )
+        # Checked index entries, a module file is checked once
+        self._index_checks = {}
+        # Repository directory for index entries, False when it can not be found
+        self._index_dirpath = None
+
+        self.lock = self.get_lock(lockfile or self.manifest.lockfile)
+        # Class index and lockfile checksums for the class cache key
+        self._class_cache_checksums = None
+
+        self.store = self.get_store(resolver or self.manifest.resolver)
 
         self.apps = []
 
+        self.executor = AppExecutor(workers=workers, backend=worker_backend)
+
         # Register and initialize all given processors
         self.processors = {
             proc.__name__: proc(self)
@@ -65,18 +203,153 @@ class Composer(LoggerBase):
         """
         return Manifest.load(manifest)
 
+    def get_store(self, resolver=None):
+        """
+        Return the application store from a resolver engine.
+
+        Keyword Arguments:
+            resolver (string): Registered resolver engine name. Default to the
+                reference engine if empty.
+
+        Returns:
+            AppStore: The application store object.
+        """
+        engine = get_engine(resolver)
+
+        return engine(default_app=self.manifest.default_store_app)
+
+    def get_class_index(self, source=None):
+        """
+        Get the class index object.
+
+        Keyword Arguments:
+            source (string or pathlib.Path or ClassIndex): A class index object which
+                is returned as it or a path to a class index file to load.
+
+        Returns:
+            ClassIndex: Class index or ``None`` if no source is given.
+        """
+        if not source or isinstance(source, ClassIndex):
+            return source or None
+
+        return ClassIndex.load(source)
+
+    def get_lock(self, source=None):
+        """
+        Get the composition lockfile object.
+
+        Keyword Arguments:
+            source (string or pathlib.Path or CompositionLock): A lockfile object
+                which is returned as it or a path to a lockfile to load.
+
+        Returns:
+            CompositionLock: Lockfile or ``None`` if no source is given.
+        """
+        if not source or isinstance(source, CompositionLock):
+            return source or None
+
+        return CompositionLock.load(source)
+
     def set_syspaths(self, paths):
         """
-        Append each item path to ``sys.path``.
+        Add each item path to ``sys.path``.
 
-        This won't never append a same path twice.
+        This won't never add a same path twice. Paths are appended at the end of
+        ``sys.path`` except if ``Composer.prepend_syspaths`` is enabled, then they
+        are moved (if already present) or inserted at the start of ``sys.path``, in
+        their given order.
 
         Arguments:
-            paths (list): A list of path to append.
+            paths (list): A list of path to add.
         """
+        if self.prepend_syspaths:
+            paths = list(dict.fromkeys(paths))
+            retained = set(paths)
+            sys.path[:] = paths + [item for item in sys.path if item not in retained]
+            return
+
+        existing = set(sys.path)
         for path in paths:
-            if path not in sys.path:
+            if path not in existing:
                 sys.path.append(path)
+                existing.add(path)
+
+    def install_repository_finder(self):
+        """
+        Install a repository finder for manifest repository.
+
+        Repository package is imported (lazily if lazy import is enabled) to get its
+        directory.
+
+        Returns:
+            finder.RepositoryFinder: Installed finder or ``None`` if manifest does not
+            have a repository or if the repository package can not be found or does
+            not have a single directory.
+        """
+        if not self.manifest.repository:
+            return None
+
+        module = self.find_app_module(self.manifest.repository)
+        spec = peek_attribute(module, "__spec__")
+        locations = list(getattr(spec, "submodule_search_locations", None) or [])
+
+        # Repository from archive is already served from the archive index
+        if len(locations) != 1 or (
+            self.archive and self.archive.contains(locations[0])
+        ):
+            msg = "{klass} is unable to install a finder for repository: {path}"
+            self.log.debug(msg.format(
+                klass=self.__class__.__name__,
+                path=self.manifest.repository,
+            ))
+            return None
+
+        return install_finder(self.manifest.repository, locations[0])
+
+    def path_exists(self, path):
+        """
+        Check if a file or a directory exists, either from the repository archive if
+        path is inside it or from filesystem.
+
+        Arguments:
+            path (string or pathlib.Path): Absolute path.
+
+        Returns:
+            boolean: True if path exists.
+        """
+        if self.archive and self.archive.contains(path):
+            return self.archive.exists(path)
+
+        return Path(path).exists()
+
+    def read_file(self, path, binary=False):
+        """
+        Read a text file, either from the repository archive if path is inside it or
+        from filesystem.
+
+        Arguments:
+            path (string or pathlib.Path): Absolute file path.
+
+        Keyword Arguments:
+            binary (boolean): If True, file content is returned as bytes instead of
+                text.
+
+        Returns:
+            string or bytes: File content or ``None`` if file does not exist.
+        """
+        if self.archive and self.archive.contains(path):
+            if not self.archive.is_file(path):
+                return None
+
+            content = self.archive.read(path)
+
+            return content if binary else content.decode("utf-8")
+
+        path = Path(path)
+        if not path.is_file():
+            return None
+
+        return path.read_bytes() if binary else path.read_text()
 
     def get_application_base_module_path(self, name):
         """
@@ -99,6 +372,19 @@ class Composer(LoggerBase):
 
         return name
 
+    def get_archive_packages(self):
+        """
+        Return the top level package names to load from repository archive.
+
+        Returns:
+            list: The repository top level package or the application top level
+            packages when there is no repository.
+        """
+        if self.manifest.repository:
+            return [self.manifest.repository.split(".")[0]]
+
+        return sorted(set([name.split(".")[0] for name in self.manifest.collection]))
+
     def get_module_path(self, name):
         """
         Return a Python path for a module name.
@@ -116,6 +402,25 @@ class Composer(LoggerBase):
         """
         Find a module (by its pythonpath) from application.
 
+        Arguments:
+            name (string): Module pythonpath.
+
+        Returns:
+            object: Module object if found else None.
+        """
+        if self.profiler is None:
+            return self._import_app_module(name)
+
+        with self.profiler.record(name) as record:
+            module = self._import_app_module(name)
+            record["found"] = module is not None
+
+        return module
+
+    def _import_app_module(self, name):
+        """
+        Import a module with the composer import mode.
+
         Arguments:
             name (string): Module pythonpath.
 
@@ -123,7 +428,11 @@ class Composer(LoggerBase):
             object: Module object if found else None.
         """
         try:
-            module = import_module(name)
+            module = import_module(
+                name,
+                native=self.native_import,
+                lazy=self.lazy_import,
+            )
         except ModuleNotFoundError:
             msg = "{klass} is unable to find module: {path}".format(
                 klass=self.__class__.__name__,
@@ -164,6 +473,17 @@ class Composer(LoggerBase):
         """
         Get all elligible classes from a module.
 
+        With the class registry enabled, the registered marker classes defined in
+        module are used. Else or if there is none, every module namespace object is
+        checked, this is the only way to find classes which only define the
+        ``_ENABLED_COMPOSABLE_APPLICATION`` attribute or classes imported from other
+        modules.
+
+        Results are cached on module object, so a module is inspected once for each
+        composer class and discovery configuration, see
+        ``Composer.get_class_cache_key()``. Debug messages are only emitted on the
+        first inspection.
+
         Arguments:
             path (string): The Python path to a module used for reporting and logging
                 messages.
@@ -172,26 +492,258 @@ class Composer(LoggerBase):
         Returns:
             list: List of elligible classes objects.
         """
-        enabled = []
-
         if not hasattr(module, "__dict__"):
             msg = "Module object from '{}' must have a '__dict__' attribute."
             raise ComposerError(msg.format(path))
 
-        for object_name in module.__dict__.keys():
-            if not object_name.startswith("_"):
-                obj = getattr(module, object_name)
+        try:
+            cached = _CLASS_CACHE.setdefault(module, {})
+        except TypeError:
+            # Object does not support weak references
+            cached = {}
+
+        key = self.get_class_cache_key()
+        if key not in cached:
+            cached[key] = tuple(self._find_elligible_module_classes(path, module))
+
+        return list(cached[key])
+
+    def get_class_cache_key(self):
+        """
+        Get the key of elligible classes cached for this composer.
+
+        Composer class is part of the key since it may override the eligibility
+        rules, like ``Composer._is_elligible_class()``. Class index and lockfile are
+        keyed on their content checksum, computed once, so composers with equal
+        configurations share their cached classes.
+
+        Returns:
+            tuple: Composer class, class registry mode, class index checksum and
+            lockfile checksum.
+        """
+        if self._class_cache_checksums is None:
+            self._class_cache_checksums = tuple([
+                None if item is None else item.get_content_checksum()
+                for item in (self.class_index, self.lock)
+            ])
+
+        return (type(self), self.class_registry) + self._class_cache_checksums
+
+    def _find_elligible_module_classes(self, path, module):
+        """
+        Inspect a module to find its elligible classes.
+
+        Arguments:
+            path (string): The Python path to a module used for reporting and logging
+                messages.
+            module (object): The module object where to find elligible classes.
+
+        Returns:
+            list: List of elligible classes objects.
+        """
+        locked = self.get_locked_classes(path, module)
+        if locked is not None:
+            return locked
+
+        indexed = self.get_indexed_classes(path, module)
+        if indexed is not None:
+            return indexed
+
+        enabled = []
+
+        if self.class_registry:
+            # Only the registered classes still reachable from module are kept, like
+            # the namespace scan does
+            enabled = [
+                obj
+                for obj in get_registered_classes(module.__name__)
+                if (
+                    not obj.__name__.startswith("_") and
+                    module.__dict__.get(obj.__name__) is obj and
+                    self._is_elligible_class(obj)
+                )
+            ]
+
+            for obj in enabled:
+                msg = "{klass} found enabled Class at: {path}.{object_name}".format(
+                    klass=self.__class__.__name__,
+                    path=path,
+                    object_name=obj.__name__,
+                )
+                self.log.debug(msg)
+
+            if enabled:
+                return enabled
+
+        seen = set([])
+
+        for object_name, obj in list(module.__dict__.items()):
+            if not object_name.startswith("_") and self._is_elligible_class(obj):
+                msg = "{klass} found enabled Class at: {path}.{object_name}".format(
+                    klass=self.__class__.__name__,
+                    path=path,
+                    object_name=object_name,
+                )
+                self.log.debug(msg)
+
+                if obj not in seen:
+                    seen.add(obj)
+                    enabled.append(obj)
+
+        return enabled
+
+    def get_indexed_entry(self, path):
+        """
+        Get the class index entry of a module, without importing it.
+
+        Module file checksum must match the indexed one, this is checked once for each
+        module file. Indexed classes follow the class registry discovery rules, so
+        without the class registry an entry is only used if its classes are the ones
+        a namespace scan would find.
+
+        Arguments:
+            path (string): The Python path to a module.
+
+        Returns:
+            dict: Index entry or ``None`` if module can not be resolved from the
+            index and must be inspected.
+        """
+        if self.class_index is None:
+            return None
+
+        entry = self.class_index.modules.get(path)
+        if (
+            not entry or entry.get("classes") is None or
+            not (self.class_registry or entry.get("namespace"))
+        ):
+            return None
+
+        if path not in self._index_checks:
+            self._index_checks[path] = self._check_indexed_entry(path, entry)
+
+        return entry if self._index_checks[path] else None
+
+    def _check_indexed_entry(self, path, entry):
+        """
+        Check an index entry checksum against its module file.
+
+        Arguments:
+            path (string): The Python path to a module.
+            entry (dict): Index entry.
+
+        Returns:
+            boolean: True if module file matches entry.
+        """
+        if self._index_dirpath is None:
+            try:
+                self._index_dirpath = ClassIndex.get_repository_dirpath(self)
+            except ComposerIndexError:
+                self._index_dirpath = False
+
+        content = None
+        if self._index_dirpath:
+            content = self.read_file(
+                self._index_dirpath / entry["filepath"],
+                binary=True,
+            )
+
+        if content is None or get_checksum(content) != entry["checksum"]:
+            msg = "{klass} has a stale index entry for module: {path}".format(
+                klass=self.__class__.__name__,
+                path=path,
+            )
+            self.log.debug(msg)
+            return False
+
+        return True
+
+    def get_indexed_classes(self, path, module):
+        """
+        Get elligible classes of a module from the class index.
+
+        Every indexed class must still be an elligible class defined in module, else
+        the index entry is considered as stale.
+
+        Arguments:
+            path (string): The Python path to a module used for reporting and logging
+                messages.
+            module (object): The module object where to get indexed classes.
+
+        Returns:
+            list: List of elligible classes objects or ``None`` if module can not be
+            resolved from the index and must be inspected.
+        """
+        entry = self.get_indexed_entry(module.__name__)
+        if entry is None:
+            return None
+
+        enabled = [getattr(module, name, None) for name in entry["classes"]]
+
+        if not all([
+            self._is_elligible_class(obj) and obj.__module__ == module.__name__
+            for obj in enabled
+        ]):
+            msg = "{klass} has a stale index entry for module: {path}".format(
+                klass=self.__class__.__name__,
+                path=path,
+            )
+            self.log.debug(msg)
+            return None
+
+        for obj in enabled:
+            msg = "{klass} found indexed Class at: {path}.{object_name}".format(
+                klass=self.__class__.__name__,
+                path=path,
+                object_name=obj.__name__,
+            )
+            self.log.debug(msg)
+
+        return enabled
+
+    def get_locked_classes(self, path, module):
+        """
+        Get elligible classes of a module from the lockfile.
+
+        Locked classes are imported from their module and must still be elligible
+        classes, else the lockfile entry is considered as stale. Module file checksum
+        is not checked, use the ``lock`` command verification to detect changes.
+
+        Arguments:
+            path (string): The Python path to a module used for reporting and logging
+                messages.
+            module (object): The module object where to get locked classes.
+
+        Returns:
+            list: List of elligible classes objects or ``None`` if module is not
+            locked or has a stale entry and must be inspected.
+        """
+        if self.lock is None or module.__name__ not in self.lock.modules:
+            return None
+
+        enabled = []
+        for item in self.lock.modules[module.__name__]["classes"]:
+            module_path, _, qualname = item.partition(":")
+
+            obj = module
+            if module_path != module.__name__:
+                obj = self.find_app_module(module_path)
 
-                if self._is_elligible_class(obj):
-                    msg = "{klass} found enabled Class at: {path}.{object_name}".format(
-                        klass=self.__class__.__name__,
-                        path=path,
-                        object_name=object_name,
-                    )
-                    self.log.debug(msg)
+            for name in qualname.split("."):
+                obj = getattr(obj, name, None)
+
+            if not self._is_elligible_class(obj):
+                msg = "{klass} has a stale lockfile entry for module: {path}"
+                self.log.debug(msg.format(klass=self.__class__.__name__, path=path))
+                return None
+
+            msg = "{klass} found locked Class at: {path}.{object_name}".format(
+                klass=self.__class__.__name__,
+                path=path,
+                object_name=obj.__name__,
+            )
+            self.log.debug(msg)
 
-                    if obj not in enabled:
-                        enabled.append(obj)
+            enabled.append(obj)
 
         return enabled
 
@@ -216,20 +768,61 @@ class Composer(LoggerBase):
             )
             self.log.debug(msg)
 
-            payload = {
-                "name": name,
-                "filepath": module.__file__
-            }
+            return get_app_payload(name, module)
 
-            if hasattr(module, "DEPENDENCIES"):
-                payload["dependencies"] = getattr(module, "DEPENDENCIES")
+        return None
 
-            if hasattr(module, "PUSH_END"):
-                payload["push_end"] = getattr(module, "PUSH_END")
+    def _scan_collection(self, names):
+        """
+        Scan application modules from worker processes.
 
-            return payload
+        Arguments:
+            names (list): Application names.
 
-        return None
+        Returns:
+            list: Application payloads, ``None`` for applications not found.
+        """
+        paths = [self.get_module_path(name) for name in names]
+
+        payloads = scan_collection(
+            list(zip(names, paths)),
+            workers=self.scan_workers,
+            native=self.native_import,
+            lazy=self.lazy_import,
+            archive=self.archive.path if self.archive else None,
+            archive_packages=self.get_archive_packages() if self.archive else None,
+        )
+
+        for path, payload in zip(paths, payloads):
+            if payload:
+                msg = "{klass} found application at: {path}"
+            else:
+                msg = "{klass} is unable to find module: {path}"
+
+            self.log.debug(msg.format(klass=self.__class__.__name__, path=path))
+
+        return payloads
+
+    def get_app_filepath(self, name):
+        """
+        Get the module file path of an application.
+
+        Arguments:
+            name (string): Application name.
+
+        Returns:
+            string: Module file path from the collection scan if any, else the
+            application module is searched. ``None`` if the module or its file have
+            not been found.
+        """
+        if name in self.app_filepaths:
+            return self.app_filepaths[name]
+
+        module = self.find_app_module(self.get_module_path(name))
+        if not module:
+            return None
+
+        return peek_attribute(module, "__file__")
 
     def call_processor(self, name, method, **kwargs):
         """
@@ -263,17 +856,60 @@ class Composer(LoggerBase):
                 objects instead of name strings. If False, the resolving will be
                 processed. Default is ``True``.
 
+        With a lockfile, application modules are not scanned and the locked
+        applications are used in their locked order, unless in lazy mode.
+
         Returns:
             list: List of ``AppNode`` objects.
         """
-        collection = []
+        if self.lock is not None:
+            self.app_filepaths = {}
+            collection = self.lock.get_payloads(self.manifest, lazy=lazy)
+
+            for item in collection:
+                msg = "{klass} found locked application: {name}"
+                self.log.debug(msg.format(
+                    klass=self.__class__.__name__,
+                    name=item["name"],
+                ))
+
+            # Locked order is already resolved
+            self._resolve_payloads(collection, lazy=True)
+
+            return collection
+
+        if self.scan_workers:
+            payloads = self._scan_collection(self.manifest.collection)
+            # Application files are kept since their modules are not imported here
+            self.app_filepaths = {
+                item["name"]: item["filepath"]
+                for item in payloads
+                if item
+            }
+        else:
+            self.app_filepaths = {}
+            payloads = [
+                self._scan_app_module(name)
+                for name in self.manifest.collection
+            ]
 
-        for name in self.manifest.collection:
-            payload = self._scan_app_module(name)
-            # Ignore unfound application
-            if payload:
-                collection.append(payload)
+        # Ignore unfound application
+        collection = [item for item in payloads if item]
+
+        self._resolve_payloads(collection, lazy=lazy)
 
+        return collection
+
+    def _resolve_payloads(self, collection, lazy=True):
+        """
+        Resolve application payloads with AppStore into ``Composer.apps``.
+
+        Arguments:
+            collection (list): Application payloads.
+
+        Keyword Arguments:
+            lazy (boolean): See ``Composer.resolve_collection()``.
+        """
         if lazy:
             self.apps = self.store.resolve(
                 collection,
@@ -285,7 +921,142 @@ class Composer(LoggerBase):
                 no_ordering=self.manifest.no_ordering
             )
 
-        return collection
+    def compose_profiles(self, profiles, lazy=True):
+        """
+        Build a composer for each profile of a collection in a single pass.
+
+        A profile is a collection of applications from the same repository, like for
+        a web server or a task worker. Applications from every profiles are scanned
+        once, then each profile composer resolves its own collection from these
+        results. Profile composers share everything from this composer except their
+        manifest collection, application store and processors, and since they use the
+        same modules, class discovery results are shared too.
+
+        Arguments:
+            profiles (dict): Collections of application names indexed on their
+                profile name.
+
+        Keyword Arguments:
+            lazy (boolean): See ``Composer.resolve_collection()``.
+
+        Returns:
+            dict: Composers with resolved applications, indexed on their profile
+            name.
+        """
+        names = list(dict.fromkeys([
+            name
+            for collection in profiles.values()
+            for name in collection
+        ]))
+
+        if self.scan_workers:
+            payloads = self._scan_collection(names)
+        else:
+            payloads = [self._scan_app_module(name) for name in names]
+
+        payloads = dict(zip(names, payloads))
+
+        composers = {}
+        for profile, collection in profiles.items():
+            composer = copy.copy(self)
+            composer.profile = profile
+            composer.manifest = copy.copy(self.manifest)
+            composer.manifest.collection = list(collection)
+            composer.store = self.store.__class__(
+                default_app=self.manifest.default_store_app
+            )
+            composer.processors = {
+                name: proc.__class__(composer)
+                for name, proc in self.processors.items()
+            }
+
+            # Payloads are copied since they are used to build application nodes
+            collection = [
+                copy.deepcopy(payloads[name])
+                for name in collection
+                if payloads[name]
+            ]
+            composer.app_filepaths = {
+                item["name"]: item["filepath"]
+                for item in collection
+            } if self.scan_workers else {}
+
+            composer._resolve_payloads(collection, lazy=lazy)
+            composers[profile] = composer
+
+        return composers
+
+    def get_app_levels(self):
+        """
+        Group resolved applications into dependency levels.
+
+        Applications from a level only depend on applications from previous levels.
+        Collection must have been resolved without the lazy mode and without the
+        manifest ``no_ordering`` option.
+
+        Returns:
+            list: List of levels, each level is a list of ``AppNode`` objects.
+        """
+        return self.store.get_levels(self.apps)
+
+    def has_resolved_order(self):
+        """
+        Check if applications are in a resolved order.
+
+        Returns:
+            boolean: True if every application is after all of its dependencies,
+            this is commonly not the case with the lazy mode.
+        """
+        positions = {node.name: i for i, node in enumerate(self.apps)}
+
+        return all([
+            positions.get(dependency.name, -1) < positions[node.name]
+            for node in self.apps
+            for dependency in node.dependencies
+        ])
+
+    def map_apps(self, func, *args, plain=True):
+        """
+        Execute a callable on each resolved application.
+
+        With multiple workers, applications are processed concurrently level by level
+        so an application is never processed before its dependencies. Applications
+        which are not in a resolved order (like from the lazy mode) are processed
+        serially like without workers. Results are always returned in the resolved
+        application order.
+
+        Arguments:
+            func (callable): Callable to execute, it receives an ``AppNode`` as first
+                positional argument followed by ``args`` items.
+            *args: Additional positional arguments to give to the callable.
+
+        Keyword Arguments:
+            plain (boolean): If False, callable results are not plain data, like
+                classes which would be imported again in this process, so the thread
+                backend is used even if the process backend is enabled. Default to
+                True.
+
+        Returns:
+            list: Callable results in the same order than ``Composer.apps``.
+        """
+        if not self.executor.concurrent:
+            return self.executor.run(func, self.apps, args=args)
+
+        # Applications from lazy resolving may be before their dependencies
+        if not self.has_resolved_order():
+            return [func(node, *args) for node in self.apps]
+
+        # Import the repository package once before workers need it
+        if self.manifest.repository:
+            self.find_app_module(self.manifest.repository)
+
+        return self.executor.run(
+            func,
+            self.apps,
+            levels=self.get_app_levels(),
+            args=args,
+            backend=None if plain else "thread",
+        )
 
     def check(self, lazy=True, printer=None):
         """
@@ -328,9 +1099,15 @@ class Composer(LoggerBase):
         printer("🌐 Repository directory")
         repository_mod = self.find_app_module(self.manifest.repository)
         if repository_mod:
-            repository_dirpath = Path(repository_mod.__file__).parents[0]
-
-            printer("X", repository_dirpath, yes_or_no=repository_dirpath.exists())
+            repository_dirpath = Path(
+                peek_attribute(repository_mod, "__file__")
+            ).parents[0]
+
+            printer(
+                "X",
+                repository_dirpath,
+                yes_or_no=self.path_exists(repository_dirpath),
+            )
 
             last = len(self.manifest.collection)
             for i, item in enumerate(self.manifest.collection, start=1):
@@ -338,7 +1115,7 @@ class Composer(LoggerBase):
                 printer(
                     "OX" if (i == last) else "OT",
                     app_dirpath,
-                    yes_or_no=app_dirpath.exists(),
+                    yes_or_no=self.path_exists(app_dirpath),
                 )
         else:
             printer("X", "Unable to find repository directory")
@@ -373,3 +1150,8 @@ class Composer(LoggerBase):
         # Call for processors check
         for name, proc in self.processors.items():
             proc.check(printer=printer)
+
+        if self.profiler is not None:
+            printer()
+            printer("⏱️ Import profile")
+            self.profiler.print_table(printer)
@@ -1,3 +1,5 @@
+import time
+
 from ...logger import LoggerBase
 
 
@@ -26,3 +28,94 @@ class ApplicationUrlCollector(LoggerBase):
         patterns = self.load_urlpatterns(urlpatterns)
 
         return patterns
+
+
+class FlatUrlCollector(LoggerBase):
+    """
+    Url patterns collector which calls the ``load_urlpatterns`` method of each
+    application urls class on its own, instead of a ``super()`` chain through a
+    class composed from all of them.
+
+    Each class is composed with the base classes only, its ``load_urlpatterns``
+    method is called with an empty list and the results are concatenated. It gives
+    the same url patterns than ``ApplicationUrlCollector.collect()`` on a composed
+    class when every class calls ``super().load_urlpatterns(urlpatterns)`` first,
+    and an application class which does not call it does not drop the url patterns
+    from other applications.
+
+    Arguments:
+        classes (list): Application urls classes in application order, like
+            exported from ``DjangoUrlsProcessor``.
+
+    Keyword Arguments:
+        settings (django.conf.settings): Django settings to give to the classes.
+        base_classes (list): A list of base classes inheritage to build each class,
+            it should include ``ApplicationUrlCollector``. Default to empty list.
+        name (string): Class name to set. Default to ``ComposedProjectUrls``.
+        timing (boolean): If True, each class call is timed into attribute
+            ``timings``. Default to False.
+
+    Attributes:
+        timings (list): Each timed call as a dictionnary with items ``name`` (the
+            class Python path), ``time`` (in seconds) and ``count`` (the number of
+            collected url patterns). It is filled in collecting order.
+    """
+    def __init__(self, classes, settings=None, base_classes=None, name=None,
+                 timing=False):
+        self.classes = classes
+        self.settings = settings
+        self.base_classes = base_classes or []
+        self.name = name or "ComposedProjectUrls"
+        self.timing = timing
+        self.timings = []
+
+        super().__init__()
+
+    def get_collector(self, klass):
+        """
+        Build collector object for an application urls class.
+
+        Arguments:
+            klass (class): Application urls class.
+
+        Returns:
+            object: Instance of the class composed with the base classes.
+        """
+        composed = type(self.name, tuple([klass] + self.base_classes), {})
+
+        return composed(self.settings)
+
+    def collect(self, urlpatterns=None):
+        """
+        Collect url patterns from every application urls classes.
+
+        Classes are called in the reverse order of application classes since a
+        ``super()`` chain collects the url patterns from the last class first.
+
+        Keyword Arguments:
+            urlpatterns (list): Initial url patterns. Default to an empty list.
+
+        Returns:
+            list: Collected url patterns.
+        """
+        self.log.debug("Application urls flat collector processing")
+        urlpatterns = list(urlpatterns or [])
+        self.timings = []
+
+        for klass in reversed(self.classes):
+            collector = self.get_collector(klass)
+
+            if not self.timing:
+                urlpatterns.extend(collector.load_urlpatterns([]))
+                continue
+
+            start = time.perf_counter()
+            collected = collector.load_urlpatterns([])
+            self.timings.append({
+                "name": "{}.{}".format(klass.__module__, klass.__qualname__),
+                "time": time.perf_counter() - start,
+                "count": len(collected),
+            })
+            urlpatterns.extend(collected)
+
+        return urlpatterns
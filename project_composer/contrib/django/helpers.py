@@ -1,3 +1,5 @@
+from .collector import FlatUrlCollector
+
 
 def project_settings(composer, base_classes=None, name=None):
     """
@@ -28,7 +30,8 @@ def project_settings(composer, base_classes=None, name=None):
     return type(name, tuple(classes + base_classes), {})
 
 
-def project_urls(composer, settings, base_classes=None, name=None):
+def project_urls(composer, settings, base_classes=None, name=None, grouped=False,
+                 lazy=False, flat=False):
     """
     Build composed urls collector class for given composer.
 
@@ -40,6 +43,18 @@ def project_urls(composer, settings, base_classes=None, name=None):
         base_classes (list): A list of base classes inheritage to build the settings
             class. Default to empty list.
         name (string): Class name to set. Default to ``ComposedProjectSettings``.
+        grouped (boolean): If True, collected url patterns are grouped on their static
+            route prefix into nested includes, see
+            ``routing.group_urlpatterns()``. Default to False.
+        lazy (boolean): If True, applications which declare an url prefix (see
+            ``DjangoUrlsProcessor.get_url_prefix()``) get a lazy include on their
+            prefix so their urls module is only imported once a request path
+            matches it, see ``lazy.lazy_include()``. A lazy include is placed where
+            the application url patterns would have been collected. Default to
+            False.
+        flat (boolean): If True, url patterns are collected with a
+            ``collector.FlatUrlCollector`` which calls each application urls class
+            on its own instead of a ``super()`` chain. Default to False.
 
     Returns:
         list: List of collected url patterns (like ``django.urls.path`` or
@@ -48,12 +63,83 @@ def project_urls(composer, settings, base_classes=None, name=None):
     base_classes = base_classes or []
     name = name or "ComposedProjectUrls"
 
+    def placeholder(node, prefix):
+        # Imported here since it requires Django which is not a dependency
+        from .lazy import lazy_urls_class
+
+        return lazy_urls_class(
+            composer.processors["DjangoUrlsProcessor"],
+            node,
+            prefix,
+            settings,
+            base_classes=base_classes,
+            name=name,
+        )
+
     # Search for all enabled classes
-    classes = composer.call_processor("DjangoUrlsProcessor", "export")
+    classes = composer.call_processor(
+        "DjangoUrlsProcessor",
+        "export",
+        lazy=lazy,
+        placeholder=placeholder if lazy else None,
+    )
 
-    # Build Urls class from composed urls
-    composed = type(name, tuple(classes + base_classes), {})
+    if flat:
+        mounter = FlatUrlCollector(
+            classes,
+            settings=settings,
+            base_classes=base_classes,
+            name=name,
+        )
+    else:
+        # Build Urls class from composed urls
+        composed = type(name, tuple(classes + base_classes), {})
+        mounter = composed(settings)
 
     # Collect and return applications urls
-    mounter = composed(settings)
-    return mounter.collect()
+    urlpatterns = mounter.collect()
+
+    if grouped:
+        # Imported here since it requires Django which is not a dependency
+        from .routing import group_urlpatterns
+
+        urlpatterns = group_urlpatterns(urlpatterns)
+
+    return urlpatterns
+
+
+def project_profiles(composers, settings=None, settings_base_classes=None,
+                     urls_base_classes=None):
+    """
+    Build composed settings class and url patterns for each profile.
+
+    Arguments:
+        composers (dict): Profile composers as returned from
+            ``Composer.compose_profiles()``.
+
+    Keyword Arguments:
+        settings (django.conf.settings): Django settings to give to the urls
+            collectors, url patterns are not collected if not given.
+        settings_base_classes (list): Base classes for ``project_settings()``.
+        urls_base_classes (list): Base classes for ``project_urls()``.
+
+    Returns:
+        dict: Items ``settings`` (the composed settings class) and ``urlpatterns``
+        (the url patterns or ``None``) indexed on their profile name.
+    """
+    profiles = {}
+
+    for profile, composer in composers.items():
+        profiles[profile] = {
+            "settings": project_settings(
+                composer,
+                base_classes=settings_base_classes,
+            ),
+            "urlpatterns": None if settings is None else project_urls(
+                composer,
+                settings,
+                base_classes=urls_base_classes,
+            ),
+        }
+
+    return profiles
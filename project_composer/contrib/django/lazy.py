@@ -0,0 +1,165 @@
+"""
+Lazy includes for application urls.
+
+An application which declares an url prefix with variable ``URL_PREFIX`` in its base
+module gets a placeholder include on this prefix instead of its url patterns. Its
+urls module, and so the views it imports, are only imported once a request path
+matches the prefix. The include is added by a placeholder urls class which takes
+the place of the application urls classes, so it keeps the position the application
+url patterns have when they are collected.
+
+Be aware that Django needs every url pattern to reverse an url, so the first
+``reverse()`` call loads every lazy application urls.
+"""
+from functools import cached_property
+
+from django.urls.resolvers import RoutePattern, URLResolver
+
+from ...exceptions import ComposerError
+from .routing import strip_prefix
+
+
+class LazyAppUrlconf:
+    """
+    Placeholder urlconf which collects url patterns of an application urls classes
+    once they are accessed.
+
+    Arguments:
+        processor (DjangoUrlsProcessor): Processor to find application urls classes.
+        node (AppNode): Application.
+        prefix (string): Application url prefix.
+        settings (django.conf.settings): Django settings to give to the collector.
+
+    Keyword Arguments:
+        base_classes (list): A list of base classes inheritage to build the urls
+            class. Default to empty list.
+        name (string): Class name to set. Default to ``ComposedProjectUrls``.
+    """
+    def __init__(self, processor, node, prefix, settings, base_classes=None,
+                 name=None):
+        self.processor = processor
+        self.node = node
+        self.prefix = prefix
+        self.settings = settings
+        self.base_classes = base_classes or []
+        self.name = name or "ComposedProjectUrls"
+
+    def __repr__(self):
+        return "<{klass}: {name}>".format(
+            klass=self.__class__.__name__,
+            name=self.node.name,
+        )
+
+    @cached_property
+    def urlpatterns(self):
+        """
+        Collect application url patterns without the prefix from their routes.
+
+        Returns:
+            list: Url patterns.
+        """
+        classes = self.processor.get_app_classes(self.node)
+
+        composed = type(self.name, tuple(classes + self.base_classes), {})
+        urlpatterns = composed(self.settings).collect()
+
+        stripped = []
+        for entry in urlpatterns:
+            if (
+                not isinstance(entry.pattern, RoutePattern) or
+                not str(entry.pattern).startswith(self.prefix)
+            ):
+                msg = (
+                    "Url pattern '{pattern}' from application '{name}' does not start "
+                    "with its prefix: {prefix}"
+                )
+                raise ComposerError(msg.format(
+                    pattern=entry.pattern,
+                    name=self.node.name,
+                    prefix=self.prefix,
+                ))
+
+            stripped.append(strip_prefix(entry, self.prefix))
+
+        return stripped
+
+
+def lazy_include(processor, node, prefix, settings, base_classes=None, name=None):
+    """
+    Build a lazy include for an application urls.
+
+    Arguments:
+        processor (DjangoUrlsProcessor): Processor to find application urls classes.
+        node (AppNode): Application.
+        prefix (string): Application url prefix, it must be static, without any
+            converter.
+        settings (django.conf.settings): Django settings to give to the collector.
+
+    Keyword Arguments:
+        base_classes (list): A list of base classes inheritage to build the urls
+            class. Default to empty list.
+        name (string): Class name to set. Default to ``ComposedProjectUrls``.
+
+    Returns:
+        django.urls.URLResolver: Resolver on the prefix with a ``LazyAppUrlconf``.
+    """
+    if "<" in prefix:
+        msg = "Url prefix from application '{name}' must be static: {prefix}"
+        raise ComposerError(msg.format(name=node.name, prefix=prefix))
+
+    return URLResolver(
+        RoutePattern(prefix, is_endpoint=False),
+        LazyAppUrlconf(
+            processor,
+            node,
+            prefix,
+            settings,
+            base_classes=base_classes,
+            name=name,
+        ),
+    )
+
+
+def lazy_urls_class(processor, node, prefix, settings, base_classes=None,
+                    name=None):
+    """
+    Build a placeholder urls class with the lazy include of an application.
+
+    The class adds the include after the url patterns from the next classes, like an
+    application urls class which calls ``super().load_urlpatterns(urlpatterns)``
+    first.
+
+    Arguments:
+        processor (DjangoUrlsProcessor): Processor to find application urls classes.
+        node (AppNode): Application.
+        prefix (string): Application url prefix, see ``lazy_include()``.
+        settings (django.conf.settings): Django settings to give to the collector.
+
+    Keyword Arguments:
+        base_classes (list): A list of base classes inheritage to build the urls
+            class. Default to empty list.
+        name (string): Class name to set. Default to ``ComposedProjectUrls``.
+
+    Returns:
+        class: Placeholder urls class named after the application.
+    """
+    include = lazy_include(
+        processor,
+        node,
+        prefix,
+        settings,
+        base_classes=base_classes,
+        name=name,
+    )
+
+    # Each placeholder defines its own method since they are chained together
+    class LazyAppUrls:
+        def load_urlpatterns(self, urlpatterns):
+            urlpatterns = super().load_urlpatterns(urlpatterns)
+            return urlpatterns + [include]
+
+    LazyAppUrls.__name__ = LazyAppUrls.__qualname__ = "{}LazyAppUrls".format(
+        node.name
+    )
+
+    return LazyAppUrls
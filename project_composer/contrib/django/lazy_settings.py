@@ -0,0 +1,138 @@
+"""
+Lazy values for application settings classes.
+
+A setting declared with ``LazySetting`` is computed on its first access instead of
+when its class is defined, then its value is cached for the composed settings class
+it has been accessed from. So an expensive value is never computed if it is not
+used, like when a later application class overrides the same setting.
+
+Example: ::
+
+    class BlogSettings(EnabledApplicationMarker):
+        @LazySetting
+        def BLOG_TEMPLATES(settings):
+            return scan_templates(settings.BASE_DIR)
+
+The decorated function receives the composed settings class (or the settings object
+if accessed from an instance), so it can use settings from other applications.
+
+Be aware that Django copies every uppercase setting from the settings module, so a
+lazy setting which is exposed to Django is computed once Django loads its settings.
+"""
+import threading
+import weakref
+
+
+class LazySetting:
+    """
+    Descriptor for a setting value computed on its first access.
+
+    Arguments:
+        func (callable): Function to compute value, it receives the composed settings
+            class or the settings object.
+
+    Attributes:
+        name (string): Setting name, it is set once the descriptor is assigned in a
+            class.
+        owner (class): The class where the setting has been declared.
+    """
+    def __init__(self, func):
+        self.func = func
+        self.name = getattr(func, "__name__", None)
+        self.owner = None
+        self.__doc__ = getattr(func, "__doc__", None)
+        self._values = weakref.WeakKeyDictionary()
+        self._lock = threading.RLock()
+
+    def __set_name__(self, owner, name):
+        self.name = name
+        self.owner = owner
+
+    def __repr__(self):
+        return "<{klass}: {name}>".format(
+            klass=self.__class__.__name__,
+            name=self.name,
+        )
+
+    def __get__(self, instance, owner=None):
+        owner = owner or type(instance)
+
+        try:
+            return self._values[owner]
+        except KeyError:
+            pass
+
+        with self._lock:
+            if owner not in self._values:
+                self._values[owner] = self.func(
+                    owner if instance is None else instance
+                )
+
+            return self._values[owner]
+
+    def is_evaluated(self, klass):
+        """
+        Arguments:
+            klass (class): Settings class.
+
+        Returns:
+            boolean: True if value has already been computed for this class.
+        """
+        return klass in self._values
+
+    def reset(self, klass=None):
+        """
+        Clear cached values.
+
+        Keyword Arguments:
+            klass (class): Only clear the value for this settings class. Default to
+                clear every values.
+        """
+        with self._lock:
+            if klass is None:
+                self._values.clear()
+            else:
+                self._values.pop(klass, None)
+
+
+def get_lazy_settings(klass):
+    """
+    Get the lazy settings which are resolved from a settings class.
+
+    A lazy setting overridden by another class in the class inheritance is not
+    included, since it can not be accessed from this class.
+
+    Arguments:
+        klass (class): Settings class, commonly a composed settings class.
+
+    Returns:
+        dict: ``LazySetting`` objects indexed on their setting name.
+    """
+    settings = {}
+
+    for base in reversed(klass.__mro__):
+        for name, value in vars(base).items():
+            if isinstance(value, LazySetting):
+                settings[name] = value
+            else:
+                settings.pop(name, None)
+
+    return settings
+
+
+def get_unaccessed_settings(klass):
+    """
+    Get the names of lazy settings which have never been accessed from a settings
+    class.
+
+    Arguments:
+        klass (class): Settings class, commonly a composed settings class.
+
+    Returns:
+        list: Sorted setting names.
+    """
+    return sorted([
+        name
+        for name, setting in get_lazy_settings(klass).items()
+        if not setting.is_evaluated(klass)
+    ])
@@ -0,0 +1,355 @@
+"""
+Preload composition in the master process of a pre-fork server.
+
+Pre-fork servers like Gunicorn or uWSGI start their workers by forking a master
+process. Without preloading, every worker loads the manifest, resolves applications,
+imports their modules and builds the settings and urls classes after the fork, so
+each worker pays the boot time and holds its own copy of these objects.
+
+``preload()`` performs the whole composition in the master process then freezes the
+garbage collector with ``gc.freeze()``, so objects are moved to a permanent
+generation that the collector does not visit anymore. Workers then inherit the
+composition with copy-on-write memory pages which are not touched by the collector,
+and they get it back from ``get_preloaded()`` instead of composing again.
+
+For example with Gunicorn, from its configuration file: ::
+
+    from project_composer.compose import Composer
+    from project_composer.contrib.django.preload import preload
+    from project_composer.contrib.django.processors import (
+        DjangoSettingsProcessor, DjangoUrlsProcessor
+    )
+
+    preload_app = True
+
+    def on_starting(server):
+        preload(Composer(
+            "pyproject.toml",
+            processors=[DjangoSettingsProcessor, DjangoUrlsProcessor],
+        ))
+
+And from the project settings module: ::
+
+    from project_composer.compose import Composer
+    from project_composer.contrib.django.helpers import project_settings
+    from project_composer.contrib.django.preload import get_preloaded
+    from project_composer.contrib.django.processors import DjangoSettingsProcessor
+
+    preloaded = get_preloaded("Sample")
+    if preloaded:
+        ComposedProjectSettings = preloaded["settings"]
+    else:
+        composer = Composer(
+            "pyproject.toml",
+            processors=[DjangoSettingsProcessor],
+        )
+        composer.resolve_collection(lazy=False)
+        ComposedProjectSettings = project_settings(composer)
+
+Savings can be measured with ``measure_preload()``, it compares the boot time and
+the private memory of forked workers with and without preloading. Private memory is
+the memory which is not shared with the master process, it is only available on
+Linux.
+"""
+import gc
+import json
+import os
+import sys
+import time
+
+from ...compose import clear_class_cache
+from ...exceptions import ComposerError
+from ...processors import ClassProcessor
+
+from .helpers import project_settings, project_urls
+
+
+PRELOADED = {}
+"""
+Preloaded compositions indexed on their manifest name.
+"""
+
+
+def get_rss():
+    """
+    Get the resident memory of current process.
+
+    Returns:
+        integer: Resident memory in bytes or ``None`` if it can not be read.
+    """
+    try:
+        with open("/proc/self/statm") as fp:
+            return int(fp.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+
+    try:
+        import resource
+    except ImportError:
+        return None
+
+    # Peak resident memory is in kilobytes on Linux and in bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def get_private_memory():
+    """
+    Get the memory of current process which is not shared with any other process.
+
+    Returns:
+        integer: Private memory in bytes or ``None`` if it can not be read.
+    """
+    try:
+        with open("/proc/self/smaps_rollup") as fp:
+            lines = fp.readlines()
+    except OSError:
+        return None
+
+    private = 0
+    for line in lines:
+        if line.startswith(("Private_Clean:", "Private_Dirty:")):
+            private += int(line.split()[1]) * 1024
+
+    return private
+
+
+def preload(composer, settings=None, settings_base_classes=None,
+            urls_base_classes=None, freeze=True):
+    """
+    Perform the whole composition and keep it for forked workers.
+
+    Applications are resolved if they are not already, then every ``ClassProcessor``
+    registered in composer exports its classes so every enabled application module is
+    imported. Settings class is built with ``project_settings()`` if processor
+    ``DjangoSettingsProcessor`` is registered and url patterns are collected with
+    ``project_urls()`` if processor ``DjangoUrlsProcessor`` is registered and Django
+    settings are given.
+
+    Arguments:
+        composer (project_composer.compose.Composer): Composer instance.
+
+    Keyword Arguments:
+        settings (django.conf.settings): Django settings to collect url patterns, they
+            are not collected if not given.
+        settings_base_classes (list): Base classes for ``project_settings()``.
+        urls_base_classes (list): Base classes for ``project_urls()``.
+        freeze (boolean): Whether to freeze the garbage collector once composition is
+            done. Default to True.
+
+    Returns:
+        dict: Preloaded composition with items ``composer``, ``settings`` (the
+        composed settings class or ``None``), ``urlpatterns`` (the url patterns or
+        ``None``) and ``stats``, a dictionnary with the ``time`` spent in seconds,
+        the number of ``modules`` in ``sys.modules``, the ``rss_before`` and
+        ``rss_after`` resident memory in bytes and the number of ``frozen``
+        objects.
+    """
+    stats = {"rss_before": get_rss()}
+    start = time.perf_counter()
+
+    if not composer.apps:
+        composer.resolve_collection(lazy=False)
+
+    for processor in composer.processors.values():
+        if isinstance(processor, ClassProcessor):
+            processor.export()
+
+    composed_settings = None
+    if "DjangoSettingsProcessor" in composer.processors:
+        composed_settings = project_settings(
+            composer,
+            base_classes=settings_base_classes,
+        )
+
+    urlpatterns = None
+    if settings is not None and "DjangoUrlsProcessor" in composer.processors:
+        urlpatterns = project_urls(
+            composer,
+            settings,
+            base_classes=urls_base_classes,
+        )
+
+    stats["time"] = time.perf_counter() - start
+    stats["modules"] = len(sys.modules)
+
+    preloaded = {
+        "composer": composer,
+        "settings": composed_settings,
+        "urlpatterns": urlpatterns,
+        "stats": stats,
+    }
+    PRELOADED[composer.manifest.name] = preloaded
+
+    # Collect garbage first so it is not frozen with the composition
+    gc.collect()
+    if freeze and hasattr(gc, "freeze"):
+        gc.freeze()
+
+    stats["frozen"] = gc.get_freeze_count() if hasattr(gc, "freeze") else 0
+    stats["rss_after"] = get_rss()
+
+    return preloaded
+
+
+def get_preloaded(name):
+    """
+    Get a preloaded composition.
+
+    Arguments:
+        name (string): Manifest name.
+
+    Returns:
+        dict: Preloaded composition as returned from ``preload()`` or ``None`` if
+        there is no preloaded composition for this manifest name.
+    """
+    return PRELOADED.get(name)
+
+
+def _run_forked(func, *args):
+    """
+    Run a callable in a forked child process.
+
+    Arguments:
+        func (callable): Callable to run, it must return a JSON serializable value.
+        *args: Positional arguments for callable.
+
+    Returns:
+        object: Value returned from callable.
+    """
+    if not hasattr(os, "fork"):
+        raise ComposerError("Preload measure requires a platform with 'os.fork()'.")
+
+    read, write = os.pipe()
+    pid = os.fork()
+
+    if pid == 0:
+        os.close(read)
+        try:
+            payload = {"result": func(*args)}
+        except BaseException as e:
+            payload = {"error": "{}: {}".format(type(e).__name__, e)}
+
+        with os.fdopen(write, "w") as fp:
+            json.dump(payload, fp)
+        os._exit(0)
+
+    os.close(write)
+    # Read before waiting so a big payload does not block the child on a full pipe
+    with os.fdopen(read) as fp:
+        content = fp.read()
+    os.waitpid(pid, 0)
+
+    try:
+        payload = json.loads(content)
+    except ValueError:
+        raise ComposerError("Forked process has not sent back any result.")
+
+    if "error" in payload:
+        raise ComposerError("Forked process failed: {}".format(payload["error"]))
+
+    return payload["result"]
+
+
+def _boot_worker(factory, name=None):
+    """
+    Boot a worker and measure it.
+
+    Without a preloaded composition, repository modules are unloaded first so they
+    are imported again like in a fresh worker.
+
+    Arguments:
+        factory (callable): Callable which returns a new composer.
+
+    Keyword Arguments:
+        name (string): Manifest name of the preloaded composition to get.
+
+    Returns:
+        dict: Worker measures with items ``boot`` in seconds, ``rss`` and
+        ``private_memory`` in bytes.
+    """
+    start = time.perf_counter()
+
+    if name is None or get_preloaded(name) is None:
+        composer = factory()
+        repository = composer.manifest.repository
+        for module in list(sys.modules.keys()):
+            if module == repository or module.startswith(repository + "."):
+                del sys.modules[module]
+        clear_class_cache()
+
+        preload(composer, freeze=False)
+
+    return {
+        "boot": time.perf_counter() - start,
+        "rss": get_rss(),
+        "private_memory": get_private_memory(),
+    }
+
+
+def _boot_workers(factory, workers, preloaded):
+    """
+    Fork workers from a master process, with or without preloading.
+
+    Returns:
+        list: Measures from each worker.
+    """
+    name = None
+    if preloaded:
+        name = preload(factory())["composer"].manifest.name
+
+    return [_run_forked(_boot_worker, factory, name) for i in range(workers)]
+
+
+def _summarize(measures):
+    summary = {}
+
+    for key in ["boot", "rss", "private_memory"]:
+        values = [item[key] for item in measures if item[key] is not None]
+        summary[key] = (sum(values) / len(values)) if values else None
+
+    return summary
+
+
+def measure_preload(factory, workers=2):
+    """
+    Measure worker boot time and memory with and without preloading.
+
+    Each mode is run from its own forked master process, so the calling process is
+    not altered. Workers from the ``cold`` mode compose themselves, workers from the
+    ``preloaded`` mode get the composition from their master.
+
+    This requires a platform with ``os.fork()``.
+
+    Arguments:
+        factory (callable): Callable which returns a new composer, like
+            ``lambda: Composer("pyproject.toml", processors=[...])``.
+
+    Keyword Arguments:
+        workers (integer): Number of workers to fork for each mode.
+
+    Returns:
+        dict: Measures with items ``cold`` and ``preloaded`` each one with the
+        ``workers`` measures and their averages in ``summary``, and the ``savings``
+        as the difference of averages for ``boot``, ``rss`` and
+        ``private_memory``.
+    """
+    results = {}
+
+    for mode in ["cold", "preloaded"]:
+        measures = _run_forked(_boot_workers, factory, workers, mode == "preloaded")
+        results[mode] = {
+            "workers": measures,
+            "summary": _summarize(measures),
+        }
+
+    results["savings"] = {
+        key: (
+            None if value is None or results["preloaded"]["summary"][key] is None
+            else value - results["preloaded"]["summary"][key]
+        )
+        for key, value in results["cold"]["summary"].items()
+    }
+
+    return results
@@ -1,3 +1,4 @@
+from ...importer import mentions_names
 from ...processors import ClassProcessor
 
 
@@ -41,3 +42,111 @@ class DjangoUrlsProcessor(ClassProcessor):
             base=self.composer.get_application_base_module_path(name),
             part="urls",
         )
+
+    def get_url_prefix(self, node):
+        """
+        Get the url prefix declared by an application.
+
+        An application declares its url prefix with a variable ``URL_PREFIX`` in its
+        base module (``__init__``), every url pattern from its urls classes must then
+        start with this prefix.
+
+        Arguments:
+            node (AppNode): Application to search for.
+
+        Returns:
+            string: The url prefix or ``None`` if application does not declare any.
+        """
+        module = self.composer.find_app_module(
+            self.composer.get_application_base_module_path(node.name)
+        )
+
+        # A lazy module is not executed if it can not define prefix
+        if not module or not mentions_names(module, ["URL_PREFIX"]):
+            return None
+
+        return getattr(module, "URL_PREFIX", None) or None
+
+    def get_lazy_apps(self):
+        """
+        Get applications which declare an url prefix.
+
+        Returns:
+            list: Tuples of application node and its url prefix, in application
+            order.
+        """
+        apps = []
+
+        for node in self.composer.apps:
+            prefix = self.get_url_prefix(node)
+            if prefix:
+                apps.append((node, prefix))
+
+        return apps
+
+    def get_eager_app_classes(self, node):
+        """
+        Get urls classes from an application which does not declare an url prefix.
+
+        Arguments:
+            node (AppNode): Application to search for.
+
+        Returns:
+            list: A list of elligible classes, it is always empty for an application
+            which declares an url prefix so its urls module is not imported.
+        """
+        if self.get_url_prefix(node):
+            return []
+
+        return self.get_app_classes(node)
+
+    def get_lazy_app_classes(self, node, placeholder):
+        """
+        Get urls classes from an application or a placeholder class for an
+        application which declares an url prefix.
+
+        Arguments:
+            node (AppNode): Application to search for.
+            placeholder (callable): Callable which receives the application node and
+                its url prefix and returns the class to use instead of the
+                application urls classes.
+
+        Returns:
+            list: A list of elligible classes or a list with the placeholder class.
+        """
+        prefix = self.get_url_prefix(node)
+        if prefix:
+            return [placeholder(node, prefix)]
+
+        return self.get_app_classes(node)
+
+    def export(self, lazy=False, placeholder=None, **kwargs):
+        """
+        Export enabled applications urls classes.
+
+        Keyword Arguments:
+            lazy (boolean): If True, the applications which declare an url prefix are
+                excluded, their urls modules are not imported. Default to False.
+            placeholder (callable): In lazy mode, a callable to build a class which
+                takes the place of an application which declares an url prefix, see
+                ``get_lazy_app_classes()``. Default to None to exclude them.
+
+        Returns:
+            list: A list of Python classes found as elligible for criterias, see
+            ``ClassProcessor.export()``.
+        """
+        if not lazy:
+            return super().export(**kwargs)
+
+        if placeholder:
+            return self.retain_classes(
+                self.composer.map_apps(
+                    self.get_lazy_app_classes,
+                    placeholder,
+                    plain=False,
+                )
+            )
+
+        return self.retain_classes(
+            self.composer.map_apps(self.get_eager_app_classes, plain=False)
+        )
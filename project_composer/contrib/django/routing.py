@@ -0,0 +1,136 @@
+"""
+Group url patterns on their static route prefix.
+
+Django resolves a request path by trying every url pattern in order until one
+matches, so a flat list of thousands of patterns is matched linearly on each request.
+Grouping consecutive patterns which start with the same static path segment into a
+nested ``include()`` lets Django reject a whole group with a single match on its
+prefix.
+
+Precedence is preserved since patterns are only moved among a run of consecutive
+patterns which all start with a static path segment, patterns from different segments
+can not match the same path. Any other pattern (a regular expression pattern, a route
+starting with a converter or without any static segment) stays at its position and
+ends the run.
+"""
+from django.urls import include, path
+from django.urls.resolvers import RoutePattern, URLPattern, URLResolver
+
+
+def get_static_prefix(entry):
+    """
+    Get the static first path segment of a url pattern route.
+
+    Arguments:
+        entry (django.urls.URLPattern or django.urls.URLResolver): Url pattern.
+
+    Returns:
+        string: The first path segment with its trailing slash, like ``blog/``, or
+        ``None`` if pattern does not start with a static path segment.
+    """
+    if not isinstance(entry.pattern, RoutePattern):
+        return None
+
+    segment, slash, rest = str(entry.pattern).partition("/")
+
+    if not segment or not slash or "<" in segment:
+        return None
+
+    return segment + slash
+
+
+def strip_prefix(entry, prefix):
+    """
+    Copy a url pattern without a prefix from its route.
+
+    Arguments:
+        entry (django.urls.URLPattern or django.urls.URLResolver): Url pattern with a
+            ``RoutePattern`` that starts with given prefix.
+        prefix (string): Prefix to remove.
+
+    Returns:
+        django.urls.URLPattern or django.urls.URLResolver: New url pattern.
+    """
+    route = str(entry.pattern)[len(prefix):]
+
+    if isinstance(entry, URLResolver):
+        return URLResolver(
+            RoutePattern(route, name=entry.pattern.name, is_endpoint=False),
+            entry.urlconf_name,
+            default_kwargs=entry.default_kwargs,
+            app_name=entry.app_name,
+            namespace=entry.namespace,
+        )
+
+    return URLPattern(
+        RoutePattern(route, name=entry.pattern.name, is_endpoint=True),
+        entry.callback,
+        default_args=entry.default_args,
+        name=entry.name,
+    )
+
+
+def _group_run(run, min_size):
+    """
+    Group a run of consecutive url patterns which all have a static prefix.
+
+    Arguments:
+        run (list): List of tuples of prefix and url pattern.
+        min_size (integer): Minimal number of url patterns to make a group.
+
+    Returns:
+        list: Grouped url patterns.
+    """
+    groups = {}
+    for prefix, entry in run:
+        groups.setdefault(prefix, []).append(entry)
+
+    grouped = []
+    for prefix, entries in groups.items():
+        if len(entries) < min_size:
+            grouped.extend(entries)
+            continue
+
+        children = group_urlpatterns(
+            [strip_prefix(entry, prefix) for entry in entries],
+            min_size=min_size,
+        )
+        grouped.append(path(prefix, include(children)))
+
+    return grouped
+
+
+def group_urlpatterns(urlpatterns, min_size=2):
+    """
+    Group url patterns on their static route prefix into nested includes.
+
+    Grouping is recursive, so patterns from a group are grouped again on their next
+    path segment. Patterns names, namespaces, default arguments and their resolving
+    order are unchanged, however the patterns are new objects.
+
+    Arguments:
+        urlpatterns (list): Url patterns like collected by ``project_urls()``.
+
+    Keyword Arguments:
+        min_size (integer): Minimal number of url patterns sharing a prefix to group
+            them. Default to 2.
+
+    Returns:
+        list: Grouped url patterns.
+    """
+    grouped = []
+    run = []
+
+    for entry in urlpatterns:
+        prefix = get_static_prefix(entry)
+
+        if prefix is None:
+            grouped.extend(_group_run(run, min_size))
+            grouped.append(entry)
+            run = []
+        else:
+            run.append((prefix, entry))
+
+    grouped.extend(_group_run(run, min_size))
+
+    return grouped
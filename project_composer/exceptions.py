@@ -53,3 +53,24 @@ class ComposerPurgeError(ComposerProcessorError):
     Error occuring when trying to purge an application repository.
     """
     pass
+
+
+class ComposerBenchmarkError(ProjectComposerException):
+    """
+    Error occuring from a benchmark.
+    """
+    pass
+
+
+class ComposerIndexError(ProjectComposerException):
+    """
+    Error occuring from a class index.
+    """
+    pass
+
+
+class ComposerLockError(ProjectComposerException):
+    """
+    Error occuring from a composition lockfile.
+    """
+    pass
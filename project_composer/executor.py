@@ -0,0 +1,94 @@
+"""
+Execution engine to run application work concurrently.
+
+Applications are processed level by level (see ``AppStore.get_levels()``), every
+application of a level is submitted to a pool of workers and the next level only
+starts once the current one is finished, so an application is never processed before
+its dependencies.
+
+Results are always returned in the given application order, so a concurrent execution
+gives the same output than a serial one.
+"""
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from .exceptions import ComposerError
+
+
+class AppExecutor:
+    """
+    Run a callable for each application with a pool of workers.
+
+    Keyword Arguments:
+        workers (integer): Maximum number of workers to use. A value lower than 2
+            (or ``None``) means a serial execution without any pool.
+        backend (string): Pool kind to use, either ``thread`` or ``process``. With
+            the process backend, the callable, its arguments and its results must be
+            picklable. Default to ``thread``.
+
+    Attributes:
+        BACKENDS (dict): Available pool executor classes indexed on their backend
+            name.
+    """
+    BACKENDS = {
+        "thread": ThreadPoolExecutor,
+        "process": ProcessPoolExecutor,
+    }
+
+    def __init__(self, workers=None, backend="thread"):
+        if backend not in self.BACKENDS:
+            msg = "Unknown executor backend '{name}', available ones are: {names}"
+            raise ComposerError(msg.format(
+                name=backend,
+                names=", ".join(self.BACKENDS.keys()),
+            ))
+
+        self.workers = workers or 1
+        self.backend = backend
+
+    @property
+    def concurrent(self):
+        """
+        Returns:
+            boolean: True if executor will use a pool of workers.
+        """
+        return self.workers > 1
+
+    def run(self, func, apps, levels=None, args=[], backend=None):
+        """
+        Execute a callable on each given application.
+
+        Arguments:
+            func (callable): Callable to execute, it receives an ``AppNode`` as first
+                positional argument followed by ``args`` items.
+            apps (list): List of ``AppNode`` objects in the order to respect for
+                results.
+
+        Keyword Arguments:
+            levels (list): Dependency levels of given applications as returned from
+                ``AppStore.get_levels()``. If not given, every application is processed
+                in a single level.
+            args (list): Additional positional arguments to give to the callable.
+            backend (string): Pool kind to use for this execution instead of the
+                executor one.
+
+        Returns:
+            list: Callable results in the same order than ``apps``.
+        """
+        if not self.concurrent:
+            return [func(node, *args) for node in apps]
+
+        levels = levels or [apps]
+        results = {}
+
+        with self.BACKENDS[backend or self.backend](max_workers=self.workers) as pool:
+            for level in levels:
+                futures = [
+                    (node.name, pool.submit(func, node, *args))
+                    for node in level
+                ]
+                # Wait for the whole level to finish before starting the next one,
+                # a worker exception is raised again here
+                for name, future in futures:
+                    results[name] = future.result()
+
+        return [results[node.name] for node in apps]
@@ -0,0 +1,268 @@
+"""
+A meta path finder dedicated to an application repository.
+
+The repository directory is scanned once to index its application modules and their
+submodules, then the finder directly answers to import requests for repository
+applications without walking the ``sys.path`` entries. An application or a submodule
+of a package application which is not in index is a definite miss and the finder
+raises ``ModuleNotFoundError`` so other finders are not searched.
+"""
+import importlib.abc
+import importlib.machinery
+import importlib.util
+import os
+import sys
+
+from .exceptions import ComposerError
+from .importer import clear_spec_cache
+
+
+class RepositoryFinder(importlib.abc.MetaPathFinder):
+    """
+    Finder for the applications of a repository package.
+
+    Arguments:
+        repository (string): Python path of the repository package.
+        directory (string): Path to the repository package directory.
+
+    Attributes:
+        index (dict): Application names from repository, each name is mapped to a
+            tuple of the application module file path and its submodules as returned
+            from ``RepositoryFinder.scan_directory()``. Submodules are ``None`` for
+            an application which is not a regular package. File path is ``None`` for
+            an application this finder does not load itself.
+    """
+    def __init__(self, repository, directory):
+        self.repository = repository
+        self.directory = os.path.abspath(directory)
+        self.index = self.build_index()
+
+    def __repr__(self):
+        return "<{klass}: {repository} from {directory}>".format(
+            klass=self.__class__.__name__,
+            repository=self.repository,
+            directory=self.directory,
+        )
+
+    def scan_directory(self, path):
+        """
+        Scan a directory for its Python modules and packages.
+
+        Arguments:
+            path (string): Directory path to scan.
+
+        Returns:
+            dict: Module names found in directory, each one is mapped to a tuple of
+            its module file path and a boolean which is True if it is a package. File
+            path is ``None`` for modules this finder does not load itself, like
+            namespace packages, compiled modules or extensions.
+        """
+        suffixes = importlib.machinery.all_suffixes()
+        packages = {}
+        modules = {}
+
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.name.startswith((".", "__")):
+                    continue
+
+                if entry.is_dir():
+                    if not entry.name.isidentifier():
+                        continue
+
+                    init = os.path.join(entry.path, "__init__.py")
+                    packages[entry.name] = (
+                        init if os.path.isfile(init) else None,
+                        True,
+                    )
+                    continue
+
+                suffix = next(
+                    (item for item in suffixes if entry.name.endswith(item)),
+                    None
+                )
+                if suffix is None or not entry.name[:-len(suffix)].isidentifier():
+                    continue
+
+                name = entry.name[:-len(suffix)]
+                if suffix == ".py":
+                    modules.setdefault(name, (entry.path, False))
+                else:
+                    modules[name] = (None, False)
+
+        # A package has priority over a module with the same name
+        modules.update(packages)
+
+        return modules
+
+    def build_index(self):
+        """
+        Scan repository directory to index its applications and their submodules.
+
+        Returns:
+            dict: The application index.
+        """
+        index = {}
+
+        for name, (filepath, is_package) in self.scan_directory(self.directory).items():
+            submodules = None
+            if is_package and filepath:
+                submodules = self.scan_directory(os.path.dirname(filepath))
+
+            index[name] = (filepath, submodules)
+
+        return index
+
+    def invalidate_caches(self):
+        """
+        Scan repository directory again, this is called from
+        ``importlib.invalidate_caches()``.
+        """
+        self.index = self.build_index()
+
+    def not_found(self, fullname):
+        """
+        Raise a definite miss for a module.
+
+        Arguments:
+            fullname (string): Module Python path.
+
+        Raises:
+            ModuleNotFoundError: Always.
+        """
+        msg = f'No module named {fullname!r}'
+        raise ModuleNotFoundError(msg, name=fullname)
+
+    def build_spec(self, fullname, filepath, is_package):
+        """
+        Build a module spec from its file.
+
+        Arguments:
+            fullname (string): Module Python path.
+            filepath (string): Module file path.
+            is_package (boolean): If True, module is a package and its directory is
+                used as its submodule search location.
+
+        Returns:
+            importlib.machinery.ModuleSpec: The module spec.
+        """
+        return importlib.util.spec_from_file_location(
+            fullname,
+            filepath,
+            submodule_search_locations=(
+                [os.path.dirname(filepath)] if is_package else None
+            ),
+        )
+
+    def find_spec(self, fullname, path, target=None):
+        """
+        Find a module spec for an application module or one of its direct
+        submodules.
+
+        Arguments:
+            fullname (string): Module Python path.
+            path (list): Search locations from parent package.
+
+        Keyword Arguments:
+            target (object): Unused, it is only there for finder protocol.
+
+        Returns:
+            importlib.machinery.ModuleSpec: The module spec or ``None`` for a module
+            which is not managed by this finder.
+        """
+        prefix = self.repository + "."
+        if not fullname.startswith(prefix):
+            return None
+
+        names = fullname[len(prefix):].split(".")
+        if len(names) > 2:
+            return None
+
+        app = self.index.get(names[0])
+        app_directory = os.path.join(self.directory, names[0])
+
+        if len(names) == 1:
+            # Repository package has been imported from another location
+            if path is not None and self.directory not in [
+                os.path.abspath(item) for item in path
+            ]:
+                return None
+
+            if app is None:
+                self.not_found(fullname)
+
+            if app[0] is None:
+                return None
+
+            return self.build_spec(fullname, app[0], app[1] is not None)
+
+        if app is None or app[1] is None:
+            return None
+
+        # Application package has been imported from another location
+        if path is not None and app_directory not in [
+            os.path.abspath(item) for item in path
+        ]:
+            return None
+
+        submodule = app[1].get(names[1])
+        if submodule is None:
+            self.not_found(fullname)
+
+        if submodule[0] is None:
+            return None
+
+        return self.build_spec(fullname, submodule[0], submodule[1])
+
+
+def install_finder(repository, directory):
+    """
+    Install a repository finder at the start of ``sys.meta_path``.
+
+    A previously installed finder for the same repository is removed, so loading a
+    repository from another directory replaces its finder.
+
+    Arguments:
+        repository (string): Python path of the repository package.
+        directory (string): Path to the repository package directory.
+
+    Returns:
+        RepositoryFinder: The installed finder.
+    """
+    if not os.path.isdir(directory):
+        msg = "Repository directory does not exist: {}"
+        raise ComposerError(msg.format(directory))
+
+    uninstall_finder(repository)
+
+    finder = RepositoryFinder(repository, directory)
+    sys.meta_path.insert(0, finder)
+    # Specs from finders installed before are not valid anymore
+    clear_spec_cache()
+
+    return finder
+
+
+def uninstall_finder(repository):
+    """
+    Remove installed finders for a repository from ``sys.meta_path``.
+
+    Arguments:
+        repository (string): Python path of the repository package.
+
+    Returns:
+        list: Removed finders.
+    """
+    removed = [
+        finder
+        for finder in sys.meta_path
+        if isinstance(finder, RepositoryFinder) and finder.repository == repository
+    ]
+
+    for finder in removed:
+        sys.meta_path.remove(finder)
+
+    if removed:
+        clear_spec_cache()
+
+    return removed
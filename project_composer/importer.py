@@ -1,12 +1,251 @@
 """
 Convenient way to programmatically import a module from a Python path.
 
+Module specs found from ``sys.meta_path`` finders are cached so importing again a
+module which has been removed from ``sys.modules`` does not walk every finder again.
+The cache key includes the search path, for top level modules it is the ``sys.path``
+content, the current directory since search path entries may be relative and the
+``sys.meta_path`` finders, so specs are not shared between different search
+locations. Missing modules are never cached, a module created after a failed import
+is found like with the Python import system.
+
+If found module files are moved or removed during execution, the cache must be
+cleared with ``invalidate_caches()``.
+
+Modules can also be imported lazily, they are registered in ``sys.modules`` but their
+code is only executed once one of their attributes is accessed. Module metadata like
+``__file__`` or ``__spec__`` can be read with ``peek_attribute()`` without executing
+module code.
+
+Imports are thread safe, a module is loaded under a per module lock which is the same
+one used by the Python import system, so a module is executed only once and a thread
+never gets a module which is still initializing from another thread.
 """
+import copy
 import importlib
+import importlib.util
+import os
 import sys
+import threading
+import types
+from contextlib import contextmanager
+
+try:
+    from importlib._bootstrap import _DeadlockError, _ModuleLockManager
+except ImportError:  # pragma: no cover
+    _DeadlockError = None
+    _ModuleLockManager = None
+
+
+_SPEC_CACHE = {}
+"""
+Cached specs indexed on a tuple of the absolute module name, its search path, the
+``sys.meta_path`` finders and the current directory.
+"""
+
+
+_MODULE_LOCKS = {}
+"""
+Fallback per module locks used when the Python import system locks are not
+available.
+"""
+
+_MODULE_LOCKS_GUARD = threading.Lock()
+
+
+@contextmanager
+def module_lock(name):
+    """
+    Context manager to hold the import lock of a module.
+
+    The lock is reentrant for the thread which holds it. Python import system module
+    locks are used if available so imports from this module and from the import
+    statement are serialized the same way.
+
+    Arguments:
+        name (string): Absolute module name.
+    """
+    if _ModuleLockManager is not None:
+        with _ModuleLockManager(name):
+            yield
+        return
+
+    with _MODULE_LOCKS_GUARD:
+        lock = _MODULE_LOCKS.setdefault(name, threading.RLock())
+
+    with lock:
+        yield
+
+
+def is_initializing(module):
+    """
+    Check if a module is still executing its code.
+
+    Arguments:
+        module (object): Module object.
+
+    Returns:
+        boolean: True if module code execution is not finished.
+    """
+    spec = peek_attribute(module, "__spec__")
+
+    return bool(getattr(spec, "_initializing", False))
+
+
+def clear_spec_cache():
+    """
+    Clear the spec cache, this is needed when ``sys.meta_path`` finders are
+    installed or removed.
+    """
+    _SPEC_CACHE.clear()
+
+
+def invalidate_caches():
+    """
+    Clear the spec cache and the ``sys.meta_path`` finder caches.
+    """
+    clear_spec_cache()
+    importlib.invalidate_caches()
+
+
+def find_spec(absolute_name, path=None, cache=True):
+    """
+    Find a module spec from ``sys.meta_path`` finders.
+
+    Arguments:
+        absolute_name (string): Absolute Python path to the module.
+
+    Keyword Arguments:
+        path (list): Search locations from the parent package. It should be ``None``
+            for a top level module.
+        cache (boolean): If False the spec cache is neither read nor filled.
+
+    Returns:
+        importlib.machinery.ModuleSpec: Found module spec or ``None`` if no finder
+        found it or if a finder raised ``ModuleNotFoundError`` for a definite miss.
+    """
+    if cache:
+        key = (
+            absolute_name,
+            tuple(sys.path if path is None else path),
+            tuple(sys.meta_path),
+            os.getcwd(),
+        )
+
+        try:
+            spec = _SPEC_CACHE.get(key)
+        except TypeError:
+            # A finder which is not hashable can not be part of a key
+            cache = False
+        else:
+            if spec is not None:
+                return spec
+
+    spec = None
+
+    for finder in sys.meta_path:
+        # Old Meta path finders made for "imp" did not implement the "find_spec" as
+        # required with importlib
+        if hasattr(finder, "find_spec"):
+            try:
+                spec = finder.find_spec(absolute_name, path)
+            except ModuleNotFoundError as e:
+                # Finder knows for sure the module does not exist
+                if e.name != absolute_name:
+                    raise
+                spec = None
+                break
+
+            # Found module from a loader use it and stop to search
+            if spec is not None:
+                break
+
+    # Missing modules are not cached since they may be created later
+    if cache and spec is not None:
+        _SPEC_CACHE[key] = spec
+
+    return spec
+
+
+def is_lazy_module(module):
+    """
+    Check if a module is lazy and not executed yet.
+
+    Arguments:
+        module (object): Module object.
+
+    Returns:
+        boolean: True if module is a lazy module which has not been executed yet.
+    """
+    return type(module).__name__ == "_LazyModule"
+
+
+def peek_attribute(module, name, default=None):
+    """
+    Get a module attribute without triggering the execution of a lazy module.
 
+    Only the attributes set before module execution can be retrieved from a lazy
+    module, commonly the metadata ones like ``__name__``, ``__file__``, ``__spec__``
+    or ``__path__``.
 
-def import_module(name, package=None):
+    Arguments:
+        module (object): Module object.
+        name (string): Attribute name.
+
+    Keyword Arguments:
+        default (object): Value returned when attribute does not exist.
+
+    Returns:
+        object: Attribute value.
+    """
+    if not isinstance(module, types.ModuleType):
+        return getattr(module, name, default)
+
+    try:
+        return types.ModuleType.__getattribute__(module, name)
+    except AttributeError:
+        return default
+
+
+def mentions_names(module, names):
+    """
+    Check if a module may define some names without executing it.
+
+    For a lazy module, its source is searched for the names, a module that does not
+    contain any of them in its source, nor a star import, can not define them so
+    there is no need to execute it to look for them.
+
+    Arguments:
+        module (object): Module object.
+        names (list): Names to search for.
+
+    Returns:
+        boolean: False if module is lazy and none of the names can be defined from
+        its source. Else True, including when module is not lazy or its source can
+        not be read.
+    """
+    if not is_lazy_module(module):
+        return True
+
+    spec = peek_attribute(module, "__spec__")
+    # Lazy loader wraps the original one
+    loader = getattr(spec.loader, "loader", spec.loader)
+
+    if not spec.origin or not hasattr(loader, "get_data"):
+        return True
+
+    try:
+        source = loader.get_data(spec.origin)
+    except OSError:
+        return True
+
+    return any([
+        item.encode("utf-8") in source
+        for item in list(names) + ["import *"]
+    ])
+
+
+def import_module(name, package=None, native=False, cache=True, lazy=False):
     """
     An approximate implementation of import taken from Python importlib documentation.
 
@@ -20,42 +259,148 @@ def import_module(name, package=None):
 
     Keyword Arguments:
         package (string): A package name to exclusively search in package tree.
+        native (boolean): If True, the import is directly performed with
+            ``importlib.import_module()`` which is faster since it is mostly
+            implemented in C but does not use the spec cache. This is ignored with
+            ``lazy`` mode since the Python import system can not import lazily.
+        cache (boolean): If False the spec cache is neither read nor filled.
+        lazy (boolean): If True, module and its parent packages which are not
+            imported yet are lazy modules which will only be executed when one of
+            their attributes is accessed.
 
     Returns
         object: Found module object.
     """
+    if native and not lazy:
+        return importlib.import_module(name, package)
+
     absolute_name = importlib.util.resolve_name(name, package)
 
-    try:
-        return sys.modules[absolute_name]
-    except KeyError:
-        pass
+    module = sys.modules.get(absolute_name)
+    if module is not None and not is_initializing(module):
+        return module
 
     path = None
     if '.' in absolute_name:
         parent_name, _, child_name = absolute_name.rpartition('.')
-        parent_module = import_module(parent_name)
-        path = parent_module.__spec__.submodule_search_locations
+        parent_module = import_module(parent_name, cache=cache, lazy=lazy)
+        path = peek_attribute(parent_module, "__spec__").submodule_search_locations
 
-    for finder in sys.meta_path:
-        # Old Meta path finders made for "imp" did not implement the "find_spec" as
-        # required with importlib
-        if hasattr(finder, "find_spec"):
-            spec = finder.find_spec(absolute_name, path)
-            # Found module from a loader use it and stop to search
-            if spec is not None:
-                break
-        else:
-            continue
-    else:
+    try:
+        with module_lock(absolute_name):
+            # Module may have been loaded from another thread while waiting for the
+            # lock, or it is a circular import from this thread
+            module = sys.modules.get(absolute_name)
+            if module is not None:
+                return module
+
+            module = _load_module(absolute_name, path, cache=cache, lazy=lazy)
+    except Exception as e:
+        # Like the import system, a circular import between threads gets the
+        # partially initialized module
+        if _DeadlockError is None or not isinstance(e, _DeadlockError):
+            raise
+        if absolute_name not in sys.modules:
+            raise
+        return sys.modules[absolute_name]
+
+    if path is not None:
+        setattr(parent_module, child_name, module)
+
+    return module
+
+
+def _load_module(absolute_name, path, cache=True, lazy=False):
+    """
+    Find and execute a module, the caller must hold the module lock.
+
+    Module is removed from ``sys.modules`` if its execution fails.
+
+    Arguments:
+        absolute_name (string): Absolute module name.
+        path (list): Search locations from the parent package.
+
+    Keyword Arguments:
+        cache (boolean): If False the spec cache is neither read nor filled.
+        lazy (boolean): If True, module is a lazy module.
+
+    Returns:
+        object: Module object.
+    """
+    spec = find_spec(absolute_name, path, cache=cache)
+    if spec is None:
         msg = f'No module named {absolute_name!r}'
         raise ModuleNotFoundError(msg, name=absolute_name)
 
+    # Spec may be cached so it is copied before changing it
+    spec = copy.copy(spec)
+    if lazy:
+        spec.loader = importlib.util.LazyLoader(spec.loader)
+
     module = importlib.util.module_from_spec(spec)
+    spec._initializing = True
     sys.modules[absolute_name] = module
-    spec.loader.exec_module(module)
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        sys.modules.pop(absolute_name, None)
+        raise
+    finally:
+        spec._initializing = False
 
-    if path is not None:
-        setattr(parent_module, child_name, module)
+    # A module may replace itself in sys.modules during its execution
+    return sys.modules.get(absolute_name, module)
 
-    return module
+
+def import_modules(names, native=False, cache=True, lazy=False):
+    """
+    Import many modules at once.
+
+    Names are imported from the least to the most nested ones so shared parent
+    packages are resolved once, then a missing parent package directly marks all its
+    submodules as missing without searching for them.
+
+    Arguments:
+        names (list): Valid absolute Python paths to modules.
+
+    Keyword Arguments:
+        native (boolean): If True, imports are performed with
+            ``importlib.import_module()``, unless in ``lazy`` mode.
+        cache (boolean): If False the spec cache is neither read nor filled.
+        lazy (boolean): If True, modules are imported lazily.
+
+    Returns:
+        dict: Imported modules indexed on their name, in the same order than given
+        names. Modules which have not been found have a ``None`` value.
+
+    Raises:
+        ModuleNotFoundError: When a found module fails to import another module.
+    """
+    modules = {}
+    missing = set([])
+
+    for name in sorted(set(names), key=lambda item: item.count(".")):
+        parts = name.split(".")
+        parents = [".".join(parts[:i]) for i in range(1, len(parts))]
+
+        if any([parent in missing for parent in parents]):
+            missing.add(name)
+            continue
+
+        try:
+            modules[name] = import_module(
+                name,
+                native=native,
+                cache=cache,
+                lazy=lazy,
+            )
+        except ModuleNotFoundError as e:
+            # Error from a module code which imports a missing module is not
+            # ignored
+            if e.name != name and e.name not in parents:
+                raise
+
+            missing.add(e.name)
+            missing.add(name)
+
+    return {name: modules.get(name) for name in names}
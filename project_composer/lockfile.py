@@ -0,0 +1,349 @@
+"""
+Composition lockfile.
+
+A lockfile records the whole composition of a manifest once it has been resolved:
+the resolved application order with their payloads and, for each registered
+``ClassProcessor``, the application modules it has found with their enabled classes.
+Module files are recorded with a checksum so a lockfile can be verified against the
+current repository, like from a continuous integration.
+
+At runtime, a composer with a lockfile does not scan application modules to resolve
+collection and processors directly get the locked classes instead of inspecting
+modules. Locked file checksums are not checked at runtime, this is the purpose of
+verification with ``CompositionLock.diff()``.
+
+Lockfile content is deterministic, file paths are relative to the repository
+directory and items are written in a stable order, so it can be committed.
+"""
+import json
+from pathlib import Path
+
+from .class_index import ClassIndex, get_checksum
+from .exceptions import ComposerIndexError, ComposerLockError
+from .importer import peek_attribute
+from .processors import ClassProcessor
+
+
+LOCKED_MANIFEST_FIELDS = [
+    "repository", "collection", "default_store_app", "no_ordering",
+]
+"""
+Manifest fields which a lockfile depends on.
+"""
+
+
+class CompositionLock:
+    """
+    Resolved composition of a manifest.
+
+    Keyword Arguments:
+        manifest (dict): Values of ``LOCKED_MANIFEST_FIELDS`` from the manifest the
+            lockfile has been built for.
+        apps (list): Resolved applications in their order, each one is a dictionnary
+            with items ``name``, ``dependencies``, ``push_end``, ``filepath`` and
+            ``checksum``.
+        processors (dict): Module Python paths found by each processor, indexed on
+            processor name.
+        modules (dict): Locked modules on their Python path, each one is a
+            dictionnary with items ``app``, ``filepath``, ``checksum`` and
+            ``classes``, the enabled classes as ``module:qualname`` strings.
+
+    Attributes:
+        VERSION (integer): Lockfile format version.
+    """
+    VERSION = 1
+
+    def __init__(self, manifest=None, apps=None, processors=None, modules=None):
+        self.manifest = manifest or {}
+        self.apps = apps or []
+        self.processors = processors or {}
+        self.modules = modules or {}
+
+    @classmethod
+    def get_file_entry(cls, composer, repository_dirpath, filepath):
+        """
+        Get the relative path and checksum of a module file.
+
+        Arguments:
+            composer (Composer): Composer object.
+            repository_dirpath (pathlib.Path): Repository directory path.
+            filepath (string): Module file path.
+
+        Returns:
+            tuple: Relative file path (or the given one if it is not in repository
+            directory) and file checksum, both are ``None`` without a file.
+        """
+        if not filepath:
+            return None, None
+
+        content = composer.read_file(filepath, binary=True)
+        checksum = get_checksum(content) if content is not None else None
+
+        try:
+            filepath = Path(filepath).relative_to(repository_dirpath)
+        except ValueError:
+            filepath = Path(filepath)
+
+        return filepath.as_posix(), checksum
+
+    @classmethod
+    def build(cls, composer):
+        """
+        Build a lockfile from a composer.
+
+        Collection is resolved then every registered ``ClassProcessor`` discovers its
+        classes, so every enabled application module is imported.
+
+        Arguments:
+            composer (Composer): Composer object, it should not use a lockfile itself.
+
+        Returns:
+            CompositionLock: The built lockfile.
+        """
+        try:
+            repository_dirpath = ClassIndex.get_repository_dirpath(composer)
+        except ComposerIndexError as e:
+            raise ComposerLockError(str(e))
+
+        composer.resolve_collection(lazy=False)
+
+        apps = []
+        for node in composer.apps:
+            filepath, checksum = cls.get_file_entry(
+                composer,
+                repository_dirpath,
+                composer.get_app_filepath(node.name),
+            )
+            apps.append({
+                "name": node.name,
+                "dependencies": [item.name for item in node.dependencies],
+                "push_end": node.push_end,
+                "filepath": filepath,
+                "checksum": checksum,
+            })
+
+        processors = {}
+        modules = {}
+        for name, processor in composer.processors.items():
+            if not isinstance(processor, ClassProcessor):
+                continue
+
+            processors[name] = []
+            for node in composer.apps:
+                path = processor.get_module_path(node.name)
+                module = composer.find_app_module(path)
+                if not module:
+                    continue
+
+                processors[name].append(path)
+
+                if path not in modules:
+                    filepath, checksum = cls.get_file_entry(
+                        composer,
+                        repository_dirpath,
+                        peek_attribute(module, "__file__"),
+                    )
+                    modules[path] = {
+                        "app": node.name,
+                        "filepath": filepath,
+                        "checksum": checksum,
+                        "classes": [
+                            "{}:{}".format(item.__module__, item.__qualname__)
+                            for item in composer._get_elligible_module_classes(
+                                path,
+                                module,
+                            )
+                        ],
+                    }
+
+        return cls(
+            manifest={
+                name: getattr(composer.manifest, name)
+                for name in LOCKED_MANIFEST_FIELDS
+            },
+            apps=apps,
+            processors=processors,
+            modules=modules,
+        )
+
+    @classmethod
+    def load(cls, path):
+        """
+        Load a lockfile from a JSON file.
+
+        Arguments:
+            path (string or pathlib.Path): Lockfile path.
+
+        Returns:
+            CompositionLock: The loaded lockfile.
+        """
+        path = Path(path)
+
+        try:
+            content = json.loads(path.read_text())
+        except (OSError, ValueError) as e:
+            msg = "Unable to load lockfile from '{path}': {error}"
+            raise ComposerLockError(msg.format(path=path, error=e))
+
+        if not isinstance(content, dict) or content.get("version") != cls.VERSION:
+            msg = "Lockfile from '{path}' is not in the version {version} format."
+            raise ComposerLockError(msg.format(path=path, version=cls.VERSION))
+
+        return cls(
+            manifest=content.get("manifest"),
+            apps=content.get("apps"),
+            processors=content.get("processors"),
+            modules=content.get("modules"),
+        )
+
+    def to_dict(self):
+        """
+        Returns:
+            dict: Lockfile content.
+        """
+        return {
+            "version": self.VERSION,
+            "manifest": self.manifest,
+            "apps": self.apps,
+            "processors": self.processors,
+            "modules": self.modules,
+        }
+
+    def get_content_checksum(self):
+        """
+        Returns:
+            string: Checksum of lockfile content, equal lockfiles have the same
+            checksum.
+        """
+        return get_checksum(
+            json.dumps(self.to_dict(), sort_keys=True).encode("utf-8")
+        )
+
+    def dump(self, destination):
+        """
+        Write lockfile to a JSON file.
+
+        Arguments:
+            destination (string or pathlib.Path): File path to write.
+
+        Returns:
+            pathlib.Path: Written file path.
+        """
+        destination = Path(destination)
+        destination.write_text(
+            json.dumps(self.to_dict(), indent=4, sort_keys=True) + "\n"
+        )
+
+        return destination
+
+    def get_payloads(self, manifest, lazy=False):
+        """
+        Get locked application payloads to resolve with an application store.
+
+        Arguments:
+            manifest (Manifest): Manifest object which must match the locked
+                manifest fields.
+
+        Keyword Arguments:
+            lazy (boolean): If True, payloads are in the manifest collection order
+                instead of the resolved order.
+
+        Returns:
+            list: Application payloads with items ``name``, ``dependencies`` and
+            ``push_end``.
+        """
+        changed = [
+            name
+            for name in LOCKED_MANIFEST_FIELDS
+            if self.manifest.get(name) != getattr(manifest, name)
+        ]
+        if changed:
+            msg = "Lockfile has not been built for this manifest, it differs on: {}"
+            raise ComposerLockError(msg.format(", ".join(changed)))
+
+        apps = self.apps
+        if lazy:
+            positions = {name: i for i, name in enumerate(manifest.collection)}
+            apps = sorted(apps, key=lambda item: positions[item["name"]])
+
+        return [
+            {
+                "name": item["name"],
+                "dependencies": list(item["dependencies"]),
+                "push_end": item["push_end"],
+            }
+            for item in apps
+        ]
+
+    def is_missing(self, processor, path):
+        """
+        Find if a module has not been found by a processor when lockfile has been
+        built.
+
+        Arguments:
+            processor (string): Processor name.
+            path (string): Module Python path.
+
+        Returns:
+            boolean: True if processor has been locked without this module.
+        """
+        return (
+            processor in self.processors and
+            path not in self.processors[processor]
+        )
+
+    def diff(self, other):
+        """
+        Compare this lockfile to another one, commonly a lockfile freshly built from
+        the current repository.
+
+        Arguments:
+            other (CompositionLock): Lockfile to compare.
+
+        Returns:
+            list: Messages for each drift found, empty if lockfiles are the same.
+        """
+        drifts = []
+
+        for name in LOCKED_MANIFEST_FIELDS:
+            if self.manifest.get(name) != other.manifest.get(name):
+                drifts.append("Manifest field '{}' has changed.".format(name))
+
+        names = [item["name"] for item in self.apps]
+        other_names = [item["name"] for item in other.apps]
+        if names != other_names:
+            drifts.append("Application order has changed: {} -> {}".format(
+                ", ".join(names),
+                ", ".join(other_names),
+            ))
+
+        other_apps = {item["name"]: item for item in other.apps}
+        for item in self.apps:
+            if item["name"] not in other_apps:
+                continue
+
+            for key in ["dependencies", "push_end", "checksum"]:
+                if item[key] != other_apps[item["name"]][key]:
+                    drifts.append("Application '{name}' {key} has changed.".format(
+                        name=item["name"],
+                        key=key.replace("_", " "),
+                    ))
+
+        for name in sorted(set(self.processors) | set(other.processors)):
+            if self.processors.get(name) != other.processors.get(name):
+                drifts.append("Processor '{}' modules have changed.".format(name))
+
+        for path in sorted(set(self.modules) | set(other.modules)):
+            if path not in other.modules:
+                drifts.append("Module '{}' is not found anymore.".format(path))
+            elif path not in self.modules:
+                drifts.append("Module '{}' is not locked.".format(path))
+            else:
+                for key in ["checksum", "classes"]:
+                    if self.modules[path][key] != other.modules[path][key]:
+                        drifts.append("Module '{path}' {key} has changed.".format(
+                            path=path,
+                            key=key,
+                        ))
+
+        return drifts
@@ -28,6 +28,15 @@ class Manifest(BaseConfig):
         modules.
     syspaths (list)
         A list of Path object to load in sys.path by Composer.
+    archive (string)
+        Path to a zip archive to load repository modules from.
+    class_index (string)
+        Path to a class index file built with the ``index`` command.
+    lockfile (string)
+        Path to a composition lockfile built with the ``lock`` command.
+    resolver (string)
+        Name of the resolver engine used by Composer to resolve
+        applications.
     requirements (dict)
         A dictionnary of items to load in ``RequirementsConfig``
         for specific requirements composer. In fact this is used by
@@ -48,7 +57,11 @@ class Manifest(BaseConfig):
         CharField("repository", required=True),
         CharField("default_store_app"),
         BooleanField("no_ordering"),
+        CharField("resolver", default="reference"),
         ListField("syspaths"),
+        CharField("archive"),
+        CharField("class_index"),
+        CharField("lockfile"),
         PluginField("requirements", plugin=RequirementsConfig),
     ]
 
@@ -1,3 +1,12 @@
+import weakref
+
+
+_REGISTRY = {}
+"""
+Weak references to ``EnabledApplicationMarker`` subclasses indexed on the name of the
+module where they have been defined, in their definition order.
+"""
+
 
 class EnabledApplicationMarker:
     """
@@ -14,5 +23,33 @@ class EnabledApplicationMarker:
 
     You may however, reproduce elligibility yourself in your class with including this
     attribute, its value is not important except it must not be ``None``.
+
+    Every subclass is registered when it is created, so composer can directly get the
+    marked classes defined in a module, see ``get_registered_classes()``.
     """
     _ENABLED_COMPOSABLE_APPLICATION = True
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        _REGISTRY.setdefault(cls.__module__, []).append(weakref.ref(cls))
+
+
+def get_registered_classes(module_name):
+    """
+    Get the marker subclasses defined in a module.
+
+    Arguments:
+        module_name (string): Module Python path.
+
+    Returns:
+        list: Classes in their definition order. Classes from a previous execution of
+        the module are included until they are garbage collected.
+    """
+    references = _REGISTRY.get(module_name, [])
+    classes = [reference() for reference in references]
+    alive = [item for item in classes if item is not None]
+
+    if len(alive) != len(references):
+        _REGISTRY[module_name] = [weakref.ref(item) for item in alive]
+
+    return alive
@@ -1,5 +1,6 @@
 from .base import ComposerProcessor
 from .classes import ClassProcessor
+from .impact import ImpactProcessor
 from .purge import PurgeProcessor
 from .text import TextContentProcessor
 
@@ -7,6 +8,7 @@ from .text import TextContentProcessor
 __all__ = [
     "ComposerProcessor",
     "ClassProcessor",
+    "ImpactProcessor",
     "PurgeProcessor",
     "TextContentProcessor",
 ]
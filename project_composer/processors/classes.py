@@ -6,6 +6,44 @@ class ClassProcessor(ComposerProcessor):
     Class composer find all existing classes for enabled application modules and that
     match criterias from ``Composer._is_elligible_class``.
     """
+    def get_app_classes(self, node):
+        """
+        Get elligible classes from an application module.
+
+        This is the application work executed by composer workers.
+
+        Arguments:
+            node (AppNode): Application to search for.
+
+        Returns:
+            list: A list of elligible classes in their definition order. It is empty
+            if module has not been found.
+        """
+        path = self.get_module_path(node.name)
+
+        # Module was not found when lockfile has been built
+        lock = self.composer.lock
+        if lock is not None and lock.is_missing(self.__class__.__name__, path):
+            return []
+
+        # Module is known to not define any enabled class, it is not imported
+        indexed = self.composer.get_indexed_entry(path)
+        if indexed is not None and not indexed["classes"]:
+            return []
+
+        # Try to find module
+        module = self.composer.find_app_module(path)
+        if not module:
+            return []
+
+        msg = "{klass} found module at: {path}".format(
+            klass=self.__class__.__name__,
+            path=path,
+        )
+        self.composer.log.debug(msg)
+
+        return self.composer._get_elligible_module_classes(path, module)
+
     def export(self, **kwargs):
         """
         Export enabled applications classes.
@@ -17,30 +55,35 @@ class ClassProcessor(ComposerProcessor):
             defined with the same name, the first is retained and the second one is
             ignored).
         """
-        mods = []
-        _mod_names = set([])
+        return self.retain_classes(
+            self.composer.map_apps(self.get_app_classes, plain=False)
+        )
 
-        for node in self.composer.apps:
-            path = self.get_module_path(node.name)
+    def retain_classes(self, results):
+        """
+        Merge application classes, a class with the same name than a class from a
+        previous application is ignored.
 
-            # Try to find module
-            module = self.composer.find_app_module(path)
-            if module:
-                msg = "{klass} found module at: {path}".format(
-                    klass=self.__class__.__name__,
-                    path=path,
-                )
-                self.composer.log.debug(msg)
-
-                mods.extend([
-                    item
-                    for item in self.composer._get_elligible_module_classes(path,
-                                                                            module)
-                    if item.__name__ not in _mod_names
-                ])
-                # Update the list of unique retained class names which are used
-                # for previous uniqueness comparaison in next iteration
-                _mod_names.update([item.__name__ for item in mods])
+        Arguments:
+            results (list): Lists of application classes in application order.
+
+        Returns:
+            list: Retained classes.
+        """
+        mods = []
+        # Names of retained classes from previous modules
+        retained_names = set([])
+
+        for classes in results:
+            retained = [
+                item
+                for item in classes
+                if item.__name__ not in retained_names
+            ]
+            mods.extend(retained)
+            # Only the newly retained names are added so each class name is added
+            # once
+            retained_names.update([item.__name__ for item in retained])
 
         return mods
 
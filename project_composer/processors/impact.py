@@ -0,0 +1,164 @@
+from pathlib import Path
+
+from ..importer import peek_attribute
+
+from .base import ComposerProcessor
+
+
+class ImpactProcessor(ComposerProcessor):
+    """
+    Processor to find applications impacted by some changed files.
+
+    A file is owned by an application when it is located inside the application module
+    directory or when it is the module file of an application which is not a package.
+    An impacted application is any application owning a changed file and
+    every application which depends on it, directly or not.
+
+    This processor requires the collection to be resolved without the lazy mode to
+    output impacted applications in their resolved order.
+    """
+    def get_application_directories(self):
+        """
+        Get directory of every enabled application.
+
+        Applications which are not a package (without a directory for their module)
+        are ignored.
+
+        Returns:
+            dict: Application names indexed on their absolute directory Path object.
+        """
+        directories = {}
+
+        for node in self.composer.apps:
+            module = self.composer.find_app_module(self.get_module_path(node.name))
+
+            filepath = peek_attribute(module, "__file__")
+            if filepath and Path(filepath).name == "__init__.py":
+                directories[Path(filepath).parent.resolve()] = node.name
+
+        return directories
+
+    def get_application_files(self):
+        """
+        Get module file of every enabled application which is not a package.
+
+        Returns:
+            dict: Application names indexed on their absolute module file Path object.
+        """
+        files = {}
+
+        for node in self.composer.apps:
+            module = self.composer.find_app_module(self.get_module_path(node.name))
+
+            filepath = peek_attribute(module, "__file__")
+            if filepath and Path(filepath).name != "__init__.py":
+                files[Path(filepath).resolve()] = node.name
+
+        return files
+
+    def get_repository_directory(self):
+        """
+        Get the application repository directory if any.
+
+        Returns:
+            pathlib.Path: Absolute path to repository directory. This is ``None`` if
+            manifest does not define any repository or if it can not be found.
+        """
+        if not self.composer.manifest.repository:
+            return None
+
+        module = self.composer.find_app_module(self.composer.manifest.repository)
+        if not peek_attribute(module, "__file__"):
+            return None
+
+        return Path(peek_attribute(module, "__file__")).parent.resolve()
+
+    def get_base_directory(self, repository):
+        """
+        Get the directory which relative changed paths are resolved from.
+
+        Arguments:
+            repository (pathlib.Path): Repository directory, it may be ``None``.
+
+        Returns:
+            pathlib.Path: Directory which contains the repository package, like the
+            one a ``git diff`` is commonly done from. This is the current working
+            directory when there is no repository directory.
+        """
+        if not repository:
+            return Path.cwd()
+
+        depth = len(self.composer.manifest.repository.split("."))
+
+        return repository.parents[depth - 1]
+
+    def get_owners(self, paths):
+        """
+        Map changed file paths to the applications which own them.
+
+        A changed file located directly in the repository directory (like the
+        repository ``__init__.py``) is involved in every application, so it marks all
+        enabled applications as owners, except the module file of an application
+        which is not a package. Files outside of any application are ignored.
+
+        Arguments:
+            paths (list): List of file paths (as string or Path object), relative
+                paths are resolved from the directory which contains the repository
+                package, see ``get_base_directory()``.
+
+        Returns:
+            set: Names of applications owning at least one of given paths.
+        """
+        directories = self.get_application_directories()
+        files = self.get_application_files()
+        repository = self.get_repository_directory()
+        basedir = self.get_base_directory(repository)
+
+        owners = set([])
+
+        for path in paths:
+            path = (basedir / path).resolve()
+
+            if path in files:
+                owners.add(files[path])
+                continue
+
+            for parent in path.parents:
+                if parent in directories:
+                    owners.add(directories[parent])
+                    break
+            else:
+                if repository and path.parent == repository:
+                    msg = "{klass} marks every application for file: {path}"
+                    self.composer.log.debug(msg.format(
+                        klass=self.__class__.__name__,
+                        path=path,
+                    ))
+                    owners.update(directories.values())
+                    owners.update(files.values())
+
+        return owners
+
+    def export(self, paths=[]):
+        """
+        Export applications impacted by given changed files.
+
+        Keyword Arguments:
+            paths (list): List of changed file paths.
+
+        Returns:
+            list: List of impacted ``AppNode`` objects in the composer application
+            order.
+        """
+        owners = self.get_owners(paths)
+
+        for name in sorted(owners):
+            msg = "{klass} found changes in application: {name}".format(
+                klass=self.__class__.__name__,
+                name=name,
+            )
+            self.composer.log.debug(msg)
+
+        impacted = self.composer.store.get_dependents(owners)
+
+        return [node for node in self.composer.apps if node.name in impacted]
@@ -1,7 +1,7 @@
 import shutil
 from pathlib import Path
 
-from ..importer import import_module
+from ..importer import import_module, peek_attribute
 
 from .base import ComposerProcessor
 from ..exceptions import ComposerPurgeError
@@ -21,7 +21,11 @@ class PurgeProcessor(ComposerProcessor):
             list: A list of Path objects.
         """
         try:
-            repository = import_module(self.composer.manifest.repository)
+            repository = import_module(
+                self.composer.manifest.repository,
+                native=self.composer.native_import,
+                lazy=self.composer.lazy_import,
+            )
         except ModuleNotFoundError:
             msg = "{klass} is unable to find application repository module from: {path}"
             raise ComposerPurgeError(msg.format(
@@ -29,7 +33,14 @@ class PurgeProcessor(ComposerProcessor):
                 path=self.composer.manifest.repository,
             ))
 
-        repository_path = Path(repository.__file__).parent
+        repository_path = Path(peek_attribute(repository, "__file__")).parent
+
+        if self.composer.archive and self.composer.archive.contains(repository_path):
+            msg = "{klass} can not purge a repository from an archive: {path}"
+            raise ComposerPurgeError(msg.format(
+                klass=self.__class__.__name__,
+                path=self.composer.archive.path,
+            ))
 
         # List module directories from repository and filter out the ones with a name
         # starting with "_"
@@ -31,6 +31,50 @@ class TextContentProcessor(ComposerProcessor):
 
         return ""
 
+    def get_app_content(self, node, requirements_config):
+        """
+        Get the text content file from an application.
+
+        This is the application work executed by composer workers.
+
+        Arguments:
+            node (AppNode): Application to search for.
+            requirements_config (RequirementsConfig): Requirements options to get the
+                content filename.
+
+        Returns:
+            string: Content file text or ``None`` if application module or its content
+            file have not been found.
+        """
+        # Try to find application module file
+        filepath = self.composer.get_app_filepath(node.name)
+
+        if not filepath:
+            return None
+
+        # Resolve expected text content file path inside module
+        source_path = (
+            Path(filepath).parents[0].resolve() /
+            requirements_config.source_filename
+        )
+        # Try to find file from application to append its content to the output
+        content = self.composer.read_file(source_path)
+        if content is None:
+            msg = "{klass} is unable to find content file from: {path}".format(
+                klass=self.__class__.__name__,
+                path=source_path,
+            )
+            self.composer.log.debug(msg)
+            return None
+
+        msg = "{klass} found content file at: {path}".format(
+            klass=self.__class__.__name__,
+            path=source_path,
+        )
+        self.composer.log.debug(msg)
+
+        return content
+
     def export(self):
         """
         Combinate all application content files into a single content string.
@@ -49,42 +93,19 @@ class TextContentProcessor(ComposerProcessor):
 
         output += self.get_template(requirements_config.template)
 
-        for node in self.composer.apps:
-            # Try to find application module
-            module_path = self.composer.get_module_path(node.name)
-            module = self.composer.find_app_module(module_path)
-
-            if module and getattr(module, "__file__", None):
-                # Resolve expected text content file path inside module
-                source_path = (
-                    Path(module.__file__).parents[0].resolve() /
-                    requirements_config.source_filename
-                )
-                # Try to find file from application to append its content to the output
-                if source_path.exists():
-                    msg = "{klass} found content file at: {path}".format(
-                        klass=self.__class__.__name__,
-                        path=source_path,
-                    )
-                    self.composer.log.debug(msg)
-
-                    content = source_path.read_text()
-                    if content.strip():
-                        if requirements_config.application_divider:
-                            output += requirements_config.application_divider
-
-                        if requirements_config.application_label:
-                            label = requirements_config.application_label
-                            output += label.format(name=node.name)
+        for node, content in zip(
+            self.composer.apps,
+            self.composer.map_apps(self.get_app_content, requirements_config)
+        ):
+            if content is not None and content.strip():
+                if requirements_config.application_divider:
+                    output += requirements_config.application_divider
 
-                        output += content
+                if requirements_config.application_label:
+                    label = requirements_config.application_label
+                    output += label.format(name=node.name)
 
-                else:
-                    msg = "{klass} is unable to find content file from: {path}".format(
-                        klass=self.__class__.__name__,
-                        path=source_path,
-                    )
-                    self.composer.log.debug(msg)
+                output += content
 
         return output
 
@@ -116,9 +137,8 @@ class TextContentProcessor(ComposerProcessor):
 
         app_last = len(self.composer.apps)
         for i, node in enumerate(self.composer.apps, start=1):
-            # Try to find application module
-            module_path = self.composer.get_module_path(node.name)
-            module = self.composer.find_app_module(module_path)
+            # Try to find application module file
+            filepath = self.composer.get_app_filepath(node.name)
 
             # Display app label name
             printer(
@@ -127,16 +147,16 @@ class TextContentProcessor(ComposerProcessor):
             )
 
             # Try to find app module file to get its path
-            if module and getattr(module, "__file__", None):
+            if filepath:
                 # Resolve expected text content file path inside module
                 source_path = (
-                    Path(module.__file__).parents[0].resolve() /
+                    Path(filepath).parents[0].resolve() /
                     self.composer.manifest.requirements.source_filename
                 )
 
                 # Try to find a requirement file
-                if source_path.exists():
-                    content = source_path.read_text()
+                content = self.composer.read_file(source_path)
+                if content is not None:
                     # Lists package, omits possible commentaries
                     pkgs = [
                         pkg
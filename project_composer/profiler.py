@@ -0,0 +1,355 @@
+"""
+Instrumentation to find which application modules are slow to import.
+
+The profiler records each module import performed through
+``Composer.find_app_module()`` with its wall time, CPU time, allocated memory and the
+nested modules it imported from outside of the repository.
+
+A module which is already in ``sys.modules`` is not recorded again. Be aware that
+with lazy import, the module code is executed once one of its attribute is accessed,
+so its execution is not recorded. Also memory tracing has an overhead which alters
+timings, it can be disabled to get more accurate times.
+"""
+import json
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+
+from .exceptions import ComposerError
+
+
+PROFILE_FORMATS = ["json", "trace"]
+"""
+Available formats to write profiling results.
+"""
+
+
+class ImportProfiler:
+    """
+    Record application module imports.
+
+    Keyword Arguments:
+        repository (string): Python path of the application repository. It is used to
+            find the application and the submodule of recorded modules and to
+            distinguish nested imports from outside of repository.
+        trace_memory (boolean): Whether to trace memory allocations during imports.
+            Default to True.
+
+    Attributes:
+        records (list): Recorded imports in the order they have started, each one is
+            a dictionnary as described in ``ImportProfiler.record()``.
+    """
+    def __init__(self, repository=None, trace_memory=True):
+        self.repository = repository
+        self.trace_memory = trace_memory
+        self.records = []
+        self.origin = time.perf_counter()
+        self._active = 0
+        self._owns_tracing = False
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def split_name(self, name):
+        """
+        Find application and submodule from a module Python path.
+
+        Arguments:
+            name (string): Module Python path.
+
+        Returns:
+            tuple: Application name and submodule name, submodule is ``__init__`` for
+            the application module itself. Both are ``None`` for a module which is not
+            an application one.
+        """
+        if not self.repository or not name.startswith(self.repository + "."):
+            return None, None
+
+        parts = name[len(self.repository) + 1:].split(".")
+
+        return parts[0], ".".join(parts[1:]) or "__init__"
+
+    def is_external(self, name):
+        """
+        Check if a module is outside of repository.
+
+        Arguments:
+            name (string): Module Python path.
+
+        Returns:
+            boolean: True if module is neither the repository package nor one of its
+            modules.
+        """
+        if not self.repository:
+            return True
+
+        return name != self.repository and not name.startswith(self.repository + ".")
+
+    def _start_tracing(self):
+        with self._lock:
+            self._active += 1
+            if (
+                self.trace_memory and self._active == 1 and
+                not tracemalloc.is_tracing()
+            ):
+                tracemalloc.start()
+                self._owns_tracing = True
+
+    def _stop_tracing(self):
+        with self._lock:
+            self._active -= 1
+            if self._active == 0 and self._owns_tracing:
+                tracemalloc.stop()
+                self._owns_tracing = False
+
+    def _traced_memory(self):
+        if not tracemalloc.is_tracing():
+            return 0
+
+        return tracemalloc.get_traced_memory()[0]
+
+    @contextmanager
+    def record(self, name):
+        """
+        Context manager to record a module import.
+
+        Record is a dictionnary with items:
+
+        name
+            Module Python path.
+        app
+            Application name or ``None``.
+        submodule
+            Application submodule name or ``None``.
+        found
+            False if the block has set it to False because the module is missing.
+        start
+            Start time in seconds since the profiler creation.
+        wall
+            Elapsed wall time in seconds.
+        cpu
+            Elapsed process CPU time in seconds.
+        memory
+            Memory in bytes which is still allocated at the end of import.
+        imports
+            Sorted names of nested modules imported from outside of repository.
+        depth
+            Number of records which were running in the same thread when this one
+            started.
+        thread
+            Identifier of the thread which performed the import.
+
+        Arguments:
+            name (string): Module Python path.
+
+        Yields:
+            dict: The record, it is only added to ``ImportProfiler.records`` if module
+            was not already imported.
+        """
+        app, submodule = self.split_name(name)
+        record = {
+            "name": name,
+            "app": app,
+            "submodule": submodule,
+            "found": True,
+        }
+
+        if name in sys.modules:
+            yield record
+            return
+
+        depth = getattr(self._local, "depth", 0)
+        self._local.depth = depth + 1
+        self._start_tracing()
+
+        before = set(sys.modules.keys())
+        memory = self._traced_memory()
+        cpu = time.process_time()
+        start = time.perf_counter()
+
+        try:
+            yield record
+        finally:
+            wall = time.perf_counter() - start
+            cpu = time.process_time() - cpu
+            memory = self._traced_memory() - memory
+            imports = [
+                item
+                for item in set(sys.modules.keys()) - before
+                if item != name and self.is_external(item)
+            ]
+
+            self._stop_tracing()
+            self._local.depth = depth
+
+            record.update({
+                "start": start - self.origin,
+                "wall": wall,
+                "cpu": cpu,
+                "memory": memory,
+                "imports": sorted(imports),
+                "depth": depth,
+                "thread": threading.get_ident(),
+            })
+
+            with self._lock:
+                self.records.append(record)
+
+    def get_records(self, sort="wall"):
+        """
+        Get records sorted on a measure.
+
+        Keyword Arguments:
+            sort (string): Record item name to sort on, in descending order.
+
+        Returns:
+            list: Sorted records.
+        """
+        return sorted(self.records, key=lambda item: item[sort], reverse=True)
+
+    def get_app_summary(self, sort="wall"):
+        """
+        Get measures summed for each application.
+
+        Nested records are not summed since their measures are already included in
+        their parent one.
+
+        Keyword Arguments:
+            sort (string): Summary item name to sort on, in descending order.
+
+        Returns:
+            list: Application summaries with items ``app``, ``modules`` (the recorded
+            module names), ``wall``, ``cpu``, ``memory`` and ``imports``.
+        """
+        summaries = {}
+
+        for record in self.records:
+            if record["app"] is None:
+                continue
+
+            summary = summaries.setdefault(record["app"], {
+                "app": record["app"],
+                "modules": [],
+                "wall": 0,
+                "cpu": 0,
+                "memory": 0,
+                "imports": set([]),
+            })
+            summary["modules"].append(record["name"])
+            summary["imports"].update(record["imports"])
+
+            if record["depth"] == 0:
+                for measure in ["wall", "cpu", "memory"]:
+                    summary[measure] += record[measure]
+
+        for summary in summaries.values():
+            summary["imports"] = sorted(summary["imports"])
+
+        return sorted(summaries.values(), key=lambda item: item[sort], reverse=True)
+
+    def to_dict(self):
+        """
+        Get profiling results.
+
+        Returns:
+            dict: Results with the repository, the records sorted on wall time and the
+            application summaries.
+        """
+        return {
+            "repository": self.repository,
+            "records": self.get_records(),
+            "apps": self.get_app_summary(),
+        }
+
+    def to_trace(self):
+        """
+        Get records as Chrome trace events.
+
+        Result can be loaded in a trace viewer like ``chrome://tracing`` or Perfetto to
+        display imports as a flamegraph.
+
+        Returns:
+            dict: Trace with complete events (``X`` phase) for every records, times
+            are in microseconds.
+        """
+        return {
+            "traceEvents": [
+                {
+                    "name": record["name"],
+                    "cat": "import",
+                    "ph": "X",
+                    "ts": round(record["start"] * 1000000, 3),
+                    "dur": round(record["wall"] * 1000000, 3),
+                    "pid": 1,
+                    "tid": record["thread"],
+                    "args": {
+                        "app": record["app"],
+                        "submodule": record["submodule"],
+                        "found": record["found"],
+                        "cpu": record["cpu"],
+                        "memory": record["memory"],
+                        "imports": record["imports"],
+                    },
+                }
+                for record in self.records
+            ],
+            "displayTimeUnit": "ms",
+        }
+
+    def write(self, destination, format="json"):
+        """
+        Write profiling results into a file.
+
+        Arguments:
+            destination (pathlib.Path): File path to write.
+
+        Keyword Arguments:
+            format (string): Either ``json`` for results from
+                ``ImportProfiler.to_dict()`` or ``trace`` for the Chrome trace events
+                from ``ImportProfiler.to_trace()``.
+
+        Returns:
+            pathlib.Path: Written file path.
+        """
+        if format not in PROFILE_FORMATS:
+            msg = "Unknown profile format '{}', available ones are: {}"
+            raise ComposerError(msg.format(format, ", ".join(PROFILE_FORMATS)))
+
+        destination = Path(destination)
+        content = self.to_dict() if format == "json" else self.to_trace()
+        destination.write_text(json.dumps(content, indent=4))
+
+        return destination
+
+    def print_table(self, printer):
+        """
+        Output records sorted on wall time.
+
+        Arguments:
+            printer (callable): Printer to use, commonly a
+                ``utils.tree_printer.TreePrinter`` object.
+        """
+        records = self.get_records()
+
+        if not records:
+            printer("X", "No recorded import")
+            return
+
+        last = len(records)
+        for i, record in enumerate(records, start=1):
+            msg = (
+                "{name}: wall {wall:.2f}ms, cpu {cpu:.2f}ms, memory {memory:.1f}KiB, "
+                "{imports} nested imports"
+            )
+            printer(
+                "X" if (i == last) else "T",
+                msg.format(
+                    name=record["name"] + ("" if record["found"] else " (missing)"),
+                    wall=record["wall"] * 1000,
+                    cpu=record["cpu"] * 1000,
+                    memory=record["memory"] / 1024,
+                    imports=len(record["imports"]),
+                ),
+            )
@@ -0,0 +1,137 @@
+"""
+Scan application modules to get their options.
+
+Scanning can be performed out of process with a short-lived pool of worker processes,
+each worker imports application modules and only sends back their plain payloads. So
+application code and the third party modules it imports are never loaded in the
+calling process.
+"""
+import multiprocessing
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from .archive import install_archive
+from .importer import import_module, mentions_names, peek_attribute
+
+
+APP_OPTIONS = ["DEPENDENCIES", "PUSH_END"]
+"""
+Module variable names for application options.
+"""
+
+
+def get_app_payload(name, module):
+    """
+    Build application payload from its module.
+
+    Arguments:
+        name (string): Application name.
+        module (object): Application module.
+
+    Returns:
+        dict: Application payload with items ``name``, ``filepath`` and possibly
+        ``dependencies`` and ``push_end``.
+    """
+    payload = {
+        "name": name,
+        "filepath": peek_attribute(module, "__file__")
+    }
+
+    # A lazy module is not executed if it can not define options
+    if mentions_names(module, APP_OPTIONS):
+        if hasattr(module, "DEPENDENCIES"):
+            payload["dependencies"] = getattr(module, "DEPENDENCIES")
+
+        if hasattr(module, "PUSH_END"):
+            payload["push_end"] = getattr(module, "PUSH_END")
+
+    return payload
+
+
+def _init_worker(paths, archive=None, archive_packages=None):
+    """
+    Worker process initializer to use the same ``sys.path`` than the caller.
+
+    Arguments:
+        paths (list): Paths for ``sys.path``.
+
+    Keyword Arguments:
+        archive (string): Path to a repository archive to install.
+        archive_packages (list): Top level package names to search from archive.
+    """
+    sys.path[:] = paths
+
+    if archive:
+        install_archive(archive, packages=archive_packages)
+
+
+def scan_app_module(name, module_path, native=False, lazy=False):
+    """
+    Import an application module to get its payload.
+
+    This is the work executed in worker processes, payload values are converted to
+    plain types so they can be sent back.
+
+    Arguments:
+        name (string): Application name.
+        module_path (string): Application module Python path.
+
+    Keyword Arguments:
+        native (boolean): Import mode, see ``importer.import_module()``.
+        lazy (boolean): Import mode, see ``importer.import_module()``.
+
+    Returns:
+        dict: Application payload or ``None`` if module has not been found.
+    """
+    try:
+        module = import_module(module_path, native=native, lazy=lazy)
+    except ModuleNotFoundError:
+        return None
+
+    payload = get_app_payload(name, module)
+
+    if "dependencies" in payload:
+        payload["dependencies"] = [str(item) for item in payload["dependencies"]]
+
+    if "push_end" in payload:
+        payload["push_end"] = bool(payload["push_end"])
+
+    return payload
+
+
+def scan_collection(modules, workers=1, native=False, lazy=False, context="spawn",
+                    archive=None, archive_packages=None):
+    """
+    Scan application modules from a pool of worker processes.
+
+    Arguments:
+        modules (list): List of tuples of application name and module Python path.
+
+    Keyword Arguments:
+        workers (integer): Number of worker processes.
+        native (boolean): Import mode, see ``importer.import_module()``.
+        lazy (boolean): Import mode, see ``importer.import_module()``.
+        context (string): Multiprocessing start method. Default to ``spawn`` so
+            workers do not inherit anything from the calling process memory.
+        archive (string): Path to a repository archive to install in workers.
+        archive_packages (list): Top level package names to search from archive.
+
+    Returns:
+        list: Application payloads in the same order than given modules, a module
+        which has not been found has a ``None`` value.
+    """
+    if not modules:
+        return []
+
+    with ProcessPoolExecutor(
+        max_workers=max(1, min(workers, len(modules))),
+        mp_context=multiprocessing.get_context(context),
+        initializer=_init_worker,
+        initargs=(list(sys.path), archive, archive_packages),
+    ) as pool:
+        futures = [
+            pool.submit(scan_app_module, name, path, native=native, lazy=lazy)
+            for name, path in modules
+        ]
+
+        return [future.result() for future in futures]
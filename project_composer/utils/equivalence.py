@@ -0,0 +1,309 @@
+"""
+Differential harness to validate alternative resolver engines against the reference
+``AppStore``.
+
+The harness generates randomized collections, resolves them with the reference store
+and every alternative engine, then compares their outcomes which are either the
+resolved application payloads or the raised error. When an engine differs from the
+reference, the failing case is shrinked to a minimal collection which still fails and
+it can be saved as a new dataset for the resolver tests.
+"""
+import json
+import random
+
+from ..app_storage import AppStore
+from ..exceptions import ProjectComposerException
+from .graphs import app_name, random_collection
+
+
+def resolve_outcome(store_class, case):
+    """
+    Resolve a case with a store class and return its outcome.
+
+    Arguments:
+        store_class (class): AppStore class (or compatible) to use.
+        case (dict): Case with items ``collection``, ``default_app`` and
+            ``no_ordering``.
+
+    Returns:
+        dict: Outcome with either a ``resolved`` item for the list of resolved
+        application payloads or an ``error`` item with the exception class name and
+        message.
+    """
+    store = store_class(default_app=case["default_app"])
+
+    try:
+        resolved = store.resolve(
+            json.loads(json.dumps(case["collection"])),
+            no_ordering=case["no_ordering"],
+        )
+    except ProjectComposerException as e:
+        return {"error": "{}: {}".format(type(e).__name__, e)}
+
+    return {"resolved": [item.to_payload() for item in resolved]}
+
+
+class EquivalenceHarness:
+    """
+    Compare alternative resolver engines to the reference one.
+
+    Arguments:
+        engines (dict): Alternative engine classes indexed on their name. An engine
+            class must accept the ``default_app`` keyword argument and implement
+            ``resolve()`` like ``AppStore``.
+
+    Keyword Arguments:
+        reference (class): Reference store class. Default to ``AppStore``.
+        seed (integer): Seed for the random case generator.
+        max_size (integer): Maximum number of applications in a generated case.
+        invalid_ratio (float): Ratio of generated cases which are made invalid with a
+            circular reference or an unknown dependency, so error outcomes are
+            compared too.
+    """
+    def __init__(self, engines, reference=AppStore, seed=42, max_size=30,
+                 invalid_ratio=0.1):
+        self.engines = engines
+        self.reference = reference
+        self.random = random.Random(seed)
+        self.max_size = max_size
+        self.invalid_ratio = invalid_ratio
+
+    def generate_case(self):
+        """
+        Generate a random case.
+
+        Returns:
+            dict: Case with items ``collection``, ``default_app`` and
+            ``no_ordering``.
+        """
+        size = self.random.randint(1, self.max_size)
+        collection = random_collection(
+            size,
+            seed=self.random.randrange(2 ** 32),
+            degree=self.random.randint(0, 4),
+            push_end_ratio=self.random.choice([0, 0.1, 0.3]),
+        )
+
+        if self.random.random() < self.invalid_ratio:
+            item = self.random.choice(collection)
+            if self.random.random() < 0.5:
+                # Unknown dependency
+                item.setdefault("dependencies", []).append(app_name(size))
+            else:
+                # Circular reference to itself or a dependent
+                target = self.random.choice(collection)
+                item.setdefault("dependencies", []).append(target["name"])
+                target.setdefault("dependencies", []).append(item["name"])
+
+        default_app = None
+        if self.random.random() < 0.3:
+            default_app = self.random.choice(collection)["name"]
+
+        return {
+            "collection": collection,
+            "default_app": default_app,
+            "no_ordering": self.random.random() < 0.1,
+        }
+
+    def compare(self, name, case):
+        """
+        Compare an engine outcome to the reference one for a case.
+
+        Arguments:
+            name (string): Engine name.
+            case (dict): Case to resolve.
+
+        Returns:
+            tuple: Reference outcome and engine outcome if they differ, else ``None``.
+        """
+        expected = resolve_outcome(self.reference, case)
+
+        try:
+            outcome = resolve_outcome(self.engines[name], case)
+        except Exception as e:
+            outcome = {"error": "{}: {}".format(type(e).__name__, e)}
+
+        if outcome != expected:
+            return expected, outcome
+
+        return None
+
+    def _without_dependency(self, item, name):
+        """
+        Return a copy of an application payload without a dependency.
+
+        Arguments:
+            item (dict): Application payload.
+            name (string): Dependency name to remove.
+
+        Returns:
+            dict: Application payload copy. Item ``dependencies`` is removed when it
+            becomes empty.
+        """
+        item = dict(item)
+
+        if name in item.get("dependencies", []):
+            item["dependencies"] = [
+                dep for dep in item["dependencies"] if dep != name
+            ]
+            if not item["dependencies"]:
+                del item["dependencies"]
+
+        return item
+
+    def get_reductions(self, case):
+        """
+        Yield smaller variants of a case.
+
+        Variants are ordered from the most to the least reducing: removing an
+        application (and the references to it), removing a dependency, disabling a
+        ``push_end``, dropping the default application and disabling ``no_ordering``.
+
+        Arguments:
+            case (dict): Case to reduce.
+
+        Yields:
+            dict: Reduced case.
+        """
+        collection = case["collection"]
+
+        for item in collection:
+            name = item["name"]
+            reduced = []
+            for other in collection:
+                if other["name"] == name:
+                    continue
+                reduced.append(self._without_dependency(other, name))
+
+            yield dict(
+                case,
+                collection=reduced,
+                default_app=(
+                    None if case["default_app"] == name else case["default_app"]
+                ),
+            )
+
+        for i, item in enumerate(collection):
+            for dep in item.get("dependencies", []):
+                other = self._without_dependency(item, dep)
+                yield dict(
+                    case,
+                    collection=collection[:i] + [other] + collection[i + 1:],
+                )
+
+            if item.get("push_end"):
+                other = dict(item)
+                del other["push_end"]
+                yield dict(
+                    case,
+                    collection=collection[:i] + [other] + collection[i + 1:],
+                )
+
+        if case["default_app"]:
+            yield dict(case, default_app=None)
+
+        if case["no_ordering"]:
+            yield dict(case, no_ordering=False)
+
+    def shrink(self, name, case):
+        """
+        Shrink a failing case to a minimal case which still fails.
+
+        This is a greedy reduction, the first reduced variant which still fails is
+        retained until no variant fails anymore.
+
+        Arguments:
+            name (string): Engine name.
+            case (dict): Failing case.
+
+        Returns:
+            dict: Minimal failing case.
+        """
+        reduced = True
+
+        while reduced:
+            reduced = False
+            for variant in self.get_reductions(case):
+                if self.compare(name, variant):
+                    case = variant
+                    reduced = True
+                    break
+
+        return case
+
+    def run(self, iterations=100):
+        """
+        Compare every engines to reference on randomized cases.
+
+        Arguments:
+            iterations (integer): Number of cases to generate.
+
+        Returns:
+            list: Failures, each one is a dictionnary with the ``engine`` name, the
+            shrinked ``case`` and the ``expected`` and ``outcome`` outcomes. There is at
+            most one failure per engine since an engine is not tested anymore once it
+            failed.
+        """
+        failures = []
+        failed = set([])
+
+        for i in range(iterations):
+            case = self.generate_case()
+
+            for name in self.engines:
+                if name in failed or not self.compare(name, case):
+                    continue
+
+                minimal = self.shrink(name, case)
+                expected, outcome = self.compare(name, minimal)
+                failures.append({
+                    "engine": name,
+                    "case": minimal,
+                    "expected": expected,
+                    "outcome": outcome,
+                })
+                failed.add(name)
+
+        return failures
+
+    def dump_failure(self, failure, basedir, name):
+        """
+        Save a failure as resolver datasets.
+
+        It writes the collection as ``<name>_source.json``, the case options as
+        ``<name>_options.json`` and the reference outcome in
+        ``<name>_result.json`` (resolved payloads or error) and ``<name>_apps.json``
+        (resolved names, only for successful outcome).
+
+        Arguments:
+            failure (dict): A failure as returned from ``EquivalenceHarness.run()``.
+            basedir (pathlib.Path): Directory where to write files, commonly the
+                ``tests/data_fixtures/appstore_datasets`` directory.
+            name (string): Dataset name used as filename prefix.
+
+        Returns:
+            list: Path objects for written files.
+        """
+        case = failure["case"]
+        expected = failure["expected"]
+
+        contents = [
+            ("source", case["collection"]),
+            ("options", {
+                "default_app": case["default_app"],
+                "no_ordering": case["no_ordering"],
+            }),
+            ("result", expected.get("resolved", expected)),
+        ]
+        if "resolved" in expected:
+            contents.append(
+                ("apps", [item["name"] for item in expected["resolved"]])
+            )
+
+        written = []
+        for kind, content in contents:
+            destination = basedir / "{}_{}.json".format(name, kind)
+            destination.write_text(json.dumps(content, indent=4))
+            written.append(destination)
+
+        return written
@@ -0,0 +1,185 @@
+"""
+Synthetic application collection generators.
+
+Every generator returns a collection (a list of application payloads) ready to be
+given to ``AppStore.resolve()``. They are deterministic, the random based ones use
+their own ``random.Random`` instance initialized with the given seed.
+
+Application names are built from their index like ``app0``, ``app1``, etc.. and the
+collection is in the natural index order, except for the random based ones which are
+shuffled.
+"""
+import random
+
+
+def app_name(index):
+    """
+    Return an application name for an index.
+
+    Arguments:
+        index (integer): Application index.
+
+    Returns:
+        string: Application name.
+    """
+    return "app{}".format(index)
+
+
+def build_payload(index, dependencies=None, push_end=False):
+    """
+    Build an application payload.
+
+    Arguments:
+        index (integer): Application index.
+
+    Keyword Arguments:
+        dependencies (list): List of dependency indexes.
+        push_end (boolean): Application ``push_end`` value. Only included in
+            payload if True.
+
+    Returns:
+        dict: Application payload.
+    """
+    payload = {"name": app_name(index)}
+
+    if dependencies:
+        payload["dependencies"] = [app_name(item) for item in dependencies]
+
+    if push_end:
+        payload["push_end"] = True
+
+    return payload
+
+
+def chain_collection(size, **kwargs):
+    """
+    Every application depends on the next one, it makes the deepest possible
+    dependency tree.
+
+    The resolver has to walk the whole chain from the first application of the
+    collection.
+    """
+    return [
+        build_payload(i, dependencies=[i + 1] if i + 1 < size else None)
+        for i in range(size)
+    ]
+
+
+def fan_collection(size, **kwargs):
+    """
+    A wide fan where the first application is a dependency of every other one,
+    except the last one which depends on all the others.
+    """
+    collection = [build_payload(0)]
+
+    for i in range(1, size - 1):
+        collection.append(build_payload(i, dependencies=[0]))
+
+    if size > 1:
+        collection.append(
+            build_payload(size - 1, dependencies=list(range(size - 1)))
+        )
+
+    return collection
+
+
+def diamond_collection(size, **kwargs):
+    """
+    Stacked diamonds, each diamond top depends on two sides which both depend on the
+    previous diamond top.
+    """
+    collection = []
+
+    for i in range(size):
+        position = i % 3
+        if i == 0:
+            dependencies = None
+        elif position == 0:
+            # Diamond top
+            dependencies = [i - 2, i - 1]
+        elif position == 1:
+            dependencies = [i - 1]
+        else:
+            # Second side shares the same dependency than the first one
+            dependencies = [i - 2]
+
+        collection.append(build_payload(i, dependencies=dependencies))
+
+    return collection
+
+
+def ladder_collection(size, **kwargs):
+    """
+    Two rails where every application depends on the previous one from both rails.
+    """
+    collection = []
+
+    for i in range(size):
+        if i < 2:
+            dependencies = None
+        else:
+            dependencies = [i - 2, i - 1 if (i % 2) == 0 else i - 3]
+
+        collection.append(build_payload(i, dependencies=dependencies))
+
+    return collection
+
+
+def random_collection(size, seed=42, degree=3, push_end_ratio=0.0, **kwargs):
+    """
+    A random acyclic graph where applications only depend on applications with
+    a lower index. Collection order is shuffled.
+
+    Arguments:
+        size (integer): Number of applications.
+
+    Keyword Arguments:
+        seed (integer): Seed for the random generator.
+        degree (integer): Maximum number of dependencies for an application.
+        push_end_ratio (float): Ratio of applications in ``push_end`` mode, between
+            0 and 1.
+
+    Returns:
+        list: Collection payloads.
+    """
+    generator = random.Random(seed)
+    collection = []
+
+    for i in range(size):
+        dependencies = None
+        if i > 0:
+            dependencies = sorted(generator.sample(
+                range(i),
+                generator.randint(0, min(degree, i))
+            ))
+
+        collection.append(build_payload(
+            i,
+            dependencies=dependencies,
+            push_end=generator.random() < push_end_ratio,
+        ))
+
+    generator.shuffle(collection)
+
+    return collection
+
+
+def push_end_collection(size, seed=42, **kwargs):
+    """
+    A random acyclic graph with a lot of applications in ``push_end`` mode so
+    inheritance and final reordering are heavily involved.
+    """
+    return random_collection(size, seed=seed, push_end_ratio=0.3)
+
+
+GENERATORS = {
+    "chain": chain_collection,
+    "fan": fan_collection,
+    "diamond": diamond_collection,
+    "ladder": ladder_collection,
+    "random": random_collection,
+    "push_end": push_end_collection,
+}
+"""
+Available generators indexed on their name.
+"""
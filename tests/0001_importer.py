@@ -1,6 +1,55 @@
+import importlib
+import importlib.machinery
+import sys
+import threading
+
 import pytest
 
-from project_composer.importer import import_module
+from project_composer import importer
+from project_composer.importer import (
+    import_module, import_modules, invalidate_caches, is_lazy_module,
+    mentions_names, module_lock, peek_attribute,
+)
+
+
+class PathFinderFor:
+    """
+    A meta path finder which finds top level modules from a single directory.
+    """
+    def __init__(self, directory):
+        self.directory = directory
+
+    def find_spec(self, fullname, path, target=None):
+        return importlib.machinery.PathFinder.find_spec(
+            fullname,
+            path or [self.directory],
+        )
+
+
+class CountingFinder:
+    """
+    A meta path finder which never finds anything but counts its calls for modules
+    from test structures.
+    """
+    def __init__(self):
+        self.calls = []
+
+    def find_spec(self, fullname, path, target=None):
+        if fullname.startswith("basic_structure"):
+            self.calls.append(fullname)
+        return None
+
+
+@pytest.fixture(scope="function")
+def counting_finder(monkeypatch):
+    """
+    Install a counting finder at start of ``sys.meta_path`` with a clean spec cache.
+    """
+    finder = CountingFinder()
+    monkeypatch.setattr(sys, "meta_path", [finder] + sys.meta_path)
+    invalidate_caches()
+    yield finder
+    invalidate_caches()
 
 
 def test_import_module_success(pytester, settings, basic_structure):
@@ -26,3 +75,336 @@ def test_import_module_fail(pytester, settings, basic_structure):
 
     with pytest.raises(ModuleNotFoundError):
         import_module("basic_structure.foo.settings")
+
+
+def test_import_module_spec_cache(pytester, basic_structure, counting_finder):
+    """
+    Found specs should be cached so finders are not called again for a module which
+    is imported again, missing modules are always searched again.
+    """
+    basic_structure(pytester.path)
+
+    pytester.syspathinsert(pytester.path)
+
+    first = import_module("basic_structure.foo.settings")
+    with pytest.raises(ModuleNotFoundError):
+        import_module("basic_structure.foo.nope")
+
+    assert counting_finder.calls == [
+        "basic_structure",
+        "basic_structure.foo",
+        "basic_structure.foo.settings",
+        "basic_structure.foo.nope",
+    ]
+
+    # Import again without the modules in 'sys.modules'
+    del sys.modules["basic_structure.foo.settings"]
+    second = import_module("basic_structure.foo.settings")
+    with pytest.raises(ModuleNotFoundError):
+        import_module("basic_structure.foo.nope")
+
+    assert len(counting_finder.calls) == 5
+    assert counting_finder.calls[-1] == "basic_structure.foo.nope"
+    assert second is not first
+    assert second.__name__ == "basic_structure.foo.settings"
+
+    # Cache is not used when disabled and after invalidation
+    del sys.modules["basic_structure.foo.settings"]
+    import_module("basic_structure.foo.settings", cache=False)
+    assert len(counting_finder.calls) == 6
+
+    invalidate_caches()
+    assert importer._SPEC_CACHE == {}
+    del sys.modules["basic_structure.foo.settings"]
+    import_module("basic_structure.foo.settings")
+    assert len(counting_finder.calls) == 7
+
+
+def test_import_module_spec_cache_created(pytester, basic_structure,
+                                          counting_finder):
+    """
+    Module created after a failed import should be found.
+    """
+    basic_structure(pytester.path)
+
+    pytester.syspathinsert(pytester.path)
+
+    with pytest.raises(ModuleNotFoundError):
+        import_module("basic_structure.foo.created")
+
+    (pytester.path / "basic_structure" / "foo" / "created.py").write_text("")
+    # Like with the import statement, path finders may keep a directory listing from
+    # the same second
+    importlib.invalidate_caches()
+
+    assert import_module("basic_structure.foo.created").__name__ == (
+        "basic_structure.foo.created"
+    )
+
+
+def test_import_module_spec_cache_search_path(pytester, tmp_path, basic_structure,
+                                              counting_finder):
+    """
+    Top level module missing from a search path should be found once the search path
+    changes.
+    """
+    basic_structure(pytester.path)
+
+    with pytest.raises(ModuleNotFoundError):
+        import_module("basic_structure")
+
+    pytester.syspathinsert(pytester.path)
+
+    assert import_module("basic_structure").__name__ == "basic_structure"
+
+
+def test_import_module_spec_cache_meta_path(pytester, basic_structure,
+                                            counting_finder):
+    """
+    Module missing before a finder is installed should be found with this finder.
+    """
+    basic_structure(pytester.path)
+
+    with pytest.raises(ModuleNotFoundError):
+        import_module("basic_structure")
+
+    finder = PathFinderFor(str(pytester.path))
+    sys.meta_path.insert(0, finder)
+    try:
+        assert import_module("basic_structure").__name__ == "basic_structure"
+    finally:
+        sys.meta_path.remove(finder)
+
+
+def test_import_module_native(pytester, basic_structure, counting_finder):
+    """
+    Native mode should import with the builtin import system.
+    """
+    basic_structure(pytester.path)
+
+    pytester.syspathinsert(pytester.path)
+
+    module = import_module("basic_structure.foo.settings", native=True)
+
+    assert module.__name__ == "basic_structure.foo.settings"
+    assert importer._SPEC_CACHE == {}
+
+    with pytest.raises(ModuleNotFoundError):
+        import_module("basic_structure.foo.nope", native=True)
+
+
+def test_import_modules(pytester, basic_structure, counting_finder):
+    """
+    Batch import should return modules in given order with missing ones as None and
+    should not search for submodules of a missing package.
+    """
+    basic_structure(pytester.path)
+
+    pytester.syspathinsert(pytester.path)
+
+    modules = import_modules([
+        "basic_structure.foo.settings",
+        "basic_structure.nope.settings",
+        "basic_structure.foo",
+        "basic_structure.nope",
+        "basic_structure.ping.urls",
+        "basic_structure.nope.urls",
+    ])
+
+    assert list(modules.keys()) == [
+        "basic_structure.foo.settings",
+        "basic_structure.nope.settings",
+        "basic_structure.foo",
+        "basic_structure.nope",
+        "basic_structure.ping.urls",
+        "basic_structure.nope.urls",
+    ]
+    assert [
+        name for name, module in modules.items() if module is not None
+    ] == ["basic_structure.foo.settings", "basic_structure.foo"]
+    assert modules["basic_structure.foo"].__name__ == "basic_structure.foo"
+    assert counting_finder.calls.count("basic_structure.nope") == 1
+    assert "basic_structure.nope.settings" not in counting_finder.calls
+    assert "basic_structure.nope.urls" not in counting_finder.calls
+
+
+def test_import_modules_code_error(pytester, counting_finder):
+    """
+    Batch import should not ignore a missing module imported from a found module.
+    """
+    package = pytester.path / "broken_package"
+    package.mkdir()
+    (package / "__init__.py").write_text("import nope_dependency\n")
+
+    pytester.syspathinsert(pytester.path)
+
+    with pytest.raises(ModuleNotFoundError) as excinfo:
+        import_modules(["broken_package"])
+
+    assert excinfo.value.name == "nope_dependency"
+
+
+def test_import_module_lazy(pytester):
+    """
+    Lazy modules should only be executed when a non metadata attribute is accessed.
+    """
+    package = pytester.path / "lazy_package"
+    package.mkdir()
+    (package / "__init__.py").write_text("EXECUTED = []\n")
+    (package / "sample.py").write_text(
+        "import lazy_package\n"
+        "lazy_package.EXECUTED.append(__name__)\n"
+        "DEPENDENCIES = ['foo']\n"
+    )
+    (package / "empty.py").write_text("raise RuntimeError('Should not be executed')\n")
+
+    pytester.syspathinsert(pytester.path)
+
+    module = import_module("lazy_package.sample", lazy=True)
+    parent = sys.modules["lazy_package"]
+
+    assert is_lazy_module(module) is True
+    assert is_lazy_module(parent) is True
+    assert sys.modules["lazy_package.sample"] is module
+    assert peek_attribute(module, "__file__") == str(package / "sample.py")
+    assert peek_attribute(module, "__name__") == "lazy_package.sample"
+    assert peek_attribute(module, "DEPENDENCIES") is None
+    assert mentions_names(module, ["DEPENDENCIES"]) is True
+    assert mentions_names(module, ["PUSH_END"]) is False
+    assert is_lazy_module(module) is True
+
+    # Touching a real attribute executes module
+    assert module.DEPENDENCIES == ["foo"]
+    assert is_lazy_module(module) is False
+    assert parent.EXECUTED == ["lazy_package.sample"]
+    assert parent.sample is module
+
+    # Module which is never touched is never executed
+    empty = import_module("lazy_package.empty", lazy=True)
+    assert peek_attribute(empty, "__file__") == str(package / "empty.py")
+    assert mentions_names(empty, ["DEPENDENCIES", "PUSH_END"]) is False
+
+    # Not lazy module always mentions names
+    assert mentions_names(module, ["nope"]) is True
+    assert mentions_names(sys, ["nope"]) is True
+
+
+def test_import_module_lazy_star(pytester):
+    """
+    A lazy module with a star import may define any name.
+    """
+    package = pytester.path / "lazy_star"
+    package.mkdir()
+    (package / "__init__.py").write_text("from .base import *\n")
+    (package / "base.py").write_text("PUSH_END = True\n")
+
+    pytester.syspathinsert(pytester.path)
+
+    module = import_module("lazy_star", lazy=True)
+
+    assert mentions_names(module, ["PUSH_END"]) is True
+    assert module.PUSH_END is True
+
+
+def build_stress_repository(basepath, size):
+    """
+    Create a repository where every module records its execution into an external
+    module and takes some time to finish its execution.
+    """
+    (basepath / "stress_counter.py").write_text("EXECUTED = []\n")
+
+    repository = basepath / "stress_repository"
+    repository.mkdir()
+    (repository / "__init__.py").write_text("")
+
+    content = (
+        "import time\n"
+        "import stress_counter\n"
+        "stress_counter.EXECUTED.append(__name__)\n"
+        "time.sleep(0.005)\n"
+        "READY = True\n"
+    )
+
+    names = []
+    for i in range(size):
+        application = repository / "app{}".format(i)
+        application.mkdir()
+        (application / "__init__.py").write_text(content)
+        (application / "settings.py").write_text(content)
+        names.extend([
+            "stress_repository.app{}".format(i),
+            "stress_repository.app{}.settings".format(i),
+        ])
+
+    return names
+
+
+@pytest.mark.parametrize("cache", [True, False])
+def test_import_module_threads(pytester, cache):
+    """
+    Many threads importing the same modules should execute each module only once and
+    never get a module which is not fully initialized.
+    """
+    names = build_stress_repository(pytester.path, 10)
+    pytester.syspathinsert(pytester.path)
+    invalidate_caches()
+
+    workers = 16
+    barrier = threading.Barrier(workers)
+    errors = []
+
+    def worker(index):
+        barrier.wait()
+        # Each thread starts from a different module
+        ordered = names[index:] + names[:index]
+        try:
+            for name in ordered:
+                module = import_module(name, cache=cache)
+                assert module.READY is True
+        except BaseException as e:
+            errors.append(e)
+
+    threads = [
+        threading.Thread(target=worker, args=(i,))
+        for i in range(workers)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert sorted(sys.modules["stress_counter"].EXECUTED) == sorted(names)
+
+
+def test_import_module_failure(pytester):
+    """
+    A module which fails to execute should be removed from 'sys.modules' so a next
+    import tries again.
+    """
+    package = pytester.path / "failing_package"
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    (package / "broken.py").write_text(
+        "import failing_package\n"
+        "failing_package.ATTEMPTS = getattr(failing_package, 'ATTEMPTS', 0) + 1\n"
+        "raise RuntimeError('Broken')\n"
+    )
+    pytester.syspathinsert(pytester.path)
+
+    for i in range(2):
+        with pytest.raises(RuntimeError):
+            import_module("failing_package.broken")
+
+        assert "failing_package.broken" not in sys.modules
+
+    assert sys.modules["failing_package"].ATTEMPTS == 2
+
+
+def test_module_lock_reentrant():
+    """
+    Module lock should be reentrant for a same thread.
+    """
+    with module_lock("foo.bar"):
+        with module_lock("foo.bar"):
+            pass
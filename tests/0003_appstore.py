@@ -1,9 +1,11 @@
 import json
+from pathlib import Path
 
 import pytest
 
 from project_composer.exceptions import ComposerAppStoreError
 from project_composer.app_storage import AppNode, AppStore
+from project_composer.utils.equivalence import resolve_outcome
 
 
 def test_appnode_to_dict():
@@ -94,7 +96,90 @@ def test_appstore_collection_circular_reference(settings):
     with pytest.raises(ComposerAppStoreError) as exc_info:
         resolver.resolve(json.loads(source_path.read_text()))
 
-    assert exc_info.value.args[0] == "Circular reference detected: ping -> bar"
+    assert exc_info.value.args[0] == (
+        "Circular references detected in 1 group(s): [bar, ping] "
+        "(bar -> ping, ping -> bar)"
+    )
+
+
+def test_appstore_find_cycles(settings):
+    """
+    Every cycle groups should be found in a single pass, with their members and
+    involved edges.
+    """
+    store = AppStore()
+    source_path = (
+        settings.fixtures_path / "appstore_datasets" / "circular_multiple_source.json"
+    )
+    store.process_collection(json.loads(source_path.read_text()))
+
+    assert store.find_cycles() == [
+        (
+            ["bar", "ping", "pong"],
+            [("bar", "ping"), ("ping", "pong"), ("pong", "bar")],
+        ),
+        (
+            ["zip", "zap"],
+            [("zip", "zap"), ("zap", "zip")],
+        ),
+        (
+            ["selfish"],
+            [("selfish", "selfish")],
+        ),
+    ]
+
+
+def test_appstore_find_cycles_none(settings):
+    """
+    A collection without circular reference should not have any cycle group.
+    """
+    store = AppStore()
+    source_path = (
+        settings.fixtures_path / "appstore_datasets" / "advanced_complex_source.json"
+    )
+    store.process_collection(json.loads(source_path.read_text()))
+
+    assert store.find_cycles() == []
+
+
+def test_appstore_collection_circular_reference_multiple(settings):
+    """
+    Resolving should report every circular references in a single exception.
+    """
+    resolver = AppStore()
+    source_path = (
+        settings.fixtures_path / "appstore_datasets" / "circular_multiple_source.json"
+    )
+
+    with pytest.raises(ComposerAppStoreError) as exc_info:
+        resolver.resolve(json.loads(source_path.read_text()))
+
+    assert exc_info.value.args[0] == (
+        "Circular references detected in 3 group(s): "
+        "[bar, ping, pong] (bar -> ping, ping -> pong, pong -> bar); "
+        "[zip, zap] (zip -> zap, zap -> zip); "
+        "[selfish] (selfish -> selfish)"
+    )
+
+
+def test_appstore_find_cycles_deep_chain():
+    """
+    Cycle search is iterative so it should not be limited by recursion limit.
+    """
+    size = 5000
+    store = AppStore()
+    store.process_collection([
+        {
+            "name": "app{}".format(i),
+            "dependencies": ["app{}".format((i + 1) % size)],
+        }
+        for i in range(size)
+    ])
+
+    cycles = store.find_cycles()
+
+    assert len(cycles) == 1
+    assert len(cycles[0][0]) == size
 
 
 def test_appstore_collection_circular_reference_disabled(settings):
@@ -469,3 +554,158 @@ def test_appstore_dump_resolve_datasets(settings, source, expected, default_app)
     # print()
 
     assert resolved_payload == json.loads(result_path.read_text())
+
+
+@pytest.mark.parametrize("names, expected", [
+    ([], []),
+    (["nope"], []),
+    (["rest"], ["rest"]),
+    (["cms"], ["cms", "cms_blog"]),
+    (["editor"], ["blog", "cms", "cms_blog", "editor"]),
+    (["filer", "rest"], ["blog", "cms", "cms_blog", "filer", "rest"]),
+    (
+        ["forms"],
+        ["blog", "cms", "cms_blog", "editor", "filer", "forms", "rest"],
+    ),
+])
+def test_appstore_get_dependents(settings, names, expected):
+    """
+    Method should return given application names with all of their direct and
+    indirect dependents.
+    """
+    source_path = (
+        settings.fixtures_path / "appstore_datasets" /
+        "advanced_dependencies_source.json"
+    )
+
+    store = AppStore()
+    store.process_collection(json.loads(source_path.read_text()))
+
+    assert sorted(store.get_dependents(names)) == expected
+
+
+@pytest.mark.parametrize("source, default_app, expected", [
+    (
+        "minimal_single_source.json",
+        None,
+        [["foo"]],
+    ),
+    (
+        "advanced_dependencies_source.json",
+        None,
+        [
+            ["forms", "django"],
+            ["editor", "filer", "rest"],
+            ["cms", "blog"],
+            ["cms_blog"],
+        ],
+    ),
+    # Applications in push_end mode are always in the last levels
+    (
+        "advanced_complex_source.json",
+        None,
+        [
+            ["forms", "django"],
+            ["editor", "filer", "asset_manager", "contact"],
+            ["blog"],
+            ["rest", "cms"],
+            ["shop", "cms_blog", "cms_contact"],
+        ],
+    ),
+    (
+        "advanced_complex_source.json",
+        "django",
+        [
+            ["django"],
+            ["forms", "asset_manager"],
+            ["editor", "filer", "contact"],
+            ["blog"],
+            ["rest", "cms"],
+            ["shop", "cms_blog", "cms_contact"],
+        ],
+    ),
+])
+def test_appstore_resolve_levels(settings, source, default_app, expected):
+    """
+    Resolved applications should be grouped in levels where each application only
+    depends on applications from previous levels.
+    """
+    source_path = settings.fixtures_path / "appstore_datasets" / source
+
+    store = AppStore(default_app=default_app)
+    levels = store.resolve_levels(json.loads(source_path.read_text()))
+
+    assert [[item.name for item in level] for level in levels] == expected
+
+    # Ensure every dependency is in a previous level
+    seen = set([])
+    for level in levels:
+        for app in level:
+            assert set(app.dependency_names).issubset(seen)
+        seen.update([app.name for app in level])
+
+
+def test_appstore_get_levels_unresolved(settings):
+    """
+    Levels can not be computed from applications which are not in a resolved order.
+    """
+    source_path = (
+        settings.fixtures_path / "appstore_datasets" /
+        "advanced_dependencies_source.json"
+    )
+
+    store = AppStore()
+    apps = store.resolve(json.loads(source_path.read_text()), no_ordering=True)
+
+    with pytest.raises(ComposerAppStoreError) as exc_info:
+        store.get_levels(apps)
+
+    assert exc_info.value.args[0] == (
+        "Application 'cms' is before its dependency 'editor', levels can only be "
+        "computed from resolved applications."
+    )
+
+
+def test_appstore_get_levels_push_end_dependency():
+    """
+    Levels can not be computed when an application depends on an application in
+    ``push_end`` mode which is in a later partition.
+    """
+    store = AppStore()
+    apps = store.resolve(
+        [
+            {"name": "a", "dependencies": ["b"]},
+            {"name": "b", "push_end": True},
+        ],
+        no_ordering=True,
+    )
+
+    with pytest.raises(ComposerAppStoreError) as exc_info:
+        store.get_levels(apps)
+
+    assert exc_info.value.args[0] == (
+        "Application 'a' is before its dependency 'b', levels can only be "
+        "computed from resolved applications."
+    )
+
+
+@pytest.mark.parametrize("name", sorted([
+    path.name[:-len("_options.json")]
+    for path in (
+        Path(__file__).parent / "data_fixtures" / "appstore_datasets"
+    ).glob("*_options.json")
+]))
+def test_appstore_equivalence_datasets(settings, name):
+    """
+    Datasets saved from equivalence harness failures should be resolved as expected.
+    """
+    basedir = settings.fixtures_path / "appstore_datasets"
+    options = json.loads((basedir / (name + "_options.json")).read_text())
+
+    assert resolve_outcome(AppStore, {
+        "collection": json.loads((basedir / (name + "_source.json")).read_text()),
+        "default_app": options["default_app"],
+        "no_ordering": options["no_ordering"],
+    }) == {
+        "resolved": json.loads((basedir / (name + "_result.json")).read_text())
+    }
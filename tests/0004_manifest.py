@@ -17,6 +17,7 @@ def test_manifest_to_dict():
         syspaths=["flip", "flop", "flip"],
         default_store_app="base",
         no_ordering=False,
+        resolver="cached",
         requirements=RequirementsConfig(
             application_label="label",
             application_divider="div",
@@ -34,11 +35,15 @@ def test_manifest_to_dict():
         "repository": "plop.plip",
         "default_store_app": "base",
         "no_ordering": False,
+        "resolver": "cached",
         "syspaths": [
             "flip",
             "flop",
             "flip"
         ],
+        "archive": None,
+        "class_index": None,
+        "lockfile": None,
         "requirements": {
             "application_label": "label",
             "application_divider": "div",
@@ -116,8 +121,12 @@ def test_manifest_load_invalid_format(settings, manifest_filename, exception, ex
             ],
             "repository": "basic_structure",
             "syspaths": [],
+            "archive": None,
+            "class_index": None,
+            "lockfile": None,
             "default_store_app": None,
             "no_ordering": False,
+            "resolver": "reference",
             "requirements": {
                 "application_label": None,
                 "application_divider": None,
@@ -139,8 +148,12 @@ def test_manifest_load_invalid_format(settings, manifest_filename, exception, ex
             ],
             "repository": "basic_structure",
             "syspaths": [],
+            "archive": None,
+            "class_index": None,
+            "lockfile": None,
             "default_store_app": None,
             "no_ordering": False,
+            "resolver": "reference",
             "requirements": {
                 "application_label": None,
                 "application_divider": None,
@@ -165,8 +178,12 @@ def test_manifest_load_invalid_format(settings, manifest_filename, exception, ex
             ],
             "repository": "basic_structure",
             "syspaths": ["container"],
+            "archive": None,
+            "class_index": None,
+            "lockfile": None,
             "default_store_app": "foo",
             "no_ordering": False,
+            "resolver": "iterative",
             "requirements": {
                 "application_label": "# {name}\n",
                 "application_divider": "\n",
@@ -191,8 +208,12 @@ def test_manifest_load_invalid_format(settings, manifest_filename, exception, ex
             ],
             "repository": "basic_structure",
             "syspaths": ["container"],
+            "archive": None,
+            "class_index": None,
+            "lockfile": None,
             "default_store_app": "foo",
             "no_ordering": False,
+            "resolver": "iterative",
             "requirements": {
                 "application_label": "# {name}\n",
                 "application_divider": "\n",
@@ -0,0 +1,69 @@
+import pytest
+
+from project_composer.app_storage import AppStore
+from project_composer.utils.graphs import GENERATORS
+
+
+@pytest.mark.parametrize("name", GENERATORS.keys())
+@pytest.mark.parametrize("size", [1, 2, 10, 31])
+def test_generators_valid(name, size):
+    """
+    Every generator should build a valid collection of the requested size without any
+    circular reference.
+    """
+    collection = GENERATORS[name](size)
+
+    assert len(collection) == size
+    assert len(set([item["name"] for item in collection])) == size
+
+    store = AppStore()
+    store.process_collection(collection)
+    assert store.find_cycles() == []
+
+
+def test_generators_deterministic():
+    """
+    Random based generators should always build the same collection for the same
+    seed.
+    """
+    assert GENERATORS["random"](50, seed=1) == GENERATORS["random"](50, seed=1)
+    assert GENERATORS["random"](50, seed=1) != GENERATORS["random"](50, seed=2)
+
+
+def test_generators_shapes():
+    """
+    Generators should build their expected shapes.
+    """
+    assert GENERATORS["chain"](3) == [
+        {"name": "app0", "dependencies": ["app1"]},
+        {"name": "app1", "dependencies": ["app2"]},
+        {"name": "app2"},
+    ]
+
+    assert GENERATORS["fan"](4) == [
+        {"name": "app0"},
+        {"name": "app1", "dependencies": ["app0"]},
+        {"name": "app2", "dependencies": ["app0"]},
+        {"name": "app3", "dependencies": ["app0", "app1", "app2"]},
+    ]
+
+    assert GENERATORS["diamond"](4) == [
+        {"name": "app0"},
+        {"name": "app1", "dependencies": ["app0"]},
+        {"name": "app2", "dependencies": ["app0"]},
+        {"name": "app3", "dependencies": ["app1", "app2"]},
+    ]
+
+    assert GENERATORS["ladder"](5) == [
+        {"name": "app0"},
+        {"name": "app1"},
+        {"name": "app2", "dependencies": ["app0", "app1"]},
+        {"name": "app3", "dependencies": ["app1", "app0"]},
+        {"name": "app4", "dependencies": ["app2", "app3"]},
+    ]
+
+    assert len([
+        item
+        for item in GENERATORS["push_end"](100)
+        if item.get("push_end")
+    ]) > 10
@@ -0,0 +1,164 @@
+import pytest
+
+from project_composer.benchmarks import (
+    ImporterBenchmark, ResolverBenchmark, UrlsBenchmark
+)
+from project_composer.exceptions import ComposerBenchmarkError
+
+
+def test_resolver_benchmark_run():
+    """
+    Benchmark should measure every stage for each case.
+    """
+    benchmark = ResolverBenchmark(
+        generators=["chain", "random"],
+        sizes=[20, 5],
+        repeat=2,
+    )
+    lines = []
+    results = benchmark.run(printer=lines.append)
+
+    assert results["store"] == "AppStore"
+    assert list(results["cases"].keys()) == [
+        "chain:5", "chain:20", "random:5", "random:20",
+    ]
+    assert len(lines) == 4
+
+    for name, case in results["cases"].items():
+        assert case["status"] == "ok"
+        assert sorted(case["stages"].keys()) == sorted(benchmark.STAGES)
+        for measures in case["stages"].values():
+            assert measures["time"] >= 0
+            assert measures["peak_memory"] >= 0
+
+
+def test_resolver_benchmark_skip_after_failure():
+    """
+    Once a case failed, bigger sizes from the same generator should be skipped.
+    """
+    benchmark = ResolverBenchmark(
+        generators=["chain"],
+        sizes=[5, 5000, 10000],
+        repeat=1,
+        timeout=30,
+    )
+    # Enforce a failure from recursion limit
+    benchmark.run_case = lambda *args: (
+        {"status": "error", "error": "Boom"} if args[3] > 5 else {
+            "status": "ok",
+            "stages": {
+                stage: {"time": 0, "peak_memory": 0}
+                for stage in benchmark.STAGES
+            },
+        }
+    )
+    results = benchmark.run()
+
+    assert [item["status"] for item in results["cases"].values()] == [
+        "ok", "error", "skipped",
+    ]
+
+
+def test_resolver_benchmark_timeout():
+    """
+    A case exceeding time limit should be marked as timeout.
+    """
+    benchmark = ResolverBenchmark(
+        generators=["ladder"],
+        sizes=[200],
+        repeat=1,
+        timeout=1,
+    )
+
+    assert benchmark.run()["cases"]["ladder:200"] == {"status": "timeout"}
+
+
+def test_benchmark_compare():
+    """
+    Comparison should report status and time regressions against baseline.
+    """
+    def case(status="ok", process=0.1, resolve=0.1):
+        if status != "ok":
+            return {"status": status}
+
+        return {
+            "status": status,
+            "stages": {
+                "process": {"time": process, "peak_memory": 0},
+                "resolve": {"time": resolve, "peak_memory": 0},
+            },
+        }
+
+    baseline = {"cases": {
+        "chain:10": case(),
+        "chain:100": case(),
+        "fan:10": case(process=0.0001),
+        "fan:100": case(status="timeout"),
+        "ladder:10": case(),
+    }}
+    results = {"cases": {
+        "chain:10": case(process=0.12, resolve=0.05),
+        "chain:100": case(process=0.2),
+        "fan:10": case(process=0.0005),
+        "fan:100": case(),
+        "ladder:10": case(status="error"),
+    }}
+
+    benchmark = ResolverBenchmark()
+
+    assert benchmark.compare(baseline, results) == [
+        "chain:100: stage 'process' time 0.100000s -> 0.200000s",
+        "ladder:10: status changed from 'ok' to 'error'",
+    ]
+
+    assert benchmark.compare(baseline, results, tolerance=1.5) == [
+        "ladder:10: status changed from 'ok' to 'error'",
+    ]
+
+
+def test_benchmark_dump_load(tmp_path):
+    """
+    Results should be dumped and loaded from JSON and an invalid file raises a proper
+    error.
+    """
+    benchmark = ResolverBenchmark()
+    results = {"cases": {"chain:10": {"status": "timeout"}}}
+
+    destination = benchmark.dump(results, tmp_path / "baseline.json")
+    assert benchmark.load(destination) == results
+
+    destination.write_text("nope")
+    with pytest.raises(ComposerBenchmarkError):
+        benchmark.load(destination)
+
+
+def test_importer_benchmark_run():
+    """
+    Importer benchmark should measure every stage for each mode.
+    """
+    benchmark = ImporterBenchmark(sizes=[3], repeat=1)
+    lines = []
+    results = benchmark.run(printer=lines.append)
+
+    assert list(results["cases"].keys()) == ["cached:3", "uncached:3", "native:3"]
+    assert len(lines) == 3
+
+    for name, case in results["cases"].items():
+        assert case["status"] == "ok"
+        assert sorted(case["stages"].keys()) == sorted(benchmark.STAGES)
+
+
+def test_urls_benchmark_run():
+    """
+    Urls benchmark should measure every stage for each layout.
+    """
+    pytest.importorskip("django")
+
+    benchmark = UrlsBenchmark(sizes=[30], repeat=1)
+    results = benchmark.run()
+
+    assert list(results["cases"].keys()) == ["flat:30", "grouped:30"]
+
+    for name, case in results["cases"].items():
+        assert case["status"] == "ok"
+        assert sorted(case["stages"].keys()) == sorted(benchmark.STAGES)
@@ -0,0 +1,127 @@
+from project_composer.app_storage import AppStore
+from project_composer.utils.equivalence import EquivalenceHarness, resolve_outcome
+
+
+class SameStore(AppStore):
+    """
+    An engine identical to the reference.
+    """
+    pass
+
+
+class NoInheritanceStore(AppStore):
+    """
+    A broken engine which forgets about 'push_end' inheritance.
+    """
+    def apply_inheritance(self, resolved):
+        pass
+
+
+class CrashingStore(AppStore):
+    """
+    A broken engine which crashes with a collection of more than two applications.
+    """
+    def resolve(self, collection, **kwargs):
+        if len(collection) > 2:
+            raise KeyError("Boom")
+
+        return super().resolve(collection, **kwargs)
+
+
+def test_resolve_outcome():
+    """
+    Outcome should be either the resolved payloads or the error message.
+    """
+    assert resolve_outcome(AppStore, {
+        "collection": [{"name": "foo", "dependencies": ["bar"]}, {"name": "bar"}],
+        "default_app": None,
+        "no_ordering": False,
+    }) == {
+        "resolved": [
+            {"name": "bar", "dependencies": [], "push_end": False},
+            {"name": "foo", "dependencies": ["bar"], "push_end": False},
+        ]
+    }
+
+    assert resolve_outcome(AppStore, {
+        "collection": [{"name": "foo", "dependencies": ["bar"]}],
+        "default_app": None,
+        "no_ordering": False,
+    }) == {
+        "error": (
+            "ComposerAppStoreError: Dependency 'bar' from application 'foo' is not a "
+            "registered application."
+        )
+    }
+
+
+def test_harness_generate_case():
+    """
+    Generated cases should be deterministic from seed.
+    """
+    first = EquivalenceHarness({}, seed=1)
+    second = EquivalenceHarness({}, seed=1)
+
+    cases = [first.generate_case() for i in range(20)]
+
+    assert cases == [second.generate_case() for i in range(20)]
+    assert all([len(case["collection"]) <= 30 for case in cases])
+
+
+def test_harness_equivalent_engine():
+    """
+    An engine identical to reference should not have any failure, including for
+    invalid collections.
+    """
+    harness = EquivalenceHarness({"same": SameStore}, invalid_ratio=0.5)
+
+    assert harness.run(iterations=200) == []
+
+
+def test_harness_shrink_failure():
+    """
+    A failing engine should be reported with a minimal failing case.
+    """
+    harness = EquivalenceHarness({
+        "same": SameStore,
+        "noinherit": NoInheritanceStore,
+        "crashing": CrashingStore,
+    })
+
+    failures = {item["engine"]: item for item in harness.run(iterations=100)}
+
+    assert sorted(failures.keys()) == ["crashing", "noinherit"]
+
+    # Minimal case for inheritance is an application depending on a "push_end" one
+    noinherit = failures["noinherit"]
+    assert noinherit["case"]["default_app"] is None
+    assert noinherit["case"]["no_ordering"] is False
+    assert len(noinherit["case"]["collection"]) == 2
+    assert [item["push_end"] for item in noinherit["expected"]["resolved"]] == [
+        True, True
+    ]
+
+    # Minimal case for crash is three applications without any dependency
+    crashing = failures["crashing"]
+    assert crashing["outcome"] == {"error": "KeyError: 'Boom'"}
+    assert [
+        sorted(item.keys())
+        for item in crashing["case"]["collection"]
+    ] == [["name"], ["name"], ["name"]]
+
+
+def test_harness_dump_failure(tmp_path):
+    """
+    Failure should be saved as resolver datasets.
+    """
+    harness = EquivalenceHarness({"noinherit": NoInheritanceStore})
+    failure = harness.run(iterations=100)[0]
+
+    written = harness.dump_failure(failure, tmp_path, "sample")
+
+    assert [item.name for item in written] == [
+        "sample_source.json",
+        "sample_options.json",
+        "sample_result.json",
+        "sample_apps.json",
+    ]
@@ -0,0 +1,356 @@
+import json
+import sys
+import threading
+
+import pytest
+
+from project_composer.app_storage import (
+    AppStore, ArrayAppStore, CachedAppStore, IterativeAppStore, get_engine,
+    register_engine,
+)
+from project_composer.app_storage.engines import ENGINES
+from project_composer.exceptions import ComposerAppStoreError
+from project_composer.utils.equivalence import EquivalenceHarness, resolve_outcome
+from project_composer.utils.graphs import GENERATORS, chain_collection
+
+
+ALTERNATIVES = sorted([name for name in ENGINES if name != "reference"])
+
+
+@pytest.fixture(autouse=True)
+def clear_cached_engine():
+    """
+    Cached engine results are shared between tests, each test starts with an empty
+    cache.
+    """
+    size = CachedAppStore.CACHE_SIZE
+    CachedAppStore.clear_cache()
+    yield
+    CachedAppStore.set_cache_size(size)
+    CachedAppStore.clear_cache()
+
+
+@pytest.mark.parametrize("name, expected", [
+    (None, AppStore),
+    ("", AppStore),
+    ("reference", AppStore),
+    ("iterative", IterativeAppStore),
+    ("array", ArrayAppStore),
+    ("cached", CachedAppStore),
+])
+def test_get_engine(name, expected):
+    """
+    Engines should be retrieved from their name and default to the reference one.
+    """
+    assert get_engine(name) is expected
+
+
+def test_get_engine_unknown():
+    """
+    An unknown engine name should raise an error with available names.
+    """
+    with pytest.raises(ComposerAppStoreError) as excinfo:
+        get_engine("nope")
+
+    assert str(excinfo.value) == (
+        "Unknown resolver engine 'nope', available ones are: reference, iterative, "
+        "array, cached"
+    )
+
+
+def test_register_engine():
+    """
+    A new engine can be registered once.
+    """
+    class DummyAppStore(AppStore):
+        pass
+
+    try:
+        register_engine("dummy", DummyAppStore)
+        assert get_engine("dummy") is DummyAppStore
+
+        with pytest.raises(ComposerAppStoreError) as excinfo:
+            register_engine("dummy", AppStore)
+
+        assert str(excinfo.value) == (
+            "A resolver engine is already registered with name 'dummy'."
+        )
+    finally:
+        ENGINES.pop("dummy", None)
+
+
+@pytest.mark.parametrize("name, expected", [
+    ("reference", {"incremental": True, "thread_safe": False, "snapshot": False}),
+    ("iterative", {"incremental": True, "thread_safe": False, "snapshot": False}),
+    ("array", {"incremental": True, "thread_safe": False, "snapshot": False}),
+    ("cached", {"incremental": False, "thread_safe": True, "snapshot": False}),
+])
+def test_engine_capabilities(name, expected):
+    """
+    Each engine should report its capability flags.
+    """
+    assert get_engine(name).get_capabilities() == expected
+
+
+@pytest.mark.parametrize("name", ALTERNATIVES)
+@pytest.mark.parametrize("source, expected, default_app", [
+    ("basic_dependencies_push_end_source.json",
+     "basic_dependencies_push_end_result.json", None),
+    ("advanced_dependencies_source.json",
+     "advanced_dependencies_default-app_result.json", "django"),
+    ("advanced_complex_source.json",
+     "advanced_complex_result.json", None),
+    ("advanced_complex_source.json",
+     "advanced_complex_default-app_result.json", "django"),
+])
+def test_engine_resolve_datasets(settings, name, source, expected, default_app):
+    """
+    Engines should resolve datasets exactly like the reference store.
+    """
+    basedir = settings.fixtures_path / "appstore_datasets"
+
+    resolved = get_engine(name)(default_app=default_app).resolve(
+        json.loads((basedir / source).read_text())
+    )
+
+    assert [item.to_payload() for item in resolved] == json.loads(
+        (basedir / expected).read_text()
+    )
+
+
+@pytest.mark.parametrize("name", ALTERNATIVES)
+@pytest.mark.parametrize("generator", sorted(GENERATORS.keys()))
+def test_engine_generators(name, generator):
+    """
+    Engines should have the same outcome than the reference store on every generated
+    collection shapes.
+    """
+    case = {
+        "collection": GENERATORS[generator](20),
+        "default_app": None,
+        "no_ordering": False,
+    }
+
+    assert resolve_outcome(get_engine(name), case) == resolve_outcome(AppStore, case)
+
+
+def test_engine_equivalence():
+    """
+    Every alternative engine should have the same outcome than the reference store on
+    randomized collections.
+    """
+    harness = EquivalenceHarness(
+        {name: get_engine(name) for name in ALTERNATIVES},
+        seed=7,
+    )
+
+    assert harness.run(iterations=200) == []
+
+
+@pytest.mark.parametrize("engine", [IterativeAppStore, ArrayAppStore])
+def test_engine_deep_chain(engine):
+    """
+    Iterative engines are not limited by the recursion limit.
+    """
+    size = sys.getrecursionlimit() * 2
+
+    resolved = engine().resolve(chain_collection(size), flat=True)
+
+    assert len(resolved) == size
+    assert resolved[0] == "app{}".format(size - 1)
+    assert resolved[-1] == "app0"
+
+
+@pytest.mark.parametrize("name", ALTERNATIVES)
+def test_engine_get_app(name):
+    """
+    Engines should retrieve their processed applications from their name.
+    """
+    store = get_engine(name)()
+    store.resolve([{"name": "foo"}, {"name": "bar", "dependencies": ["foo"]}])
+
+    assert store.get_app("bar").dependency_names == ["foo"]
+    assert store.get_app("nope") is None
+    assert store.get_app("nope", default="plop") == "plop"
+    assert store.get_dependents(["foo"]) == {"foo", "bar"}
+
+
+def test_cached_engine_shared():
+    """
+    Cached engine should share results between stores for the same collection and
+    options.
+    """
+    collection = [{"name": "foo"}, {"name": "bar", "dependencies": ["foo"]}]
+
+    first = CachedAppStore().resolve(collection)
+    second = CachedAppStore().resolve(json.loads(json.dumps(collection)))
+
+    assert [item.name for item in first] == ["foo", "bar"]
+    assert [item.to_dict(flat=True) for item in first] == [
+        item.to_dict(flat=True) for item in second
+    ]
+    # Each store gets its own nodes
+    assert not any([a is b for a, b in zip(first, second)])
+    assert CachedAppStore.cache_info()["hits"] == 1
+
+    CachedAppStore(default_app="foo").resolve(collection)
+    CachedAppStore().resolve(collection, no_ordering=True)
+    assert CachedAppStore.cache_info()["size"] == 3
+
+    assert CachedAppStore().resolve(collection, flat=True) == ["foo", "bar"]
+    assert CachedAppStore.cache_info()["hits"] == 2
+
+
+def test_cached_engine_errors():
+    """
+    Cached engine should not cache errors.
+    """
+    collection = [{"name": "foo", "dependencies": ["bar"]}]
+
+    for i in range(2):
+        with pytest.raises(ComposerAppStoreError) as excinfo:
+            CachedAppStore().resolve(collection)
+
+        assert str(excinfo.value) == (
+            "Dependency 'bar' from application 'foo' is not a registered application."
+        )
+
+    assert CachedAppStore._CACHE == {}
+
+
+def test_cached_engine_threads():
+    """
+    A single cached store can resolve from multiple threads.
+    """
+    store = CachedAppStore()
+    results = []
+
+    def worker(size):
+        results.append(store.resolve(chain_collection(size), flat=True)[0])
+
+    threads = [
+        threading.Thread(target=worker, args=(size,))
+        for size in range(1, 21)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(results) == sorted(["app{}".format(i) for i in range(20)])
+
+
+def test_cached_engine_key():
+    """
+    Cache key should only depend on payload contents and resolving options.
+    """
+    store = CachedAppStore()
+    key = store.get_cache_key([{"name": "foo", "push_end": True}, {"name": "bar"}])
+
+    assert len(key) == 64
+    assert key == CachedAppStore().get_cache_key(
+        [{"push_end": True, "name": "foo"}, {"name": "bar"}]
+    )
+    assert key != store.get_cache_key(
+        [{"name": "bar"}, {"name": "foo", "push_end": True}]
+    )
+    assert key != store.get_cache_key(
+        [{"name": "foo", "push_end": True}, {"name": "bar"}],
+        no_ordering=True,
+    )
+    assert key != CachedAppStore(default_app="bar").get_cache_key(
+        [{"name": "foo", "push_end": True}, {"name": "bar"}]
+    )
+
+
+def test_cached_engine_lru():
+    """
+    Cache should count hits and misses and drop the least recently used results once
+    it is full.
+    """
+    CachedAppStore.set_cache_size(2)
+
+    CachedAppStore().resolve(chain_collection(1))
+    CachedAppStore().resolve(chain_collection(2))
+    # Hit makes the first collection the most recently used
+    CachedAppStore().resolve(chain_collection(1))
+    # Third collection drops the second one
+    CachedAppStore().resolve(chain_collection(3))
+
+    assert CachedAppStore.cache_info() == {
+        "hits": 1,
+        "misses": 3,
+        "size": 2,
+        "maxsize": 2,
+    }
+
+    CachedAppStore().resolve(chain_collection(1))
+    CachedAppStore().resolve(chain_collection(2))
+
+    assert CachedAppStore.cache_info() == {
+        "hits": 2,
+        "misses": 4,
+        "size": 2,
+        "maxsize": 2,
+    }
+
+    # Reducing size drops the least recently used results
+    CachedAppStore.set_cache_size(1)
+    assert CachedAppStore.cache_info()["size"] == 1
+
+    CachedAppStore().resolve(chain_collection(2))
+    assert CachedAppStore.cache_info()["hits"] == 3
+
+
+def test_cached_engine_disabled():
+    """
+    Cache with a zero size should never keep anything.
+    """
+    CachedAppStore.set_cache_size(0)
+
+    for i in range(2):
+        assert CachedAppStore().resolve(chain_collection(2), flat=True) == [
+            "app1", "app0",
+        ]
+
+    assert CachedAppStore.cache_info() == {
+        "hits": 0,
+        "misses": 2,
+        "size": 0,
+        "maxsize": 0,
+    }
+
+
+def test_cached_engine_snapshot():
+    """
+    Cached results are immutable and stores get their own lists and nodes.
+    """
+    store = CachedAppStore()
+    resolved = store.resolve(chain_collection(2))
+    resolved.append("nope")
+    store.processed_apps.append("nope")
+
+    processed, cached = list(CachedAppStore._CACHE.values())[0]
+
+    assert isinstance(processed, tuple)
+    assert isinstance(cached, tuple)
+    assert CachedAppStore().resolve(chain_collection(2), flat=True) == [
+        "app1", "app0",
+    ]
+
+    # Modifying returned nodes does not alter the next results
+    other = CachedAppStore()
+    nodes = other.resolve(chain_collection(2))
+    assert nodes[0] is not cached[0]
+    assert nodes[1].dependencies[0] is nodes[0]
+    assert other.get_app("app0") is nodes[1]
+
+    nodes[1].push_end = True
+    nodes[1].dependencies.clear()
+    nodes[1].add_dependency_name("nope")
+
+    again = CachedAppStore().resolve(chain_collection(2))
+    assert [item.to_dict(flat=True) for item in again] == [
+        item.to_dict(flat=True) for item in cached
+    ]
+    assert again[1].dependency_names == cached[1].dependency_names
@@ -0,0 +1,143 @@
+import sys
+
+import pytest
+
+from project_composer.exceptions import ComposerError
+from project_composer.finder import (
+    RepositoryFinder, install_finder, uninstall_finder,
+)
+from project_composer.importer import import_module
+
+
+FINDER_REPOSITORY = {
+    "finder_repository/__init__.py": "",
+    "finder_repository/blog/__init__.py": "DEPENDENCIES = []\n",
+    "finder_repository/blog/settings.py": "ENABLED = True\n",
+    "finder_repository/blog/templates": None,
+    "finder_repository/single.py": "SINGLE = True\n",
+    "finder_repository/namespace": None,
+    "finder_repository/not-valid": None,
+    "finder_repository/__pycache__": None,
+    "finder_repository/.hidden.py": "",
+}
+"""
+Repository package with various kind of applications.
+"""
+
+
+def test_finder_index(pytester, file_structure):
+    """
+    Finder should index repository applications and submodules from package
+    applications.
+    """
+    file_structure(pytester.path, FINDER_REPOSITORY)
+    repository = pytester.path / "finder_repository"
+
+    finder = RepositoryFinder("finder_repository", str(repository))
+
+    assert finder.index == {
+        "blog": (
+            str(repository / "blog" / "__init__.py"),
+            {
+                "settings": (str(repository / "blog" / "settings.py"), False),
+                "templates": (None, True),
+            },
+        ),
+        "single": (str(repository / "single.py"), None),
+        "namespace": (None, None),
+    }
+
+    (repository / "shop.py").write_text("")
+    finder.invalidate_caches()
+    assert "shop" in finder.index
+
+
+def test_finder_find_spec(pytester, file_structure):
+    """
+    Finder should build specs for indexed modules and raise a definite miss for
+    unknown applications and submodules.
+    """
+    file_structure(pytester.path, FINDER_REPOSITORY)
+    repository = pytester.path / "finder_repository"
+    finder = RepositoryFinder("finder_repository", str(repository))
+    app_path = [str(repository / "blog")]
+
+    spec = finder.find_spec("finder_repository.blog", [str(repository)])
+    assert spec.origin == str(repository / "blog" / "__init__.py")
+    assert spec.submodule_search_locations == [str(repository / "blog")]
+
+    spec = finder.find_spec("finder_repository.single", [str(repository)])
+    assert spec.origin == str(repository / "single.py")
+    assert spec.submodule_search_locations is None
+
+    spec = finder.find_spec("finder_repository.blog.settings", app_path)
+    assert spec.origin == str(repository / "blog" / "settings.py")
+
+    # Modules which are not managed by the finder
+    assert finder.find_spec("finder_repository", None) is None
+    assert finder.find_spec("other.blog", None) is None
+    assert finder.find_spec("finder_repository.namespace", [str(repository)]) is None
+    assert finder.find_spec("finder_repository.blog.templates", app_path) is None
+    assert finder.find_spec("finder_repository.blog.settings.foo", None) is None
+    assert finder.find_spec("finder_repository.blog", ["/elsewhere"]) is None
+    assert finder.find_spec("finder_repository.blog.nope", ["/elsewhere"]) is None
+
+    for name, path in [
+        ("finder_repository.nope", [str(repository)]),
+        ("finder_repository.blog.nope", app_path),
+    ]:
+        with pytest.raises(ModuleNotFoundError) as excinfo:
+            finder.find_spec(name, path)
+
+        assert excinfo.value.name == name
+
+
+def test_finder_import(pytester, file_structure, meta_path):
+    """
+    Modules should be imported from the finder and a missing application should not
+    be searched from other finders.
+    """
+    file_structure(pytester.path, FINDER_REPOSITORY)
+    repository = pytester.path / "finder_repository"
+    pytester.syspathinsert(pytester.path)
+
+    finder = install_finder("finder_repository", str(repository))
+    assert sys.meta_path[0] is finder
+
+    module = import_module("finder_repository.blog.settings")
+    assert module.ENABLED is True
+    assert module.__spec__.loader.path == str(repository / "blog" / "settings.py")
+
+    # Namespace package is left to the default finders
+    assert import_module("finder_repository.namespace").__spec__.origin is None
+
+    with pytest.raises(ModuleNotFoundError) as excinfo:
+        import_module("finder_repository.nope")
+
+    assert excinfo.value.name == "finder_repository.nope"
+
+
+def test_install_finder(pytester, file_structure, meta_path):
+    """
+    Installing a finder for a repository should replace its previous one.
+    """
+    file_structure(pytester.path, FINDER_REPOSITORY)
+    repository = pytester.path / "finder_repository"
+
+    with pytest.raises(ComposerError) as excinfo:
+        install_finder("finder_repository", str(pytester.path / "nope"))
+
+    assert str(excinfo.value) == "Repository directory does not exist: {}".format(
+        pytester.path / "nope"
+    )
+
+    first = install_finder("finder_repository", str(repository))
+    other = install_finder("other_repository", str(repository))
+    second = install_finder("finder_repository", str(repository))
+
+    assert sys.meta_path[:2] == [second, other]
+    assert first not in sys.meta_path
+
+    assert uninstall_finder("finder_repository") == [second]
+    assert uninstall_finder("finder_repository") == []
+    assert sys.meta_path[0] is other
@@ -1,10 +1,16 @@
+import logging
+import sys
+
 import pytest
 
-from project_composer.compose import Composer
-from project_composer.exceptions import ComposerError
+from project_composer.app_storage import AppStore, ArrayAppStore, CachedAppStore
+from project_composer.class_index import ClassIndex
+from project_composer.compose import _CLASS_CACHE, Composer, clear_class_cache
+from project_composer.exceptions import ComposerAppStoreError, ComposerError
 from project_composer.importer import import_module
+from project_composer.lockfile import CompositionLock
 from project_composer.manifest import Manifest
-from project_composer.processors import ComposerProcessor
+from project_composer.processors import ClassProcessor, ComposerProcessor
 
 
 def test_manifest_valid_file(settings):
@@ -218,6 +224,159 @@ def test_get_elligible_module_classes(pytester, basic_structure):
     assert classes == [bar_settings.BarFirstSettings, bar_settings.BarSecondSettings]
 
 
+@pytest.mark.parametrize("class_registry, expected", [
+    (True, ["Second", "First", "Child"]),
+    (False, ["Imported", "Second", "First", "Child"]),
+])
+def test_get_elligible_module_classes_registry(pytester, class_registry, expected):
+    """
+    With registry, only the marker classes defined in module and still reachable
+    should be found in their definition order.
+    """
+    package = pytester.path / "registry_package"
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    (package / "base.py").write_text(
+        "from project_composer.marker import EnabledApplicationMarker\n"
+        "class Imported(EnabledApplicationMarker):\n"
+        "    pass\n"
+    )
+    (package / "settings.py").write_text(
+        "from project_composer.marker import EnabledApplicationMarker\n"
+        "from .base import *\n"
+        "class Second(EnabledApplicationMarker):\n"
+        "    pass\n"
+        "class First(EnabledApplicationMarker):\n"
+        "    pass\n"
+        "class Child(First):\n"
+        "    pass\n"
+        "class _Private(EnabledApplicationMarker):\n"
+        "    pass\n"
+        "class Disabled(EnabledApplicationMarker):\n"
+        "    _ENABLED_COMPOSABLE_APPLICATION = None\n"
+        "class Replaced(EnabledApplicationMarker):\n"
+        "    pass\n"
+        "Replaced = None\n"
+        "def factory():\n"
+        "    class Local(EnabledApplicationMarker):\n"
+        "        pass\n"
+        "    return Local\n"
+        "factory()\n"
+    )
+    (package / "bare.py").write_text(
+        "class Bare:\n"
+        "    _ENABLED_COMPOSABLE_APPLICATION = True\n"
+    )
+
+    pytester.syspathinsert(pytester.path)
+
+    composer = Composer(
+        {"name": "Sample", "collection": [], "repository": None},
+        class_registry=class_registry,
+    )
+
+    settings = import_module("registry_package.settings")
+    bare = import_module("registry_package.bare")
+
+    classes = composer._get_elligible_module_classes("some.path", settings)
+    assert [item.__name__ for item in classes] == expected
+
+    # Classes without marker inheritance are only found from namespace scan
+    classes = composer._get_elligible_module_classes("some.path", bare)
+    assert classes == [bare.Bare]
+
+
+def test_get_elligible_module_classes_cache(pytester, basic_structure):
+    """
+    Cached classes should not be shared between composers with different
+    eligibility rules or discovery configurations.
+    """
+    class StrictComposer(Composer):
+        def _is_elligible_class(self, obj):
+            return (
+                super()._is_elligible_class(obj) and
+                obj.__name__ != "BarSecondSettings"
+            )
+
+    basic_structure(pytester.path)
+    pytester.syspathinsert(pytester.path)
+
+    manifest = {"name": "Sample", "collection": [], "repository": None}
+    module = import_module("basic_structure.bar.settings")
+
+    composer = Composer(manifest)
+    strict = StrictComposer(manifest)
+    registry = Composer(manifest, class_registry=True)
+
+    assert composer.get_class_cache_key() != strict.get_class_cache_key()
+    assert composer.get_class_cache_key() != registry.get_class_cache_key()
+    assert composer.get_class_cache_key() == Composer(manifest).get_class_cache_key()
+
+    # Equal class indexes and lockfiles share the same key
+    def get_index(classes):
+        return ClassIndex(
+            repository="basic_structure",
+            modules={"basic_structure.bar.settings": {"classes": classes}},
+        )
+
+    indexed = Composer(manifest, class_index=get_index([]))
+    assert indexed.get_class_cache_key() == (
+        Composer(manifest, class_index=get_index([])).get_class_cache_key()
+    )
+    assert indexed.get_class_cache_key() != (
+        Composer(manifest, class_index=get_index(None)).get_class_cache_key()
+    )
+    assert indexed.get_class_cache_key() != composer.get_class_cache_key()
+    assert Composer(
+        manifest,
+        lockfile=CompositionLock(apps=[{"name": "bar"}]),
+    ).get_class_cache_key() == Composer(
+        manifest,
+        lockfile=CompositionLock(apps=[{"name": "bar"}]),
+    ).get_class_cache_key()
+
+    clear_class_cache()
+    assert composer._get_elligible_module_classes("some.path", module) == [
+        module.BarFirstSettings, module.BarSecondSettings,
+    ]
+    assert strict._get_elligible_module_classes("some.path", module) == [
+        module.BarFirstSettings,
+    ]
+    Composer(manifest)._get_elligible_module_classes("some.path", module)
+    assert len(_CLASS_CACHE[module]) == 2
+
+
+def test_get_elligible_module_classes_mixed(pytester):
+    """
+    On default, a module which defines marker subclasses should still expose its
+    classes with only the marker attribute and the imported enabled classes.
+    """
+    package = pytester.path / "mixed_package"
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    (package / "base.py").write_text(
+        "from project_composer.marker import EnabledApplicationMarker\n"
+        "class Imported(EnabledApplicationMarker):\n"
+        "    pass\n"
+    )
+    (package / "settings.py").write_text(
+        "from project_composer.marker import EnabledApplicationMarker\n"
+        "from .base import Imported\n"
+        "class Marked(EnabledApplicationMarker):\n"
+        "    pass\n"
+        "class Bare:\n"
+        "    _ENABLED_COMPOSABLE_APPLICATION = True\n"
+    )
+
+    pytester.syspathinsert(pytester.path)
+
+    composer = Composer({"name": "Sample", "collection": [], "repository": None})
+    settings = import_module("mixed_package.settings")
+
+    classes = composer._get_elligible_module_classes("some.path", settings)
+    assert [item.__name__ for item in classes] == ["Imported", "Marked", "Bare"]
+
+
 @pytest.mark.parametrize("default_app, no_ordering, lazy, expected", [
     (
         None,
@@ -343,3 +502,341 @@ def test_composer_resolve_apps(pytester, advanced_structure, default_app, no_ord
     composer.resolve_collection(lazy=lazy)
 
     assert [item.name for item in composer.apps] == expected
+
+
+def test_composer_get_app_levels(pytester, advanced_structure):
+    """
+    Composer should group its resolved applications into dependency levels.
+    """
+    advanced_structure(pytester.path)
+
+    pytester.syspathinsert(pytester.path)
+
+    composer = Composer({
+        "name": "Advanced",
+        "collection": [
+            "cms",
+            "django",
+            "forms",
+            "filer",
+            "editor",
+            "blog",
+            "rest",
+            "cms_blog",
+        ],
+        "repository": "advanced_structure",
+    })
+    composer.resolve_collection(lazy=False)
+
+    assert [[item.name for item in level] for level in composer.get_app_levels()] == [
+        ["forms", "django"],
+        ["editor", "filer", "rest"],
+        ["blog"],
+        ["cms"],
+        ["cms_blog"],
+    ]
+
+
+@pytest.mark.parametrize("manifest_resolver, resolver, expected", [
+    (None, None, AppStore),
+    ("array", None, ArrayAppStore),
+    (None, "array", ArrayAppStore),
+    ("array", "cached", CachedAppStore),
+])
+def test_composer_resolver_engine(pytester, advanced_structure, manifest_resolver,
+                                  resolver, expected):
+    """
+    Composer should use the resolver engine from its argument first, then the one
+    from manifest, and resolve the same way than the reference engine.
+    """
+    advanced_structure(pytester.path)
+
+    pytester.syspathinsert(pytester.path)
+
+    CachedAppStore.clear_cache()
+
+    composer = Composer(
+        {
+            "name": "Advanced",
+            "collection": [
+                "cms",
+                "django",
+                "forms",
+                "filer",
+                "editor",
+                "blog",
+                "rest",
+                "cms_blog",
+            ],
+            "repository": "advanced_structure",
+            "resolver": manifest_resolver,
+        },
+        resolver=resolver,
+    )
+    composer.resolve_collection(lazy=False)
+
+    assert type(composer.store) is expected
+    assert [item.name for item in composer.apps] == [
+        "forms",
+        "editor",
+        "filer",
+        "django",
+        "blog",
+        "rest",
+        "cms",
+        "cms_blog",
+    ]
+
+
+def test_composer_resolver_engine_unknown(settings):
+    """
+    Composer should fail with an unknown resolver engine.
+    """
+    manifest_path = settings.fixtures_path / "manifests" / "basic.json"
+
+    with pytest.raises(ComposerAppStoreError) as excinfo:
+        Composer(manifest_path, resolver="nope")
+
+    assert str(excinfo.value).startswith("Unknown resolver engine 'nope'")
+
+
+@pytest.mark.parametrize("native_import", [False, True])
+def test_composer_native_import(pytester, basic_structure, native_import):
+    """
+    Composer should find application modules with both import modes.
+    """
+    basic_structure(pytester.path)
+
+    pytester.syspathinsert(pytester.path)
+
+    composer = Composer(
+        {
+            "name": "Basic",
+            "collection": ["foo", "nope"],
+            "repository": "basic_structure",
+        },
+        native_import=native_import,
+    )
+
+    assert composer.find_app_module("basic_structure.foo").__name__ == (
+        "basic_structure.foo"
+    )
+    assert composer.find_app_module("basic_structure.nope") is None
+
+
+def test_composer_lazy_import(pytester):
+    """
+    With lazy import, application modules which do not define any option should not
+    be executed to be resolved.
+    """
+    repository = pytester.path / "lazy_repository"
+    repository.mkdir()
+    (repository / "__init__.py").write_text("")
+    for name, content in [
+        ("base", "raise RuntimeError('Should not be executed')\n"),
+        ("blog", "DEPENDENCIES = ['base']\n"),
+        ("shop", "PUSH_END = True\n"),
+    ]:
+        (repository / name).mkdir()
+        (repository / name / "__init__.py").write_text(content)
+
+    pytester.syspathinsert(pytester.path)
+
+    composer = Composer(
+        {
+            "name": "Lazy",
+            "collection": ["shop", "blog", "base"],
+            "repository": "lazy_repository",
+        },
+        lazy_import=True,
+    )
+    collection = composer.resolve_collection(lazy=False)
+
+    assert [item.name for item in composer.apps] == ["base", "blog", "shop"]
+    assert collection[2] == {
+        "name": "base",
+        "filepath": str(repository / "base" / "__init__.py"),
+    }
+    assert composer.find_app_module("lazy_repository.base") is not None
+
+
+@pytest.mark.parametrize("lazy_import", [False, True])
+def test_composer_repository_finder(meta_path, pytester, advanced_structure,
+                                    lazy_import):
+    """
+    Composer should resolve the same way when using a repository finder.
+    """
+    advanced_structure(pytester.path)
+
+    pytester.syspathinsert(pytester.path)
+
+    composer = Composer(
+        {
+            "name": "Advanced",
+            "collection": [
+                "nope",
+                "cms",
+                "django",
+                "forms",
+                "filer",
+                "editor",
+                "blog",
+                "rest",
+                "cms_blog",
+            ],
+            "repository": "advanced_structure",
+        },
+        lazy_import=lazy_import,
+        repository_finder=True,
+    )
+    composer.resolve_collection(lazy=False)
+
+    assert sys.meta_path[0] is composer.finder
+    assert composer.finder.directory == str(pytester.path / "advanced_structure")
+    assert [item.name for item in composer.apps] == [
+        "forms",
+        "editor",
+        "filer",
+        "django",
+        "blog",
+        "rest",
+        "cms",
+        "cms_blog",
+    ]
+
+
+def test_composer_repository_finder_missing(meta_path):
+    """
+    No finder should be installed for a repository which can not be found.
+    """
+    composer = Composer(
+        {"name": "Nope", "collection": [], "repository": "nope_repository"},
+        repository_finder=True,
+    )
+
+    assert composer.finder is None
+
+
+@pytest.mark.parametrize("prepend, expected", [
+    (False, ["/base", "/first", "/second", "/third"]),
+    (True, ["/third", "/second", "/base", "/first"]),
+])
+def test_composer_set_syspaths(monkeypatch, prepend, expected):
+    """
+    Manifest paths should be appended once to 'sys.path' or moved at its start in
+    their order when prepending.
+    """
+    monkeypatch.setattr(sys, "path", ["/base", "/first", "/second"])
+
+    Composer(
+        {
+            "name": "Paths",
+            "collection": [],
+            "repository": "nope_repository",
+            "syspaths": ["/third", "/second", "/third"],
+        },
+        prepend_syspaths=prepend,
+    )
+
+    assert sys.path == expected
+
+
+def test_composer_scan_workers(pytester, advanced_structure):
+    """
+    Scanning from worker processes should resolve the same way without importing
+    application modules in the current process.
+    """
+    advanced_structure(pytester.path)
+
+    pytester.syspathinsert(pytester.path)
+
+    composer = Composer(
+        {
+            "name": "Advanced",
+            "collection": [
+                "nope",
+                "cms",
+                "django",
+                "forms",
+                "filer",
+                "editor",
+                "blog",
+                "rest",
+                "cms_blog",
+            ],
+            "repository": "advanced_structure",
+        },
+        scan_workers=2,
+    )
+    collection = composer.resolve_collection(lazy=False)
+
+    assert [item.name for item in composer.apps] == [
+        "forms",
+        "editor",
+        "filer",
+        "django",
+        "blog",
+        "rest",
+        "cms",
+        "cms_blog",
+    ]
+    assert collection[0]["filepath"] == str(
+        pytester.path / "advanced_structure" / "cms" / "__init__.py"
+    )
+    assert composer.get_app_filepath("cms") == collection[0]["filepath"]
+    assert "advanced_structure" not in sys.modules
+    assert "advanced_structure.cms" not in sys.modules
+
+
+def test_compose_profiles(caplog, pytester, advanced_structure):
+    """
+    Profiles should be resolved from a single scan of their applications.
+    """
+    caplog.set_level(logging.DEBUG)
+
+    advanced_structure(pytester.path)
+
+    pytester.syspathinsert(pytester.path)
+
+    composer = Composer(
+        {
+            "name": "Advanced",
+            "collection": ["cms"],
+            "repository": "advanced_structure",
+        },
+        processors=[ClassProcessor],
+    )
+    composers = composer.compose_profiles({
+        "web": ["cms", "forms", "editor", "filer", "blog", "nope"],
+        "worker": ["rest", "forms"],
+    }, lazy=False)
+
+    assert list(composers.keys()) == ["web", "worker"]
+    assert [item.name for item in composers["web"].apps] == [
+        "forms", "editor", "filer", "blog", "cms",
+    ]
+    assert [item.name for item in composers["worker"].apps] == ["forms", "rest"]
+
+    # Each application has been scanned once
+    assert [log[2] for log in caplog.record_tuples] == [
+        "Composer found application at: advanced_structure.cms",
+        "Composer found application at: advanced_structure.forms",
+        "Composer found application at: advanced_structure.editor",
+        "Composer found application at: advanced_structure.filer",
+        "Composer found application at: advanced_structure.blog",
+        "Composer is unable to find module: advanced_structure.nope",
+        "Composer found application at: advanced_structure.rest",
+    ]
+
+    web = composers["web"]
+    assert web.profile == "web"
+    assert web.manifest.collection == [
+        "cms", "forms", "editor", "filer", "blog", "nope",
+    ]
+    assert web.processors["ClassProcessor"].composer is web
+    assert web.store is not composers["worker"].store
+
+    # Original composer is unchanged
+    assert composer.profile is None
+    assert composer.manifest.collection == ["cms"]
+    assert composer.apps == []
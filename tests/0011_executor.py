@@ -0,0 +1,255 @@
+import json
+import threading
+import time
+
+import pytest
+
+from project_composer.app_storage import AppStore
+from project_composer.compose import Composer
+from project_composer.exceptions import ComposerError
+from project_composer.executor import AppExecutor
+from project_composer.processors import ClassProcessor, TextContentProcessor
+from project_composer.contrib.django.processors import DjangoSettingsProcessor
+
+
+ADVANCED_COLLECTION = [
+    "cms",
+    "django",
+    "forms",
+    "filer",
+    "editor",
+    "blog",
+    "rest",
+    "cms_blog",
+]
+
+
+def app_name_upper(node, suffix):
+    """
+    Dummy application work, it must be a module function to be picklable with
+    process backend.
+    """
+    return node.name.upper() + suffix
+
+
+def test_executor_unknown_backend():
+    """
+    Executor should refuse an unknown backend.
+    """
+    with pytest.raises(ComposerError) as exc_info:
+        AppExecutor(workers=2, backend="nope")
+
+    assert exc_info.value.args[0] == (
+        "Unknown executor backend 'nope', available ones are: thread, process"
+    )
+
+
+@pytest.mark.parametrize("workers, backend", [
+    (None, "thread"),
+    (1, "thread"),
+    (4, "thread"),
+    (4, "process"),
+])
+def test_executor_run_order(settings, workers, backend):
+    """
+    Results should always be returned in the given application order whatever the
+    execution mode is.
+    """
+    source_path = (
+        settings.fixtures_path / "appstore_datasets" / "advanced_complex_source.json"
+    )
+
+    store = AppStore()
+    apps = store.resolve(json.loads(source_path.read_text()))
+    levels = store.get_levels(apps)
+
+    executor = AppExecutor(workers=workers, backend=backend)
+    results = executor.run(app_name_upper, apps, levels=levels, args=["!"])
+
+    assert results == [item.name.upper() + "!" for item in apps]
+
+
+def test_executor_run_levels(settings):
+    """
+    An application should never be processed before its dependencies are finished.
+    """
+    source_path = (
+        settings.fixtures_path / "appstore_datasets" / "advanced_complex_source.json"
+    )
+
+    store = AppStore()
+    apps = store.resolve(json.loads(source_path.read_text()))
+    levels = store.get_levels(apps)
+
+    finished = []
+    lock = threading.Lock()
+
+    def work(node):
+        with lock:
+            missing = [
+                name for name in node.dependency_names
+                if name not in finished
+            ]
+        # Give a chance to other workers to run in the meantime
+        time.sleep(0.01)
+        with lock:
+            finished.append(node.name)
+
+        return missing
+
+    executor = AppExecutor(workers=8)
+
+    assert executor.run(work, apps, levels=levels) == [[] for item in apps]
+
+
+@pytest.mark.parametrize("workers, backend", [
+    (4, "thread"),
+    (4, "process"),
+])
+def test_composer_processors_concurrent(pytester, advanced_structure, workers,
+                                        backend):
+    """
+    Processors should export the same results with concurrent workers than with a
+    serial execution.
+    """
+    advanced_structure(pytester.path)
+
+    pytester.syspathinsert(pytester.path)
+
+    manifest = {
+        "name": "Sample",
+        "collection": ADVANCED_COLLECTION,
+        "repository": "advanced_structure",
+        "requirements": {
+            "introduction": "",
+            "application_label": "# {name}\n",
+        },
+    }
+    processors = [ClassProcessor, DjangoSettingsProcessor, TextContentProcessor]
+
+    serial = Composer(manifest, processors=processors)
+    serial.resolve_collection(lazy=False)
+
+    concurrent = Composer(
+        manifest,
+        processors=processors,
+        workers=workers,
+        worker_backend=backend,
+    )
+    concurrent.resolve_collection(lazy=False)
+
+    for name in ("ClassProcessor", "DjangoSettingsProcessor", "TextContentProcessor"):
+        assert concurrent.call_processor(name, "export") == (
+            serial.call_processor(name, "export")
+        )
+
+    assert [
+        item.__name__
+        for item in concurrent.call_processor("DjangoSettingsProcessor", "export")
+    ] == [
+        "FormsSettings",
+        "EditorSettings",
+        "FilerSettings",
+        "DjangoBuiltinSettings",
+        "BlogSettings",
+        "RestBuiltinSettings",
+        "CmsSettings",
+        "CmsBlogSettings",
+    ]
+
+
+def test_composer_map_apps_lazy(pytester, advanced_structure):
+    """
+    Lazy resolved applications are not in a dependency order, they should be
+    processed serially and still returned in their order.
+    """
+    advanced_structure(pytester.path)
+
+    pytester.syspathinsert(pytester.path)
+
+    manifest = {
+        "name": "Sample",
+        "collection": ADVANCED_COLLECTION,
+        "repository": "advanced_structure",
+    }
+
+    composer = Composer(manifest, workers=3)
+    composer.resolve_collection(lazy=True)
+    assert composer.has_resolved_order() is False
+
+    threads = set([])
+
+    def work(node):
+        threads.add(threading.get_ident())
+        return node.name.upper()
+
+    assert composer.map_apps(work) == [item.upper() for item in ADVANCED_COLLECTION]
+    assert threads == {threading.get_ident()}
+
+    composer = Composer(manifest, workers=3)
+    composer.resolve_collection(lazy=False)
+    assert composer.has_resolved_order() is True
+
+
+def test_composer_process_backend_classes(pytester, advanced_structure):
+    """
+    Class export should use threads with the process backend since classes would be
+    imported again in the composer process.
+    """
+    advanced_structure(pytester.path)
+
+    pytester.syspathinsert(pytester.path)
+
+    composer = Composer(
+        {
+            "name": "Sample",
+            "collection": ADVANCED_COLLECTION,
+            "repository": "advanced_structure",
+        },
+        processors=[DjangoSettingsProcessor],
+        workers=4,
+        worker_backend="process",
+    )
+    composer.resolve_collection(lazy=False)
+    # Any process pool would fail
+    composer.executor.BACKENDS = dict(AppExecutor.BACKENDS, process=None)
+
+    assert [
+        item.__name__
+        for item in composer.call_processor("DjangoSettingsProcessor", "export")
+    ][:2] == ["FormsSettings", "EditorSettings"]
+
+    with pytest.raises(TypeError):
+        composer.map_apps(app_name_upper, "")
+
+
+@pytest.mark.parametrize("options, expected", [
+    ({"profile_imports": True}, "profile_imports"),
+    ({"manifest": {"archive": "repository.zip"}}, "archive"),
+])
+def test_composer_process_backend_unpicklable(options, expected):
+    """
+    Process backend should be refused with options which can not be sent to worker
+    processes.
+    """
+    options = dict(options)
+    manifest = dict(
+        {"name": "Sample", "collection": [], "repository": "nope"},
+        **options.pop("manifest", {})
+    )
+
+    with pytest.raises(ComposerError) as excinfo:
+        Composer(manifest, workers=2, worker_backend="process", **options)
+
+    assert str(excinfo.value) == (
+        "Process worker backend can not be used with: {}. Use the thread worker "
+        "backend instead.".format(expected)
+    )
+
+    # A serial execution does not send anything to worker processes
+    Composer(
+        dict(manifest, archive=None),
+        workers=1,
+        worker_backend="process",
+        **options
+    )
@@ -0,0 +1,151 @@
+import json
+import re
+import tracemalloc
+
+import pytest
+
+from project_composer.compose import Composer
+from project_composer.exceptions import ComposerError
+from project_composer.profiler import ImportProfiler
+from project_composer.utils.tree_printer import TreePrinter
+
+
+PROFILED_REPOSITORY = {
+    "profiled_external.py": "VALUE = [0] * 10000\n",
+    "profiled_repository/__init__.py": "",
+    "profiled_repository/heavy/__init__.py": "",
+    "profiled_repository/heavy/settings.py": (
+        "import profiled_external\n"
+        "DATA = list(range(5000))\n"
+    ),
+    "profiled_repository/light/__init__.py": "",
+}
+"""
+Repository where an application imports an external module.
+"""
+
+
+@pytest.mark.parametrize("repository, name, expected", [
+    (None, "foo.bar", (None, None)),
+    ("apps", "apps", (None, None)),
+    ("apps", "apps.blog", ("blog", "__init__")),
+    ("apps", "apps.blog.settings", ("blog", "settings")),
+    ("apps", "apps.blog.urls.api", ("blog", "urls.api")),
+    ("apps", "appsfoo.blog", (None, None)),
+])
+def test_profiler_split_name(repository, name, expected):
+    """
+    Module names should be splitted into application and submodule.
+    """
+    assert ImportProfiler(repository=repository).split_name(name) == expected
+
+
+def test_profiler_record(pytester, file_structure):
+    """
+    Profiler should record measures and nested external imports of new modules only.
+    """
+    file_structure(pytester.path, PROFILED_REPOSITORY)
+    pytester.syspathinsert(pytester.path)
+
+    profiler = ImportProfiler(repository="profiled_repository")
+
+    with profiler.record("profiled_repository.heavy.settings") as record:
+        __import__("profiled_repository.heavy.settings")
+        with profiler.record("profiled_repository.light"):
+            __import__("profiled_repository.light")
+
+    with profiler.record("profiled_repository.nope") as record:
+        record["found"] = False
+
+    # Already imported module is not recorded again
+    with profiler.record("profiled_repository.heavy.settings"):
+        pass
+
+    assert tracemalloc.is_tracing() is False
+    assert [
+        (item["name"], item["depth"], item["found"], item["imports"])
+        for item in profiler.records
+    ] == [
+        ("profiled_repository.light", 1, True, []),
+        ("profiled_repository.heavy.settings", 0, True, ["profiled_external"]),
+        ("profiled_repository.nope", 0, False, []),
+    ]
+
+    heavy = profiler.records[1]
+    assert heavy["app"] == "heavy"
+    assert heavy["submodule"] == "settings"
+    assert heavy["wall"] > 0
+    assert heavy["cpu"] >= 0
+    assert heavy["memory"] > 0
+    assert heavy["start"] <= profiler.records[0]["start"]
+
+    assert profiler.get_records()[0]["name"] == "profiled_repository.heavy.settings"
+
+    summary = profiler.get_app_summary()
+    assert [item["app"] for item in summary] == ["heavy", "nope", "light"]
+    assert summary[0]["wall"] == heavy["wall"]
+    # Nested record is not summed
+    assert summary[2]["wall"] == 0
+    assert summary[0]["imports"] == ["profiled_external"]
+
+
+def test_profiler_write(tmp_path):
+    """
+    Profiler should write results as JSON or Chrome trace events.
+    """
+    profiler = ImportProfiler(repository="apps", trace_memory=False)
+    with profiler.record("apps.nope") as record:
+        record["found"] = False
+
+    results = json.loads(profiler.write(tmp_path / "profile.json").read_text())
+    assert results["repository"] == "apps"
+    assert results["records"][0]["name"] == "apps.nope"
+    assert results["records"][0]["memory"] == 0
+    assert results["apps"][0]["modules"] == ["apps.nope"]
+
+    trace = json.loads(
+        profiler.write(tmp_path / "trace.json", format="trace").read_text()
+    )
+    event = trace["traceEvents"][0]
+    assert event["name"] == "apps.nope"
+    assert event["ph"] == "X"
+    assert event["args"]["found"] is False
+
+    with pytest.raises(ComposerError):
+        profiler.write(tmp_path / "profile.txt", format="txt")
+
+
+def test_profiler_composer_check(capsys, pytester, file_structure):
+    """
+    Composer should record application modules and output them sorted in check.
+    """
+    file_structure(pytester.path, PROFILED_REPOSITORY)
+    pytester.syspathinsert(pytester.path)
+
+    composer = Composer(
+        {
+            "name": "Profiled",
+            "collection": ["light", "heavy"],
+            "repository": "profiled_repository",
+        },
+        profile_imports=True,
+    )
+    composer.find_app_module("profiled_repository.heavy.settings")
+    composer.check(lazy=False, printer=TreePrinter(printable=True))
+
+    lines = capsys.readouterr().out.splitlines()
+    table = lines[lines.index("⏱️ Import profile") + 1:]
+
+    assert [
+        re.sub(r"^.── (\S+): wall .*, (\d+) nested imports$", r"\1 \2", item)
+        for item in table
+    ] == [
+        "{} {}".format(item["name"], len(item["imports"]))
+        for item in composer.profiler.get_records()
+    ]
+    assert table[-1].startswith("└── ")
+    # Parent packages imported along a submodule are included in its record
+    assert sorted([item["name"] for item in composer.profiler.records]) == [
+        "profiled_repository.heavy.settings",
+        "profiled_repository.light",
+    ]
@@ -0,0 +1,241 @@
+import importlib.util
+import os
+import sys
+import zipfile
+
+import pytest
+
+from project_composer.archive import (
+    ArchiveFinder, ArchiveLoader, ArchiveRepository, install_archive, uninstall_archive,
+)
+from project_composer.compose import Composer
+from project_composer.exceptions import ComposerError, ComposerPurgeError
+from project_composer.importer import import_module
+from project_composer.processors import PurgeProcessor, TextContentProcessor
+from project_composer.contrib.django.processors import DjangoSettingsProcessor
+
+
+def pack_structure(source, destination, name):
+    """
+    Pack a structure directory into a zip archive with a new package name.
+
+    Directory members are not written to ensure the index does not depend on them.
+    """
+    with zipfile.ZipFile(destination, "w") as archive:
+        for path in sorted(source.rglob("*")):
+            if path.is_file() and "__pycache__" not in path.parts:
+                archive.write(
+                    path,
+                    "/".join((name,) + path.relative_to(source).parts),
+                )
+
+    return destination
+
+
+@pytest.fixture(scope="function")
+def archived_structure(settings, tmp_path):
+    """
+    Pack the "basic_structure" fixture as an archive with package name
+    "archived_structure", modules imported from archive are removed after test since
+    each test has its own archive.
+    """
+    yield pack_structure(
+        settings.fixtures_path / "basic_structure",
+        tmp_path / "repository.zip",
+        "archived_structure",
+    )
+
+    for name in list(sys.modules.keys()):
+        if name.split(".")[0] == "archived_structure":
+            del sys.modules[name]
+
+
+def test_archive_repository(archived_structure, settings, tmp_path):
+    """
+    Archive index should answer path lookups and reads.
+    """
+    archive = ArchiveRepository(archived_structure)
+    base = archived_structure / "archived_structure"
+
+    assert archive.get_member(archived_structure) == ""
+    assert archive.get_member(base / "foo") == "archived_structure/foo"
+    assert archive.get_member(tmp_path / "other.zip") is None
+    assert archive.get_path("archived_structure/foo") == str(base / "foo")
+
+    assert archive.is_dir(base / "foo") is True
+    assert archive.is_file(base / "foo") is False
+    assert archive.is_file(base / "foo" / "__init__.py") is True
+    assert archive.exists(base / "nope") is False
+    assert "foo" in archive.listdir(base)
+    assert archive.read(base / "foo" / "requirements.txt") == (
+        settings.fixtures_path / "basic_structure" / "foo" / "requirements.txt"
+    ).read_bytes()
+
+    with pytest.raises(FileNotFoundError):
+        archive.read(base / "nope.txt")
+
+    with pytest.raises(FileNotFoundError):
+        archive.listdir(base / "nope")
+
+    with pytest.raises(ComposerError) as excinfo:
+        ArchiveRepository(tmp_path / "nope.zip")
+
+    assert str(excinfo.value) == (
+        "Repository archive is not a valid zip file: {}".format(tmp_path / "nope.zip")
+    )
+
+
+def test_archive_finder(archived_structure, meta_path):
+    """
+    Modules should be imported from archive with their file paths inside it.
+    """
+    finder = install_archive(archived_structure)
+    assert sys.meta_path[0] is finder
+
+    module = import_module("archived_structure.foo.settings")
+    assert module.__file__ == str(
+        archived_structure / "archived_structure" / "foo" / "settings.py"
+    )
+    assert module.__spec__.loader.get_data(
+        str(archived_structure / "archived_structure" / "foo" / "requirements.txt")
+    ) == b"foo-requirements\n"
+
+    with pytest.raises(ModuleNotFoundError):
+        import_module("archived_structure.nope")
+
+    # Installing again replaces the finder
+    other = install_archive(archived_structure)
+    assert [item for item in sys.meta_path if isinstance(item, ArchiveFinder)] == [
+        other
+    ]
+    assert uninstall_archive(archived_structure) == [other]
+
+
+def test_archive_finder_packages(archived_structure, meta_path):
+    """
+    Finder should only search the given top level packages from archive.
+    """
+    with zipfile.ZipFile(archived_structure, "a") as archive:
+        archive.writestr("archived_shadow.py", "VALUE = 42\n")
+
+    install_archive(archived_structure, packages=["archived_structure"])
+
+    assert import_module("archived_structure.foo").__name__ == "archived_structure.foo"
+    with pytest.raises(ModuleNotFoundError):
+        import_module("archived_shadow")
+
+    composer = Composer({
+        "name": "Archived",
+        "collection": ["foo"],
+        "repository": "archived_structure",
+        "archive": str(archived_structure),
+    })
+    assert composer.get_archive_packages() == ["archived_structure"]
+    assert [
+        item.packages for item in sys.meta_path if isinstance(item, ArchiveFinder)
+    ] == [{"archived_structure"}]
+
+
+def test_archive_bytecode(archived_structure, meta_path, monkeypatch):
+    """
+    Module bytecode should be cached next to archive and used on the next imports.
+    """
+    monkeypatch.setattr(sys, "dont_write_bytecode", False)
+
+    install_archive(archived_structure)
+    import_module("archived_structure.foo.settings")
+
+    bytecode_path = importlib.util.cache_from_source(
+        str(archived_structure / "archived_structure" / "foo" / "settings.py")
+    )
+    cached_path = (
+        archived_structure.parent / "__pycache__" / "repository.zip" /
+        "archived_structure" / "foo" / "__pycache__" / os.path.basename(bytecode_path)
+    )
+    assert cached_path.is_file()
+
+    # Source is not compiled anymore once bytecode has been cached
+    def source_to_code(*args, **kwargs):
+        raise AssertionError("Source should not be compiled")
+
+    del sys.modules["archived_structure.foo.settings"]
+    monkeypatch.setattr(ArchiveLoader, "source_to_code", source_to_code)
+
+    module = import_module("archived_structure.foo.settings")
+    assert module.FooSettings.__name__ == "FooSettings"
+
+
+def test_archive_composer(archived_structure, settings, meta_path):
+    """
+    Composer should discover applications, their content files and their classes
+    from archive.
+    """
+    composer = Composer(
+        {
+            "name": "Archived",
+            "collection": ["foo", "bar", "nope"],
+            "repository": "archived_structure",
+            "archive": str(archived_structure),
+        },
+        processors=[TextContentProcessor, DjangoSettingsProcessor],
+    )
+    composer.resolve_collection(lazy=False)
+
+    assert [item.name for item in composer.apps] == ["foo", "bar"]
+    assert composer.path_exists(archived_structure / "archived_structure" / "foo")
+    assert not composer.path_exists(archived_structure / "archived_structure" / "nope")
+
+    requirements = composer.call_processor("TextContentProcessor", "export")
+    basedir = settings.fixtures_path / "basic_structure"
+    assert (basedir / "foo" / "requirements.txt").read_text() in requirements
+    assert (basedir / "bar" / "requirements.txt").read_text() in requirements
+
+    classes = composer.call_processor("DjangoSettingsProcessor", "export")
+    assert [item.__name__ for item in classes] == [
+        "FooSettings", "BarFirstSettings", "BarSecondSettings",
+    ]
+
+    with pytest.raises(ComposerPurgeError):
+        Composer(
+            composer.manifest,
+            processors=[PurgeProcessor],
+        ).call_processor("PurgeProcessor", "export")
+
+
+def test_archive_composer_after_miss(archived_structure, meta_path):
+    """
+    Applications missed before the archive is installed should be found from it.
+    """
+    with pytest.raises(ModuleNotFoundError):
+        import_module("archived_structure.foo")
+
+    composer = Composer({
+        "name": "Archived",
+        "collection": ["foo", "bar"],
+        "repository": "archived_structure",
+        "archive": str(archived_structure),
+    })
+    composer.resolve_collection(lazy=False)
+
+    assert [item.name for item in composer.apps] == ["foo", "bar"]
+
+
+def test_archive_scan_workers(archived_structure, meta_path):
+    """
+    Worker processes should scan applications from archive.
+    """
+    composer = Composer(
+        {
+            "name": "Archived",
+            "collection": ["foo", "bar", "nope"],
+            "repository": "archived_structure",
+            "archive": str(archived_structure),
+        },
+        scan_workers=2,
+    )
+    collection = composer.resolve_collection(lazy=False)
+
+    assert [item["name"] for item in collection] == ["foo", "bar"]
+    assert collection[0]["filepath"] == str(
+        archived_structure / "archived_structure" / "foo" / "__init__.py"
+    )
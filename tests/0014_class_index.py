@@ -0,0 +1,276 @@
+import json
+import logging
+import sys
+
+import pytest
+
+from project_composer.class_index import ClassIndex, find_marked_classes
+from project_composer.compose import Composer, clear_class_cache
+from project_composer.exceptions import ComposerIndexError
+from project_composer.contrib.django.processors import DjangoSettingsProcessor
+from project_composer.processors import ClassProcessor
+
+
+MARKER_IMPORT = "from project_composer.marker import EnabledApplicationMarker\n"
+
+
+@pytest.mark.parametrize("source, expected", [
+    # Empty module
+    ("", []),
+    # Only literal values
+    ("FOO = 'bar'\nDEPENDENCIES = ['ping']\n", []),
+    # Marked classes in their definition order, private ones are ignored
+    (
+        MARKER_IMPORT + (
+            "class Foo(EnabledApplicationMarker): pass\n"
+            "class _Private(EnabledApplicationMarker): pass\n"
+            "class Bar(EnabledApplicationMarker): pass\n"
+        ),
+        ["Foo", "Bar"],
+    ),
+    # Marker alias and inheritance from a local marked class
+    (
+        (
+            "from project_composer.marker import EnabledApplicationMarker as Marker\n"
+            "class Base(object): pass\n"
+            "class _Base(Marker): pass\n"
+            "class Foo(Base, _Base): pass\n"
+        ),
+        ["Foo"],
+    ),
+    # Marker from a module attribute
+    (
+        (
+            "import project_composer.marker\n"
+            "class Foo(project_composer.marker.EnabledApplicationMarker): pass\n"
+        ),
+        ["Foo"],
+    ),
+    # Base class from elsewhere may be marked
+    ("from foo import Base\nclass Foo(Base): pass\n", None),
+    # Imported names without any marked class may be enabled classes
+    ("from foo import Foo\n", None),
+    ("from foo import *\n", None),
+    # Decorator may replace class
+    (MARKER_IMPORT + "@decorate\nclass Foo(EnabledApplicationMarker): pass\n", None),
+    # Marker attribute may change elligibility
+    (
+        MARKER_IMPORT + (
+            "class Foo(EnabledApplicationMarker):\n"
+            "    _ENABLED_COMPOSABLE_APPLICATION = None\n"
+        ),
+        None,
+    ),
+    # Class name bound again
+    (
+        MARKER_IMPORT + "class Foo(EnabledApplicationMarker): pass\nFoo = None\n",
+        None,
+    ),
+    # Conditional definition
+    (
+        MARKER_IMPORT + "if True:\n    class Foo(EnabledApplicationMarker): pass\n",
+        None,
+    ),
+    # Invalid syntax
+    ("plop;plip\nclass Foo(:\n", None),
+])
+def test_find_marked_classes(source, expected):
+    """
+    Static analysis should find marked classes only when they are surely known.
+    """
+    assert find_marked_classes(source) == expected
+
+
+@pytest.mark.parametrize("source, expected", [
+    (MARKER_IMPORT + "class Foo(EnabledApplicationMarker): pass\n", ["Foo"]),
+    # Imported names may be enabled classes found from namespace scan
+    (
+        MARKER_IMPORT + (
+            "from foo import Bar\n"
+            "class Foo(EnabledApplicationMarker): pass\n"
+        ),
+        None,
+    ),
+])
+def test_find_marked_classes_namespace(source, expected):
+    """
+    With namespace mode, classes should only be known if module namespace can not
+    contain enabled classes from elsewhere.
+    """
+    assert find_marked_classes(source, namespace=True) == expected
+
+
+def test_build(pytester, basic_structure):
+    """
+    Index should be built from module files for existing submodules.
+    """
+    basic_structure(pytester.path)
+    pytester.syspathinsert(pytester.path)
+
+    composer = Composer({
+        "name": "Sample",
+        "collection": ["foo", "pong", "empty"],
+        "repository": "basic_structure",
+    })
+
+    index = ClassIndex.build(composer, submodules=["__init__", "settings"])
+
+    assert sorted(index.modules.keys()) == [
+        "basic_structure.foo",
+        "basic_structure.foo.settings",
+        "basic_structure.pong",
+    ]
+
+    entry = index.modules["basic_structure.foo"]
+    assert entry["app"] == "foo"
+    assert entry["submodule"] == "__init__"
+    assert entry["filepath"] == "foo/__init__.py"
+    assert len(entry["checksum"]) == 64
+    assert entry["classes"] == ["FooPlopInit", "FooPlapInit"]
+
+    assert index.modules["basic_structure.foo.settings"]["submodule"] == "settings"
+
+    # Module files have not been imported
+    assert "basic_structure.foo" not in sys.modules
+
+
+def test_dump_load(tmp_path):
+    """
+    Dumped index should be loaded back and invalid files should raise an error.
+    """
+    index = ClassIndex(repository="foo", modules={
+        "foo.bar": {
+            "app": "bar",
+            "submodule": "__init__",
+            "filepath": "bar/__init__.py",
+            "checksum": "abc",
+            "classes": ["Bar"],
+        },
+    })
+    destination = index.dump(tmp_path / "index.json")
+
+    loaded = ClassIndex.load(destination)
+    assert loaded.repository == "foo"
+    assert loaded.modules == index.modules
+
+    invalid = tmp_path / "invalid.json"
+    invalid.write_text("nope")
+    with pytest.raises(ComposerIndexError):
+        ClassIndex.load(invalid)
+
+    invalid.write_text(json.dumps({"version": 42, "modules": {}}))
+    with pytest.raises(ComposerIndexError):
+        ClassIndex.load(invalid)
+
+    with pytest.raises(ComposerIndexError):
+        ClassIndex.load(tmp_path / "missing.json")
+
+
+def test_composer_class_index(caplog, pytester, basic_structure):
+    """
+    Composer should take enabled classes from index, should not import a module
+    without enabled classes and should fallback to module inspection when index entry
+    is stale.
+    """
+    caplog.set_level(logging.DEBUG)
+    clear_class_cache()
+
+    basic_structure(pytester.path)
+    (pytester.path / "basic_structure" / "pong" / "settings.py").write_text(
+        "PONG_SETTING = 'Pong'\n"
+    )
+    pytester.syspathinsert(pytester.path)
+
+    manifest = {
+        "name": "Sample",
+        "collection": ["foo", "bar", "pong"],
+        "repository": "basic_structure",
+    }
+    index = ClassIndex.build(Composer(manifest))
+    # Make the bar entry stale
+    index.modules["basic_structure.bar"]["checksum"] = "nope"
+    index_path = index.dump(pytester.path / "index.json")
+
+    composer = Composer(
+        dict(manifest, class_index=str(index_path)),
+        processors=[ClassProcessor, DjangoSettingsProcessor],
+    )
+    assert composer.class_index.repository == "basic_structure"
+    composer.resolve_collection(lazy=False)
+    caplog.clear()
+
+    class_names = [
+        item.__name__
+        for item in composer.call_processor("ClassProcessor", "export")
+    ]
+
+    assert class_names == ["FooPlopInit", "FooPlapInit", "BarPlopInit", "BarPlapInit"]
+
+    assert [log[2] for log in caplog.record_tuples] == [
+        "ClassProcessor found module at: basic_structure.foo",
+        "Composer found indexed Class at: basic_structure.foo.FooPlopInit",
+        "Composer found indexed Class at: basic_structure.foo.FooPlapInit",
+        "Composer has a stale index entry for module: basic_structure.bar",
+        "ClassProcessor found module at: basic_structure.bar",
+        "Composer found enabled Class at: basic_structure.bar.BarPlopInit",
+        "Composer found enabled Class at: basic_structure.bar.BarPlapInit",
+    ]
+
+    # Settings module without enabled classes is not imported
+    class_names = [
+        item.__name__
+        for item in composer.call_processor("DjangoSettingsProcessor", "export")
+    ]
+    assert class_names == ["FooSettings", "BarFirstSettings", "BarSecondSettings"]
+    assert "basic_structure.pong.settings" not in sys.modules
+
+    # Module files are only checked once
+    caplog.clear()
+    clear_class_cache()
+    composer.call_processor("ClassProcessor", "export")
+    assert "Composer has a stale index entry for module: basic_structure.bar" not in [
+        log[2] for log in caplog.record_tuples
+    ]
+    assert sorted(composer._index_checks.keys()) == [
+        "basic_structure.bar",
+        "basic_structure.bar.settings",
+        "basic_structure.foo",
+        "basic_structure.foo.settings",
+        "basic_structure.pong",
+        "basic_structure.pong.settings",
+    ]
+
+
+def test_composer_class_index_namespace(pytester, basic_structure):
+    """
+    Without the class registry, index entries should only be used if their module
+    can not expose enabled classes from elsewhere.
+    """
+    basic_structure(pytester.path)
+    (pytester.path / "basic_structure" / "foo" / "settings.py").write_text(
+        "from project_composer.marker import EnabledApplicationMarker\n"
+        "from basic_structure.bar.settings import BarFirstSettings\n"
+        "class FooSettings(EnabledApplicationMarker):\n"
+        "    pass\n"
+    )
+    pytester.syspathinsert(pytester.path)
+
+    manifest = {
+        "name": "Sample",
+        "collection": ["foo", "bar"],
+        "repository": "basic_structure",
+    }
+    index = ClassIndex.build(Composer(manifest), submodules=["settings"])
+
+    assert index.modules["basic_structure.foo.settings"]["classes"] == [
+        "FooSettings",
+    ]
+    assert index.modules["basic_structure.foo.settings"]["namespace"] is False
+    assert index.modules["basic_structure.bar.settings"]["namespace"] is True
+
+    composer = Composer(manifest, class_index=index)
+    assert composer.get_indexed_entry("basic_structure.foo.settings") is None
+    assert composer.get_indexed_entry("basic_structure.bar.settings") is not None
+
+    composer = Composer(manifest, class_index=index, class_registry=True)
+    assert composer.get_indexed_entry("basic_structure.foo.settings") is not None
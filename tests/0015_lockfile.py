@@ -0,0 +1,198 @@
+import logging
+
+import pytest
+
+from project_composer.compose import Composer, clear_class_cache
+from project_composer.contrib.django.processors import DjangoSettingsProcessor
+from project_composer.exceptions import ComposerLockError
+from project_composer.lockfile import CompositionLock
+from project_composer.processors import ClassProcessor
+
+
+COLLECTION = ["cms", "forms", "editor", "filer", "blog"]
+
+
+def get_composer(collection=None, lockfile=None):
+    return Composer(
+        {
+            "name": "Advanced",
+            "collection": collection or COLLECTION,
+            "repository": "advanced_structure",
+        },
+        processors=[ClassProcessor, DjangoSettingsProcessor],
+        lockfile=lockfile,
+    )
+
+
+def test_lock_build(pytester, advanced_structure):
+    """
+    Lockfile should record the resolved applications and the classes found by each
+    class processor.
+    """
+    advanced_structure(pytester.path)
+    pytester.syspathinsert(pytester.path)
+
+    lock = CompositionLock.build(get_composer())
+
+    assert lock.manifest == {
+        "repository": "advanced_structure",
+        "collection": COLLECTION,
+        "default_store_app": None,
+        "no_ordering": False,
+    }
+    assert [item["name"] for item in lock.apps] == [
+        "forms", "editor", "filer", "blog", "cms",
+    ]
+    assert lock.apps[-1]["dependencies"] == ["editor", "filer"]
+    assert lock.apps[-1]["push_end"] is True
+    assert lock.apps[-1]["filepath"] == "cms/__init__.py"
+    assert len(lock.apps[-1]["checksum"]) == 64
+
+    assert lock.processors["ClassProcessor"] == [
+        "advanced_structure.forms",
+        "advanced_structure.editor",
+        "advanced_structure.filer",
+        "advanced_structure.blog",
+        "advanced_structure.cms",
+    ]
+    assert lock.modules["advanced_structure.cms.settings"]["filepath"] == (
+        "cms/settings.py"
+    )
+    assert lock.modules["advanced_structure.cms.settings"]["classes"] == [
+        "advanced_structure.cms.settings:CmsSettings",
+    ]
+    assert lock.modules["advanced_structure.cms"]["classes"] == []
+
+    # Lockfile content is deterministic
+    first = lock.dump(pytester.path / "first.json").read_text()
+    second = CompositionLock.load(pytester.path / "first.json").dump(
+        pytester.path / "second.json"
+    ).read_text()
+    assert first == second
+    assert lock.diff(CompositionLock.build(get_composer())) == []
+
+
+def test_lock_runtime(caplog, pytester, advanced_structure):
+    """
+    Composer with a lockfile should not scan applications and should get classes
+    from lockfile.
+    """
+    advanced_structure(pytester.path)
+    pytester.syspathinsert(pytester.path)
+
+    lock = CompositionLock.build(get_composer())
+    expected = get_composer().processors["DjangoSettingsProcessor"]
+
+    clear_class_cache()
+    caplog.set_level(logging.DEBUG)
+
+    composer = get_composer(lockfile=lock)
+    composer.resolve_collection(lazy=False)
+
+    assert [item.name for item in composer.apps] == [
+        "forms", "editor", "filer", "blog", "cms",
+    ]
+    assert composer.apps[-1].push_end is True
+    assert [item.name for item in composer.apps[-1].dependencies] == [
+        "editor", "filer",
+    ]
+
+    classes = composer.processors["DjangoSettingsProcessor"].export()
+    assert [item.__name__ for item in classes] == [
+        "FormsSettings", "EditorSettings", "FilerSettings", "BlogSettings",
+        "CmsSettings",
+    ]
+
+    assert "Composer found application at: advanced_structure.cms" not in [
+        log[2] for log in caplog.record_tuples
+    ]
+    assert (
+        "project-composer",
+        logging.DEBUG,
+        "Composer found locked Class at: advanced_structure.cms.settings.CmsSettings",
+    ) in caplog.record_tuples
+
+    # Lazy mode keeps the collection order
+    composer = get_composer(lockfile=lock)
+    composer.resolve_collection(lazy=True)
+    assert [item.name for item in composer.apps] == COLLECTION
+
+    # Original discovery is the same
+    expected.composer.resolve_collection(lazy=False)
+    assert expected.export() == classes
+
+
+def test_lock_runtime_stale(caplog, pytester, advanced_structure):
+    """
+    A locked class which does not exist anymore should make the module to be
+    inspected and a lockfile for another manifest should raise an error.
+    """
+    advanced_structure(pytester.path)
+    pytester.syspathinsert(pytester.path)
+
+    lock = CompositionLock.build(get_composer())
+    lock.modules["advanced_structure.cms.settings"]["classes"] = [
+        "advanced_structure.cms.settings:NopeSettings",
+    ]
+
+    clear_class_cache()
+    caplog.set_level(logging.DEBUG)
+
+    composer = get_composer(lockfile=lock)
+    composer.resolve_collection(lazy=False)
+    classes = composer.processors["DjangoSettingsProcessor"].export()
+
+    assert classes[-1].__name__ == "CmsSettings"
+    assert (
+        "project-composer",
+        logging.DEBUG,
+        (
+            "Composer has a stale lockfile entry for module: "
+            "advanced_structure.cms.settings"
+        ),
+    ) in caplog.record_tuples
+
+    with pytest.raises(ComposerLockError) as excinfo:
+        get_composer(collection=["forms"], lockfile=lock).resolve_collection()
+
+    assert str(excinfo.value) == (
+        "Lockfile has not been built for this manifest, it differs on: collection"
+    )
+
+
+def test_lock_diff(pytester, advanced_structure):
+    """
+    Lockfile comparison should report every drift.
+    """
+    advanced_structure(pytester.path)
+    pytester.syspathinsert(pytester.path)
+
+    lock = CompositionLock.build(get_composer())
+
+    settings_path = pytester.path / "advanced_structure" / "cms" / "settings.py"
+    settings_path.write_text(settings_path.read_text() + "\n# Changed\n")
+
+    current = CompositionLock.build(get_composer())
+    current.apps = list(reversed(current.apps))
+    del current.modules["advanced_structure.forms.settings"]
+
+    assert lock.diff(current) == [
+        (
+            "Application order has changed: forms, editor, filer, blog, cms -> "
+            "cms, blog, filer, editor, forms"
+        ),
+        "Module 'advanced_structure.cms.settings' checksum has changed.",
+        "Module 'advanced_structure.forms.settings' is not found anymore.",
+    ]
+
+
+def test_lock_load_invalid(tmp_path):
+    """
+    Loading an invalid lockfile should raise an error.
+    """
+    with pytest.raises(ComposerLockError):
+        CompositionLock.load(tmp_path / "nope.json")
+
+    (tmp_path / "lock.json").write_text('{"version": 42}')
+    with pytest.raises(ComposerLockError):
+        CompositionLock.load(tmp_path / "lock.json")
@@ -1,6 +1,6 @@
 import logging
 
-from project_composer.compose import Composer
+from project_composer.compose import Composer, clear_class_cache
 from project_composer.processors import ClassProcessor
 
 
@@ -56,3 +56,69 @@ def test_processor_class(caplog, pytester, basic_structure):
         "Composer found enabled Class at: basic_structure.bar.BarPlopInit",
         "Composer found enabled Class at: basic_structure.bar.BarPlapInit"
     ]
+
+
+def test_processor_class_cache(caplog, pytester, basic_structure):
+    """
+    Modules should be inspected once, repeated exports give the same classes from
+    cache.
+    """
+    basic_structure(pytester.path)
+
+    pytester.syspathinsert(pytester.path)
+
+    composer = Composer(
+        {
+            "name": "Sample",
+            "collection": ["foo", "bar"],
+            "repository": "basic_structure",
+        },
+        processors=[ClassProcessor],
+    )
+    composer.resolve_collection(lazy=False)
+
+    first = composer.call_processor("ClassProcessor", "export")
+
+    caplog.set_level(logging.DEBUG)
+    second = composer.call_processor("ClassProcessor", "export")
+
+    assert first == second
+    assert first is not second
+    assert [
+        log[2]
+        for log in caplog.record_tuples
+        if "found enabled Class" in log[2]
+    ] == []
+
+    # Cache is cleared
+    clear_class_cache()
+    composer.call_processor("ClassProcessor", "export")
+
+    assert len([
+        log[2]
+        for log in caplog.record_tuples
+        if "found enabled Class" in log[2]
+    ]) == 4
+
+
+def test_processor_class_duplicate_names():
+    """
+    Export should retain the first class for a name from previous modules and keep
+    the classes from a same module.
+    """
+    def build(name):
+        return type(name, (), {})
+
+    class DummyComposer:
+        def __init__(self, results):
+            self.results = results
+
+        def map_apps(self, func, *args, **kwargs):
+            return self.results
+
+    first = [build("Foo"), build("Bar")]
+    second = [build("Bar"), build("Ping"), build("Ping")]
+
+    processor = ClassProcessor(DummyComposer([first, second]))
+
+    assert processor.export() == first + second[1:]
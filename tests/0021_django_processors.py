@@ -3,6 +3,7 @@ import logging
 import pytest
 
 from project_composer.compose import Composer
+from project_composer.contrib.django.helpers import project_profiles
 from project_composer.contrib.django.processors import (
     DjangoSettingsProcessor, DjangoUrlsProcessor
 )
@@ -159,3 +160,41 @@ def test_processor_django_advanced(caplog, pytester, advanced_structure, lazy,
     json_debug(settings_names)
 
     assert settings_names == expected
+
+
+def test_project_profiles(pytester, basic_structure):
+    """
+    A composed settings class should be built for each profile.
+    """
+    basic_structure(pytester.path)
+
+    pytester.syspathinsert(pytester.path)
+
+    composer = Composer(
+        {
+            "name": "Sample",
+            "collection": [],
+            "repository": "basic_structure",
+        },
+        processors=[DjangoSettingsProcessor, DjangoUrlsProcessor],
+    )
+    profiles = project_profiles(composer.compose_profiles({
+        "web": ["ping", "foo", "bar"],
+        "worker": ["bar"],
+    }, lazy=False))
+
+    assert list(profiles.keys()) == ["web", "worker"]
+
+    assert [item.__name__ for item in profiles["web"]["settings"].__mro__] == [
+        "ComposedProjectSettings",
+        "BarSecondSettings",
+        "BarFirstSettings",
+        "FooSettings",
+        "PingSettings",
+        "EnabledApplicationMarker",
+        "object",
+    ]
+    assert profiles["web"]["urlpatterns"] is None
+
+    assert profiles["worker"]["settings"].BAR_FIRST_SETTING == "Bar first"
+    assert not hasattr(profiles["worker"]["settings"], "PING_SETTING")
@@ -0,0 +1,148 @@
+import pytest
+
+from project_composer.compose import Composer
+from project_composer.processors import ImpactProcessor
+
+
+ADVANCED_COLLECTION = [
+    "cms",
+    "django",
+    "forms",
+    "filer",
+    "editor",
+    "blog",
+    "rest",
+    "cms_blog",
+]
+
+
+@pytest.mark.parametrize("changes, expected", [
+    # Nothing changed
+    (
+        [],
+        [],
+    ),
+    # Change from a file outside of repository
+    (
+        ["README.rst"],
+        [],
+    ),
+    # Application without any dependent
+    (
+        ["advanced_structure/rest/settings.py"],
+        ["rest"],
+    ),
+    # Dependents are followed transitively and returned in resolved order
+    (
+        ["advanced_structure/editor/requirements.txt"],
+        ["editor", "blog", "cms", "cms_blog"],
+    ),
+    # Multiple changes from distinct applications are merged
+    (
+        [
+            "advanced_structure/rest/__init__.py",
+            "advanced_structure/blog/settings.py",
+            "advanced_structure/blog/requirements.txt",
+        ],
+        ["blog", "rest", "cms_blog"],
+    ),
+    # Application deeply required
+    (
+        ["advanced_structure/forms/templates/forms/index.html"],
+        ["forms", "editor", "filer", "blog", "rest", "cms", "cms_blog"],
+    ),
+    # A file from repository root impacts everything
+    (
+        ["advanced_structure/__init__.py"],
+        [
+            "forms", "editor", "filer", "django", "blog", "rest", "cms", "cms_blog"
+        ],
+    ),
+])
+def test_impact_export(monkeypatch, tmp_path, pytester, advanced_structure, changes,
+                       expected):
+    """
+    Processor should find applications owning changed files and all of their
+    dependents in resolved order.
+    """
+    advanced_structure(pytester.path)
+
+    pytester.syspathinsert(pytester.path)
+    # Relative changed paths are resolved from the directory which contains the
+    # repository, not from the current directory
+    monkeypatch.chdir(tmp_path)
+
+    composer = Composer(
+        {
+            "name": "Sample",
+            "collection": ADVANCED_COLLECTION,
+            "repository": "advanced_structure",
+        },
+        processors=[ImpactProcessor],
+    )
+    composer.resolve_collection(lazy=False)
+
+    impacted = composer.call_processor("ImpactProcessor", "export", paths=changes)
+
+    assert [item.name for item in impacted] == expected
+
+
+def test_impact_export_not_enabled(pytester, basic_structure):
+    """
+    Changes from an application directory which is not enabled should be ignored.
+    """
+    structure = basic_structure(pytester.path)
+
+    pytester.syspathinsert(pytester.path)
+
+    composer = Composer(
+        {
+            "name": "Sample",
+            "collection": ["foo", "bar"],
+            "repository": "basic_structure",
+        },
+        processors=[ImpactProcessor],
+    )
+    composer.resolve_collection(lazy=False)
+
+    impacted = composer.call_processor("ImpactProcessor", "export", paths=[
+        structure / "ping" / "settings.py",
+        structure / "bar" / "urls.py",
+    ])
+
+    assert [item.name for item in impacted] == ["bar"]
+
+
+def test_impact_export_module_application(pytester):
+    """
+    A change to the module file of an application which is not a package should
+    only impact this application and its dependents.
+    """
+    repository = pytester.path / "module_structure"
+    (repository / "pkg").mkdir(parents=True)
+    (repository / "__init__.py").write_text("")
+    (repository / "pkg" / "__init__.py").write_text("")
+    (repository / "solo.py").write_text("")
+    (repository / "other.py").write_text("DEPENDENCIES = ['solo']\n")
+
+    pytester.syspathinsert(pytester.path)
+
+    composer = Composer(
+        {
+            "name": "Sample",
+            "collection": ["pkg", "solo", "other"],
+            "repository": "module_structure",
+        },
+        processors=[ImpactProcessor],
+    )
+    composer.resolve_collection(lazy=False)
+
+    impacted = composer.call_processor("ImpactProcessor", "export", paths=[
+        "module_structure/solo.py",
+    ])
+    assert [item.name for item in impacted] == ["solo", "other"]
+
+    impacted = composer.call_processor("ImpactProcessor", "export", paths=[
+        repository / "__init__.py",
+    ])
+    assert sorted([item.name for item in impacted]) == ["other", "pkg", "solo"]
@@ -0,0 +1,141 @@
+import pytest
+
+django = pytest.importorskip("django")
+
+from django.conf import settings  # noqa: E402
+from django.urls import include, path, re_path, Resolver404  # noqa: E402
+from django.urls.resolvers import RegexPattern, URLResolver  # noqa: E402
+
+from project_composer.contrib.django.routing import (  # noqa: E402
+    get_static_prefix, group_urlpatterns
+)
+
+
+if not settings.configured:
+    settings.configure()
+
+
+def view(request, **kwargs):
+    return None
+
+
+def get_layout(urlpatterns):
+    """
+    Return a readable structure of url patterns, routes with their included patterns.
+    """
+    layout = []
+
+    for entry in urlpatterns:
+        if isinstance(entry, URLResolver) and isinstance(entry.urlconf_name, list):
+            layout.append((str(entry.pattern), get_layout(entry.urlconf_name)))
+        else:
+            layout.append(str(entry.pattern))
+
+    return layout
+
+
+def resolve(urlpatterns, value):
+    """
+    Resolve a path to the matched url name and its arguments.
+    """
+    try:
+        match = URLResolver(RegexPattern(r"^/"), urlpatterns).resolve(value)
+    except Resolver404:
+        return None
+
+    return match.url_name, match.kwargs
+
+
+@pytest.mark.parametrize("route, expected", [
+    ("", None),
+    ("blog/", "blog/"),
+    ("blog/<int:pk>/", "blog/"),
+    ("blog", None),
+    ("<slug:slug>/", None),
+    ("blog-<int:pk>/", None),
+])
+def test_get_static_prefix(route, expected):
+    """
+    Prefix should only be a static first path segment.
+    """
+    assert get_static_prefix(path(route, view)) == expected
+
+
+def test_get_static_prefix_regex():
+    """
+    Regular expression patterns do not have any prefix.
+    """
+    assert get_static_prefix(re_path(r"^blog/$", view)) is None
+
+
+def test_group_urlpatterns():
+    """
+    Consecutive patterns with a static prefix should be grouped recursively and the
+    other ones should stay at their position.
+    """
+    urlpatterns = [
+        path("blog/", view, name="blog-index"),
+        path("news/<int:pk>/", view, name="news-detail"),
+        path("blog/<int:pk>/", view, name="blog-detail"),
+        path("blog/archive/<int:year>/", view, name="blog-year"),
+        path("blog/archive/<int:year>/<int:month>/", view, name="blog-month"),
+        path("<slug:slug>/", view, name="page"),
+        path("blog/feed/", view, name="blog-feed"),
+        path("contact/", view, name="contact"),
+        path("contact/done/", view, name="contact-done"),
+    ]
+
+    grouped = group_urlpatterns(urlpatterns)
+
+    assert get_layout(grouped) == [
+        ("blog/", [
+            "",
+            "<int:pk>/",
+            ("archive/", [
+                "<int:year>/",
+                "<int:year>/<int:month>/",
+            ]),
+        ]),
+        "news/<int:pk>/",
+        "<slug:slug>/",
+        "blog/feed/",
+        ("contact/", ["", "done/"]),
+    ]
+
+    for value, expected in [
+        ("/blog/", ("blog-index", {})),
+        ("/blog/42/", ("blog-detail", {"pk": 42})),
+        ("/blog/archive/2024/5/", ("blog-month", {"year": 2024, "month": 5})),
+        ("/news/1/", ("news-detail", {"pk": 1})),
+        # Precedence is kept, the slug pattern is before the feed one
+        ("/blog/feed/", ("blog-feed", {})),
+        ("/feed/", ("page", {"slug": "feed"})),
+        ("/contact/done/", ("contact-done", {})),
+        ("/contact/nope/", None),
+    ]:
+        assert resolve(grouped, value) == expected
+        assert resolve(urlpatterns, value) == expected
+
+
+def test_group_urlpatterns_includes():
+    """
+    Included patterns should keep their namespace and single patterns with a prefix
+    are not grouped.
+    """
+    urlpatterns = [
+        path("api/", include(([path("ping/", view, name="ping")], "api"))),
+        path("api/pong/", view, name="pong", kwargs={"foo": "bar"}),
+        path("about/", view, name="about"),
+    ]
+
+    grouped = group_urlpatterns(urlpatterns)
+
+    assert len(grouped) == 2
+    assert str(grouped[0].pattern) == "api/"
+    assert str(grouped[1].pattern) == "about/"
+
+    resolver = URLResolver(RegexPattern(r"^/"), grouped)
+    match = resolver.resolve("/api/ping/")
+    assert match.view_name == "api:ping"
+    assert resolver.resolve("/api/pong/").kwargs == {"foo": "bar"}
+    assert resolver.reverse("pong") == "api/pong/"
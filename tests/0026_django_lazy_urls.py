@@ -0,0 +1,246 @@
+import sys
+
+import pytest
+
+django = pytest.importorskip("django")
+
+from django.conf import settings  # noqa: E402
+from django.urls import Resolver404  # noqa: E402
+from django.urls.resolvers import RegexPattern, URLResolver  # noqa: E402
+
+from project_composer.compose import Composer  # noqa: E402
+from project_composer.contrib.django.collector import (  # noqa: E402
+    ApplicationUrlCollector
+)
+from project_composer.contrib.django.helpers import project_urls  # noqa: E402
+from project_composer.contrib.django.processors import (  # noqa: E402
+    DjangoUrlsProcessor
+)
+from project_composer.exceptions import ComposerError  # noqa: E402
+
+
+if not settings.configured:
+    settings.configure()
+
+
+URLS_TEMPLATE = """from django.urls import path
+
+from project_composer.marker import EnabledApplicationMarker
+
+
+def view(request, **kwargs):
+    return None
+
+
+class {klass}(EnabledApplicationMarker):
+    def load_urlpatterns(self, urlpatterns):
+        urlpatterns = super().load_urlpatterns(urlpatterns)
+        return urlpatterns + [{patterns}]
+"""
+
+
+def get_repository_files(apps):
+    """
+    Get the files of a repository with an urls module for each application.
+
+    Arguments:
+        apps (dict): Applications with their base module source and their url
+            patterns source.
+
+    Returns:
+        dict: File contents indexed on their relative path, for the
+        ``file_structure`` fixture.
+    """
+    files = {"lazy_urls_repository/__init__.py": ""}
+
+    for name, (init, patterns) in apps.items():
+        basename = "lazy_urls_repository/{}/".format(name)
+        files[basename + "__init__.py"] = init
+        files[basename + "urls.py"] = URLS_TEMPLATE.format(
+            klass=name.capitalize() + "Urls",
+            patterns=patterns,
+        )
+
+    return files
+
+
+def get_composer(collection):
+    composer = Composer(
+        {
+            "name": "Sample",
+            "collection": collection,
+            "repository": "lazy_urls_repository",
+        },
+        processors=[DjangoUrlsProcessor],
+    )
+    composer.resolve_collection(lazy=False)
+
+    return composer
+
+
+def test_project_urls_lazy(pytester, file_structure):
+    """
+    Applications with an url prefix should get a lazy include and their urls module
+    should only be imported once a path matches the prefix.
+    """
+    file_structure(pytester.path, get_repository_files({
+        "blog": (
+            "URL_PREFIX = 'blog/'\n",
+            "path('blog/', view, name='blog-index'), "
+            "path('blog/<int:pk>/', view, name='blog-detail')",
+        ),
+        "shop": (
+            "URL_PREFIX = 'shop/'\n",
+            "path('shop/', view, name='shop-index')",
+        ),
+        "pages": (
+            "",
+            "path('<slug:slug>/', view, name='page')",
+        ),
+    }))
+    pytester.syspathinsert(pytester.path)
+
+    composer = get_composer(["blog", "shop", "pages"])
+
+    assert [
+        (node.name, prefix)
+        for node, prefix in composer.processors["DjangoUrlsProcessor"].get_lazy_apps()
+    ] == [("blog", "blog/"), ("shop", "shop/")]
+
+    urlpatterns = project_urls(
+        composer,
+        settings,
+        base_classes=[ApplicationUrlCollector],
+        lazy=True,
+    )
+
+    # Lazy includes keep the position of their application url patterns
+    assert [str(item.pattern) for item in urlpatterns] == [
+        "<slug:slug>/", "shop/", "blog/",
+    ]
+    assert "lazy_urls_repository.pages.urls" in sys.modules
+    assert "lazy_urls_repository.blog.urls" not in sys.modules
+    assert "lazy_urls_repository.shop.urls" not in sys.modules
+
+    resolver = URLResolver(RegexPattern(r"^/"), urlpatterns)
+
+    match = resolver.resolve("/blog/42/")
+    assert (match.url_name, match.kwargs) == ("blog-detail", {"pk": 42})
+    assert "lazy_urls_repository.blog.urls" in sys.modules
+    assert "lazy_urls_repository.shop.urls" not in sys.modules
+
+    assert resolver.resolve("/about/").url_name == "page"
+    with pytest.raises(Resolver404):
+        resolver.resolve("/blog/nope/")
+    assert "lazy_urls_repository.shop.urls" not in sys.modules
+
+    # Reversing needs every url patterns
+    assert resolver.reverse("shop-index") == "shop/"
+    assert "lazy_urls_repository.shop.urls" in sys.modules
+
+
+@pytest.mark.parametrize("flat", [False, True])
+def test_project_urls_lazy_resolution(pytester, file_structure, flat):
+    """
+    Lazy url patterns should resolve paths like the eager ones, even when a pattern
+    from an application without prefix could match a lazy application path.
+    """
+    file_structure(pytester.path, get_repository_files({
+        "pages": (
+            "",
+            "path('<slug:slug>/', view, name='page')",
+        ),
+        "blog": (
+            "URL_PREFIX = 'blog/'\n",
+            "path('blog/', view, name='blog-index')",
+        ),
+        "shop": (
+            "URL_PREFIX = 'shop/'\n",
+            "path('shop/<int:pk>/', view, name='shop-detail')",
+        ),
+        "catalog": (
+            "",
+            "path('<slug:slug>/<int:pk>/', view, name='catalog-detail')",
+        ),
+    }))
+    pytester.syspathinsert(pytester.path)
+
+    resolvers = {}
+    for lazy in [False, True]:
+        urlpatterns = project_urls(
+            get_composer(["pages", "blog", "shop", "catalog"]),
+            settings,
+            base_classes=[ApplicationUrlCollector],
+            lazy=lazy,
+            flat=flat,
+        )
+        resolvers[lazy] = URLResolver(RegexPattern(r"^/"), urlpatterns)
+
+    for path in ["/blog/", "/about/", "/shop/42/", "/news/42/"]:
+        assert resolvers[True].resolve(path).url_name == (
+            resolvers[False].resolve(path).url_name
+        )
+
+    # Catalog patterns are collected before the shop ones
+    assert resolvers[True].resolve("/shop/42/").url_name == "catalog-detail"
+
+
+def test_project_urls_lazy_invalid_prefix(pytester, file_structure):
+    """
+    Url patterns which do not start with their application prefix should raise an
+    error once they are loaded.
+    """
+    file_structure(pytester.path, get_repository_files({
+        "blog": (
+            "URL_PREFIX = 'blog/'\n",
+            "path('news/', view, name='news')",
+        ),
+    }))
+    pytester.syspathinsert(pytester.path)
+
+    urlpatterns = project_urls(
+        get_composer(["blog"]),
+        settings,
+        base_classes=[ApplicationUrlCollector],
+        lazy=True,
+    )
+    resolver = URLResolver(RegexPattern(r"^/"), urlpatterns)
+
+    with pytest.raises(ComposerError):
+        resolver.resolve("/blog/")
+
+
+def test_project_urls_not_lazy(pytester, file_structure):
+    """
+    Without lazy mode, every application urls are collected as before.
+    """
+    file_structure(pytester.path, get_repository_files({
+        "blog": (
+            "URL_PREFIX = 'blog/'\n",
+            "path('blog/', view, name='blog-index')",
+        ),
+        "pages": (
+            "",
+            "path('<slug:slug>/', view, name='page')",
+        ),
+    }))
+    pytester.syspathinsert(pytester.path)
+
+    composer = get_composer(["blog", "pages"])
+    urlpatterns = project_urls(
+        composer,
+        settings,
+        base_classes=[ApplicationUrlCollector],
+    )
+
+    assert [str(item.pattern) for item in urlpatterns] == ["<slug:slug>/", "blog/"]
+
+    # Flat collector gives the same url patterns
+    urlpatterns = project_urls(
+        composer,
+        settings,
+        base_classes=[ApplicationUrlCollector],
+        flat=True,
+    )
+
+    assert [str(item.pattern) for item in urlpatterns] == ["<slug:slug>/", "blog/"]
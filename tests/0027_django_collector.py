@@ -0,0 +1,83 @@
+from project_composer.contrib.django.collector import (
+    ApplicationUrlCollector, FlatUrlCollector
+)
+
+
+class PingUrls:
+    def load_urlpatterns(self, urlpatterns):
+        urlpatterns = super().load_urlpatterns(urlpatterns)
+        return urlpatterns + ["ping/"]
+
+
+class PongUrls:
+    def load_urlpatterns(self, urlpatterns):
+        urlpatterns = super().load_urlpatterns(urlpatterns)
+        return urlpatterns + ["pong/", "pong/<int:pk>/"]
+
+
+class SettingsUrls:
+    def load_urlpatterns(self, urlpatterns):
+        urlpatterns = super().load_urlpatterns(urlpatterns)
+        return urlpatterns + [self.settings["prefix"]]
+
+
+class NoSuperUrls:
+    def load_urlpatterns(self, urlpatterns):
+        return ["nosuper/"]
+
+
+def test_flat_collector_same_output():
+    """
+    Flat collector should give the same url patterns than the super chain.
+    """
+    classes = [PingUrls, SettingsUrls, PongUrls]
+    settings = {"prefix": "settings/"}
+
+    composed = type("ComposedProjectUrls", tuple(
+        classes + [ApplicationUrlCollector]
+    ), {})
+    expected = composed(settings).collect()
+
+    collector = FlatUrlCollector(
+        classes,
+        settings=settings,
+        base_classes=[ApplicationUrlCollector],
+    )
+
+    assert expected == ["pong/", "pong/<int:pk>/", "settings/", "ping/"]
+    assert collector.collect() == expected
+    assert collector.collect(["admin/"]) == ["admin/"] + expected
+    assert collector.timings == []
+
+
+def test_flat_collector_missing_super():
+    """
+    A class which does not call super should not drop other url patterns.
+    """
+    classes = [PingUrls, NoSuperUrls, PongUrls]
+
+    composed = type("ComposedProjectUrls", tuple(
+        classes + [ApplicationUrlCollector]
+    ), {})
+    assert composed().collect() == ["nosuper/", "ping/"]
+
+    collector = FlatUrlCollector(classes, base_classes=[ApplicationUrlCollector])
+    assert collector.collect() == ["pong/", "pong/<int:pk>/", "nosuper/", "ping/"]
+
+
+def test_flat_collector_timing():
+    """
+    With timing enabled, each class call should be timed.
+    """
+    collector = FlatUrlCollector(
+        [PingUrls, PongUrls],
+        base_classes=[ApplicationUrlCollector],
+        timing=True,
+    )
+    collector.collect()
+
+    assert [(item["name"], item["count"]) for item in collector.timings] == [
+        ("{}.PongUrls".format(__name__), 2),
+        ("{}.PingUrls".format(__name__), 1),
+    ]
+    assert all([item["time"] >= 0 for item in collector.timings])
@@ -0,0 +1,115 @@
+import threading
+
+from project_composer.contrib.django.lazy_settings import (
+    LazySetting, get_lazy_settings, get_unaccessed_settings
+)
+
+
+def build_classes(calls):
+    """
+    Build application settings classes which record their lazy setting calls.
+    """
+    class PingSettings:
+        BASE_DIR = "/srv"
+
+        @LazySetting
+        def PING_PATH(settings):
+            calls.append("PING_PATH")
+            return settings.BASE_DIR + "/ping"
+
+        @LazySetting
+        def OVERRIDDEN(settings):
+            calls.append("OVERRIDDEN")
+            return "ping"
+
+    class PongSettings:
+        OVERRIDDEN = "pong"
+
+        @LazySetting
+        def PONG_UNUSED(settings):
+            calls.append("PONG_UNUSED")
+            return "pong"
+
+    return PingSettings, PongSettings
+
+
+def test_lazy_setting_cache():
+    """
+    Lazy setting should be computed on its first access and cached for each composed
+    class.
+    """
+    calls = []
+    PingSettings, PongSettings = build_classes(calls)
+
+    assert calls == []
+
+    Composed = type("ComposedProjectSettings", (PongSettings, PingSettings), {})
+    Other = type("OtherSettings", (PingSettings,), {"BASE_DIR": "/opt"})
+
+    assert Composed.PING_PATH == "/srv/ping"
+    assert Composed.PING_PATH == "/srv/ping"
+    assert Composed().PING_PATH == "/srv/ping"
+    assert Other.PING_PATH == "/opt/ping"
+    assert calls == ["PING_PATH", "PING_PATH"]
+
+    # Overridden lazy setting is never computed
+    assert Composed.OVERRIDDEN == "pong"
+    assert "OVERRIDDEN" not in calls
+
+    setting = PingSettings.__dict__["PING_PATH"]
+    assert setting.name == "PING_PATH"
+    assert setting.owner is PingSettings
+    assert setting.is_evaluated(Composed) is True
+    assert setting.is_evaluated(PingSettings) is False
+
+    setting.reset(Composed)
+    assert setting.is_evaluated(Composed) is False
+    assert setting.is_evaluated(Other) is True
+    setting.reset()
+    assert setting.is_evaluated(Other) is False
+
+
+def test_unaccessed_settings():
+    """
+    Lazy settings which have never been accessed should be reported.
+    """
+    calls = []
+    PingSettings, PongSettings = build_classes(calls)
+    Composed = type("ComposedProjectSettings", (PongSettings, PingSettings), {})
+
+    assert sorted(get_lazy_settings(Composed).keys()) == ["PING_PATH", "PONG_UNUSED"]
+    assert get_unaccessed_settings(Composed) == ["PING_PATH", "PONG_UNUSED"]
+
+    Composed.PING_PATH
+
+    assert get_unaccessed_settings(Composed) == ["PONG_UNUSED"]
+    assert get_unaccessed_settings(PingSettings) == ["OVERRIDDEN", "PING_PATH"]
+
+
+def test_lazy_setting_threads():
+    """
+    Lazy setting should be computed once when accessed from concurrent threads.
+    """
+    calls = []
+    barrier = threading.Barrier(8)
+
+    class Settings:
+        @LazySetting
+        def SLOW(settings):
+            calls.append("SLOW")
+            return object()
+
+    results = []
+
+    def access():
+        barrier.wait()
+        results.append(Settings.SLOW)
+
+    threads = [threading.Thread(target=access) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert calls == ["SLOW"]
+    assert len(set([id(item) for item in results])) == 1
@@ -0,0 +1,86 @@
+import os
+import sys
+
+import pytest
+
+from project_composer.compose import Composer
+from project_composer.contrib.django import preload as preload_module
+from project_composer.contrib.django.preload import (
+    get_preloaded, measure_preload, preload
+)
+from project_composer.contrib.django.processors import (
+    DjangoSettingsProcessor, DjangoUrlsProcessor
+)
+
+
+def get_composer():
+    return Composer(
+        {
+            "name": "Sample",
+            "collection": ["ping", "pong", "foo", "bar"],
+            "repository": "basic_structure",
+        },
+        processors=[DjangoSettingsProcessor, DjangoUrlsProcessor],
+    )
+
+
+def test_preload(monkeypatch, pytester, basic_structure):
+    """
+    Preload should resolve applications, import their modules and build the settings
+    class.
+    """
+    monkeypatch.setattr(preload_module, "PRELOADED", {})
+    basic_structure(pytester.path)
+    pytester.syspathinsert(pytester.path)
+
+    composer = get_composer()
+    preloaded = preload(composer, freeze=False)
+
+    assert get_preloaded("Sample") is preloaded
+    assert get_preloaded("Nope") is None
+
+    assert preloaded["composer"] is composer
+    assert [node.name for node in composer.apps] == ["ping", "pong", "foo", "bar"]
+    assert [item.__name__ for item in preloaded["settings"].__mro__[1:-2]] == [
+        "BarSecondSettings",
+        "BarFirstSettings",
+        "FooSettings",
+        "PingSettings",
+    ]
+    # Urls are not collected without Django settings
+    assert preloaded["urlpatterns"] is None
+
+    assert "basic_structure.foo.settings" in sys.modules
+    assert "basic_structure.pong.urls" in sys.modules
+
+    stats = preloaded["stats"]
+    assert stats["time"] > 0
+    assert stats["modules"] > 0
+    assert stats["frozen"] >= 0
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="Requires 'os.fork()'")
+def test_measure_preload(monkeypatch, pytester, basic_structure):
+    """
+    Measure should report workers measures for both modes without altering the
+    current process.
+    """
+    monkeypatch.setattr(preload_module, "PRELOADED", {})
+    basic_structure(pytester.path)
+    pytester.syspathinsert(pytester.path)
+
+    results = measure_preload(get_composer, workers=2)
+
+    assert len(results["cold"]["workers"]) == 2
+    assert len(results["preloaded"]["workers"]) == 2
+
+    for mode in ["cold", "preloaded"]:
+        for measures in results[mode]["workers"]:
+            assert measures["boot"] >= 0
+
+    assert sorted(results["savings"].keys()) == ["boot", "private_memory", "rss"]
+    # Preloaded workers do not compose
+    assert results["savings"]["boot"] > 0
+
+    assert get_preloaded("Sample") is None
+    assert "basic_structure.foo.settings" not in sys.modules
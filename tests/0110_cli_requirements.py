@@ -4,6 +4,7 @@
     settings and CLI arguments, these tests also make global coverage against CLI and
     its manifest usage.
 """
+import json
 import shutil
 import sys
 from pathlib import Path
@@ -254,3 +255,189 @@ def test_requirements_override(monkeypatch, pytester, caplog, tmp_path, settings
         ]
 
         assert caplog.record_tuples == []
+
+
+@freeze_time("2012-10-15 10:00:00")
+@pytest.mark.parametrize("backend", ["thread", "process"])
+def test_requirements_workers(pytester, caplog, tmp_path, settings, basic_structure,
+                              backend):
+    """
+    Using workers should not change the composed output.
+    """
+    manifest_source = settings.fixtures_path / "manifests" / "basic.json"
+
+    runner = CliRunner()
+    with runner.isolated_filesystem(temp_dir=tmp_path) as td:
+        test_cwd = Path(td)
+
+        basic_structure(test_cwd)
+        manifest_path = test_cwd / "basic.json"
+        shutil.copyfile(manifest_source, manifest_path)
+        pytester.syspathinsert(test_cwd)
+
+        dump_path = test_cwd / "output.txt"
+
+        result = runner.invoke(cli_frontend, [
+            "requirements",
+            "--manifest", "basic.json",
+            "--repository", "basic_structure",
+            "--workers", "3",
+            "--worker-backend", backend,
+            "--dump", dump_path,
+        ])
+
+        assert result.exit_code == 0
+
+        assert dump_path.read_text().splitlines() == [
+            "# This file is automatically overwritten by composer, DO NOT EDIT IT.",
+            "# Written on: 2012-10-15T10:00:00",
+            "",
+            "foo-requirements",
+            "bar-requirements",
+            "ping-requirements"
+        ]
+
+
+@freeze_time("2012-10-15 10:00:00")
+@pytest.mark.parametrize("resolver", ["iterative", "array", "cached"])
+def test_requirements_resolver(pytester, caplog, tmp_path, settings, basic_structure,
+                               resolver):
+    """
+    Resolver engine argument should not change the composed output.
+    """
+    manifest_source = settings.fixtures_path / "manifests" / "basic.json"
+
+    runner = CliRunner()
+    with runner.isolated_filesystem(temp_dir=tmp_path) as td:
+        test_cwd = Path(td)
+
+        basic_structure(test_cwd)
+        manifest_path = test_cwd / "basic.json"
+        shutil.copyfile(manifest_source, manifest_path)
+        pytester.syspathinsert(test_cwd)
+
+        dump_path = test_cwd / "output.txt"
+
+        result = runner.invoke(cli_frontend, [
+            "requirements",
+            "--manifest", "basic.json",
+            "--repository", "basic_structure",
+            "--resolver", resolver,
+            "--dump", dump_path,
+        ])
+
+        assert result.exit_code == 0
+
+        assert dump_path.read_text().splitlines() == [
+            "# This file is automatically overwritten by composer, DO NOT EDIT IT.",
+            "# Written on: 2012-10-15T10:00:00",
+            "",
+            "foo-requirements",
+            "bar-requirements",
+            "ping-requirements"
+        ]
+
+
+def test_requirements_lazy_import(pytester, caplog, tmp_path):
+    """
+    With lazy import, requirements export should not execute application code which
+    does not define any option.
+    """
+    runner = CliRunner()
+    with runner.isolated_filesystem(temp_dir=tmp_path) as td:
+        test_cwd = Path(td)
+
+        repository = test_cwd / "lazy_repository"
+        repository.mkdir()
+        (repository / "__init__.py").write_text("")
+        for name in ["foo", "bar"]:
+            (repository / name).mkdir()
+            (repository / name / "__init__.py").write_text(
+                "raise RuntimeError('Should not be executed')\n"
+            )
+            (repository / name / "requirements.txt").write_text(
+                "{}-requirements\n".format(name)
+            )
+
+        (test_cwd / "manifest.json").write_text(
+            '{"name": "Lazy", "collection": ["foo", "bar"], '
+            '"repository": "lazy_repository"}'
+        )
+        pytester.syspathinsert(test_cwd)
+
+        result = runner.invoke(cli_frontend, [
+            "requirements",
+            "--manifest", "manifest.json",
+            "--lazy-import",
+            "--introduction", "",
+        ])
+
+        assert result.exit_code == 0
+        assert result.stdout.splitlines() == [
+            "foo-requirements",
+            "bar-requirements",
+            "",
+        ]
+
+
+@pytest.mark.parametrize("profile_format, key", [
+    ("json", "records"),
+    ("trace", "traceEvents"),
+])
+def test_requirements_profile_imports(pytester, tmp_path, basic_structure,
+                                      profile_format, key):
+    """
+    Import profile should be written in the given format.
+    """
+    runner = CliRunner()
+    with runner.isolated_filesystem(temp_dir=tmp_path) as td:
+        test_cwd = Path(td)
+        basic_structure(test_cwd)
+
+        (test_cwd / "manifest.json").write_text(
+            '{"name": "Profiled", "collection": ["foo", "bar"], '
+            '"repository": "basic_structure"}'
+        )
+        pytester.syspathinsert(test_cwd)
+
+        result = runner.invoke(cli_frontend, [
+            "requirements",
+            "--manifest", "manifest.json",
+            "--introduction", "",
+            "--profile-imports", "profile.json",
+            "--profile-format", profile_format,
+        ])
+
+        assert result.exit_code == 0
+        assert key in json.loads((test_cwd / "profile.json").read_text())
+
+
+def test_requirements_scan_workers(pytester, tmp_path, basic_structure):
+    """
+    Requirements should be the same when applications are scanned from worker
+    processes.
+    """
+    runner = CliRunner()
+    with runner.isolated_filesystem(temp_dir=tmp_path) as td:
+        test_cwd = Path(td)
+        basic_structure(test_cwd)
+
+        (test_cwd / "manifest.json").write_text(
+            '{"name": "Scanned", "collection": ["foo", "bar"], '
+            '"repository": "basic_structure"}'
+        )
+        pytester.syspathinsert(test_cwd)
+
+        outputs = []
+        for options in [["--scan-workers", "2"], []]:
+            # Scan workers do not import applications in the current process
+            assert "basic_structure.foo" not in sys.modules
+
+            outputs.append(runner.invoke(cli_frontend, [
+                "requirements",
+                "--manifest", "manifest.json",
+                "--introduction", "",
+            ] + options).stdout)
+
+        assert outputs[0] == outputs[1]
+        assert "foo" in outputs[0]
@@ -0,0 +1,87 @@
+import json
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from project_composer.cli.entrypoint import cli_frontend
+# from project_composer.utils.tests import debug_invoke
+
+
+def test_impact_manifest_opt_fail():
+    """
+    Command require at least the manifest option and its default value should fail when
+    there is not expect manifest file in current working directory.
+    """
+    runner = CliRunner()
+
+    result = runner.invoke(cli_frontend, ["impact"])
+
+    assert "Error: Invalid value for '--manifest'" in result.output
+
+    assert result.exit_code == 2
+
+
+def test_impact_stdin(pytester, caplog, tmp_path, advanced_structure):
+    """
+    Changed paths should be read from standard input and impacted applications printed
+    out in resolved order.
+    """
+    runner = CliRunner()
+    with runner.isolated_filesystem(temp_dir=tmp_path) as td:
+        test_cwd = Path(td)
+
+        advanced_structure(test_cwd)
+        manifest_path = test_cwd / "manifest.json"
+        manifest_path.write_text(json.dumps({
+            "name": "Sample",
+            "collection": ["cms", "forms", "filer", "editor", "blog", "rest"],
+            "repository": "advanced_structure",
+        }))
+        pytester.syspathinsert(test_cwd)
+
+        result = runner.invoke(
+            cli_frontend,
+            ["impact", "--manifest", "manifest.json"],
+            input="\n".join([
+                "advanced_structure/filer/settings.py",
+                "",
+                "docs/index.rst",
+            ]),
+        )
+        # debug_invoke(result, caplog)
+
+        assert result.exit_code == 0
+        assert result.output.splitlines() == ["filer", "blog", "cms"]
+        assert caplog.record_tuples == []
+
+
+def test_impact_changes_file(pytester, caplog, tmp_path, advanced_structure):
+    """
+    Changed paths can be given from a file and a warning is emitted when there is not
+    any impacted application.
+    """
+    runner = CliRunner()
+    with runner.isolated_filesystem(temp_dir=tmp_path) as td:
+        test_cwd = Path(td)
+
+        advanced_structure(test_cwd)
+        manifest_path = test_cwd / "manifest.json"
+        manifest_path.write_text(json.dumps({
+            "name": "Sample",
+            "collection": ["forms", "rest"],
+            "repository": "advanced_structure",
+        }))
+        changes_path = test_cwd / "changes.txt"
+        changes_path.write_text("setup.cfg\n")
+        pytester.syspathinsert(test_cwd)
+
+        result = runner.invoke(cli_frontend, [
+            "impact",
+            "--manifest", "manifest.json",
+            "--changes", "changes.txt",
+        ])
+
+        assert result.exit_code == 0
+        assert [log[2] for log in caplog.record_tuples] == [
+            "There was not any impacted application",
+        ]
@@ -0,0 +1,84 @@
+import json
+
+from click.testing import CliRunner
+
+from project_composer.cli.entrypoint import cli_frontend
+
+
+def test_benchmark_dump_compare(tmp_path):
+    """
+    Command should write a baseline then compare results against it.
+    """
+    runner = CliRunner()
+    baseline_path = tmp_path / "baseline.json"
+
+    result = runner.invoke(cli_frontend, [
+        "benchmark",
+        "--generator", "fan",
+        "--size", "5",
+        "--repeat", "1",
+        "--dump", str(baseline_path),
+    ])
+
+    assert result.exit_code == 0
+    assert "fan:5" in result.output
+    assert json.loads(baseline_path.read_text())["cases"]["fan:5"]["status"] == "ok"
+
+    # Forge a baseline with impossible timings to get regressions
+    baseline = json.loads(baseline_path.read_text())
+    for measures in baseline["cases"]["fan:5"]["stages"].values():
+        measures["time"] = -1
+    baseline_path.write_text(json.dumps(baseline))
+
+    result = runner.invoke(cli_frontend, [
+        "benchmark",
+        "--generator", "fan",
+        "--size", "5",
+        "--repeat", "1",
+        "--compare", str(baseline_path),
+    ])
+
+    assert result.exit_code == 1
+    assert "Regression on fan:5: stage 'process'" in result.output
+
+
+def test_benchmark_engine(tmp_path):
+    """
+    Command should benchmark the given resolver engine.
+    """
+    runner = CliRunner()
+    baseline_path = tmp_path / "baseline.json"
+
+    result = runner.invoke(cli_frontend, [
+        "benchmark",
+        "--engine", "array",
+        "--generator", "chain",
+        "--size", "5",
+        "--repeat", "1",
+        "--dump", str(baseline_path),
+    ])
+
+    assert result.exit_code == 0
+
+    results = json.loads(baseline_path.read_text())
+    assert results["store"] == "ArrayAppStore"
+    assert results["cases"]["chain:5"]["status"] == "ok"
+
+
+def test_benchmark_importer_suite():
+    """
+    Command should run the importer suite.
+    """
+    runner = CliRunner()
+
+    result = runner.invoke(cli_frontend, [
+        "benchmark",
+        "--suite", "importer",
+        "--size", "2",
+        "--repeat", "1",
+    ])
+
+    assert result.exit_code == 0
+    assert "cached:2" in result.output
+    assert "uncached:2" in result.output
+    assert "native:2" in result.output
@@ -0,0 +1,77 @@
+import json
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from project_composer.cli.entrypoint import cli_frontend
+# from project_composer.utils.tests import debug_invoke
+
+
+def test_index_destination_opt_fail(tmp_path):
+    """
+    Command requires the destination option.
+    """
+    runner = CliRunner()
+    with runner.isolated_filesystem(temp_dir=tmp_path) as td:
+        test_cwd = Path(td)
+        (test_cwd / "manifest.json").write_text(json.dumps({
+            "name": "Sample",
+            "collection": [],
+            "repository": "nope",
+        }))
+
+        result = runner.invoke(
+            cli_frontend,
+            ["index", "--manifest", "manifest.json"],
+        )
+
+        assert "Error: Missing option '--destination'" in result.output
+        assert result.exit_code == 2
+
+
+def test_index(pytester, caplog, tmp_path, basic_structure):
+    """
+    Command should write the class index for enabled applications.
+    """
+    runner = CliRunner()
+    with runner.isolated_filesystem(temp_dir=tmp_path) as td:
+        test_cwd = Path(td)
+
+        basic_structure(test_cwd)
+        manifest_path = test_cwd / "manifest.json"
+        manifest_path.write_text(json.dumps({
+            "name": "Sample",
+            "collection": ["foo", "bar"],
+            "repository": "basic_structure",
+            # A missing index file from manifest is ignored
+            "class_index": "index.json",
+        }))
+        pytester.syspathinsert(test_cwd)
+
+        result = runner.invoke(cli_frontend, [
+            "index",
+            "--manifest", "manifest.json",
+            "--submodule", "__init__",
+            "--destination", "index.json",
+        ])
+        # debug_invoke(result, caplog)
+
+        assert result.exit_code == 0
+        assert caplog.record_tuples == [
+            (
+                "project-composer",
+                20,
+                "Class index written at: index.json"
+            ),
+        ]
+
+        content = json.loads((test_cwd / "index.json").read_text())
+        assert content["version"] == 1
+        assert content["repository"] == "basic_structure"
+        assert {
+            path: entry["classes"]
+            for path, entry in content["modules"].items()
+        } == {
+            "basic_structure.foo": ["FooPlopInit", "FooPlapInit"],
+            "basic_structure.bar": ["BarPlopInit", "BarPlapInit"],
+        }
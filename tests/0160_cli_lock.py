@@ -0,0 +1,128 @@
+import json
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from project_composer.cli.entrypoint import cli_frontend
+# from project_composer.utils.tests import debug_invoke
+
+
+def test_lock_lockfile_opt_fail(tmp_path):
+    """
+    Command requires the lockfile option.
+    """
+    runner = CliRunner()
+    with runner.isolated_filesystem(temp_dir=tmp_path) as td:
+        test_cwd = Path(td)
+        (test_cwd / "manifest.json").write_text(json.dumps({
+            "name": "Sample",
+            "collection": [],
+            "repository": "nope",
+        }))
+
+        result = runner.invoke(
+            cli_frontend,
+            ["lock", "--manifest", "manifest.json"],
+        )
+
+        assert "Error: Missing option '--lockfile'" in result.output
+        assert result.exit_code == 2
+
+
+def test_lock_and_verify(pytester, caplog, tmp_path, basic_structure):
+    """
+    Command should write the lockfile then verify it until a module file changes.
+    """
+    runner = CliRunner()
+    with runner.isolated_filesystem(temp_dir=tmp_path) as td:
+        test_cwd = Path(td)
+
+        basic_structure(test_cwd)
+        manifest_path = test_cwd / "manifest.json"
+        manifest_path.write_text(json.dumps({
+            "name": "Sample",
+            "collection": ["foo", "bar"],
+            "repository": "basic_structure",
+            # A missing lockfile from manifest is ignored
+            "lockfile": "lock.json",
+        }))
+        pytester.syspathinsert(test_cwd)
+
+        arguments = [
+            "lock",
+            "--manifest", "manifest.json",
+            "--processor",
+            "project_composer.contrib.django.processors.DjangoSettingsProcessor",
+            "--lockfile", "lock.json",
+        ]
+
+        result = runner.invoke(cli_frontend, arguments)
+        # debug_invoke(result, caplog)
+
+        assert result.exit_code == 0
+        assert caplog.record_tuples == [
+            ("project-composer", 20, "Lockfile written at: lock.json"),
+        ]
+
+        content = json.loads((test_cwd / "lock.json").read_text())
+        assert content["version"] == 1
+        assert [item["name"] for item in content["apps"]] == ["foo", "bar"]
+        assert content["processors"] == {
+            "DjangoSettingsProcessor": [
+                "basic_structure.foo.settings",
+                "basic_structure.bar.settings",
+            ],
+        }
+
+        caplog.clear()
+        result = runner.invoke(cli_frontend, arguments + ["--verify"])
+
+        assert result.exit_code == 0
+        assert caplog.record_tuples == [
+            ("project-composer", 20, "Lockfile is up to date: lock.json"),
+        ]
+
+        settings_path = test_cwd / "basic_structure" / "bar" / "settings.py"
+        settings_path.write_text(settings_path.read_text() + "\n# Changed\n")
+
+        caplog.clear()
+        result = runner.invoke(cli_frontend, arguments + ["--verify"])
+
+        assert result.exit_code == 1
+        assert caplog.record_tuples == [
+            (
+                "project-composer",
+                40,
+                "Module 'basic_structure.bar.settings' checksum has changed.",
+            ),
+            ("project-composer", 50, "Lockfile is outdated: lock.json"),
+        ]
+
+
+def test_lock_processor_fail(pytester, caplog, tmp_path, basic_structure):
+    """
+    Command should fail with a processor which can not be imported.
+    """
+    runner = CliRunner()
+    with runner.isolated_filesystem(temp_dir=tmp_path) as td:
+        test_cwd = Path(td)
+
+        basic_structure(test_cwd)
+        (test_cwd / "manifest.json").write_text(json.dumps({
+            "name": "Sample",
+            "collection": ["foo"],
+            "repository": "basic_structure",
+        }))
+        pytester.syspathinsert(test_cwd)
+
+        result = runner.invoke(cli_frontend, [
+            "lock",
+            "--manifest", "manifest.json",
+            "--processor", "nope.NopeProcessor",
+            "--lockfile", "lock.json",
+        ])
+
+        assert result.exit_code == 1
+        assert caplog.record_tuples == [
+            ("project-composer", 50, "Unable to import processor: nope.NopeProcessor"),
+        ]
@@ -3,12 +3,14 @@ Pytest fixtures
 """
 import json
 import shutil
+import sys
 
 from pathlib import Path
 
 import pytest
 
 import project_composer
+from project_composer.importer import invalidate_caches
 from project_composer.utils.encoding import ExtendedJsonEncoder
 
 
@@ -160,6 +162,61 @@ def advanced_structure(settings):
     return curry
 
 
+def write_structure(basepath, files):
+    """
+    Write a structure of files somewhere.
+
+    Expect argument ``basepath`` as a Path object to the directory where to write
+    files and argument ``files`` as a dictionnary of file contents indexed on their
+    relative path, a ``None`` content creates an empty directory. Parent directories
+    are created if needed.
+
+    Returns Path object to the base directory.
+    """
+    for name, content in files.items():
+        path = basepath / name
+
+        if content is None:
+            path.mkdir(parents=True, exist_ok=True)
+            continue
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+
+    return basepath
+
+
+@pytest.fixture(scope="function")
+def file_structure():
+    """
+    Shortcut fixture around "write_structure()".
+
+    Example:
+        With usage like this: ::
+
+            def test_foo(file_structure, tmp_path):
+                file_structure(tmp_path, {
+                    "repository/__init__.py": "",
+                    "repository/blog/__init__.py": "DEPENDENCIES = []\n",
+                    "repository/blog/templates": None,
+                })
+
+        Files and the empty ``templates`` directory are written into ``tmp_path``.
+    """
+    return write_structure
+
+
+@pytest.fixture(scope="function")
+def meta_path(monkeypatch):
+    """
+    Isolate ``sys.meta_path`` changes and start with a clean spec cache.
+    """
+    monkeypatch.setattr(sys, "meta_path", list(sys.meta_path))
+    invalidate_caches()
+    yield sys.meta_path
+    invalidate_caches()
+
+
 @pytest.fixture(scope="function")
 def json_debug():
     """